@@ -0,0 +1,19 @@
+from collections.abc import MutableSequence
+from typing import Any
+
+
+def check_inplace(sequence: Any, backend: str, action: str):
+    """
+    Raises `TypeError` if the sequence can't be changed in place (only lists, `array.array`s and other mutable sequences,
+    or writable memoryviews can) and `ValueError` if `backend="numpy"` is used together with `inplace=True`.
+    `action` is the verb used in the messages, e.g. "sort" or "shuffle".
+    """
+
+    if backend == "numpy":
+        raise ValueError(f"Cannot {action} in place with backend=\"numpy\".")
+    if isinstance(sequence, memoryview):
+        if sequence.readonly:
+            raise TypeError(f"Cannot {action} a read-only memoryview in place.")
+        return
+    if not isinstance(sequence, MutableSequence):
+        raise TypeError(f"Cannot {action} {type(sequence).__name__} in place, expected a list, array.array or writable memoryview.")
@@ -0,0 +1,302 @@
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, AsyncIterator
+import asyncio
+from utilities_python.data_structures.queue import Queue, QueueIsFullError
+from utilities_python.data_structures.stack import Stack, StackIsFullError
+
+
+class AsyncIsClosedError(Exception):
+    """Custom exception raised when push operation is performed on a closed async queue or stack."""
+    pass
+
+class _Async:
+    """
+    Base of the asyncio variants. Replaces `push`/`pop` of the wrapped structure (`_base`) with coroutines that
+    suspend while it's full/empty. Waiting coroutines wait on futures that `push`/`pop` of other coroutines resolve,
+    so nothing polls. Not thread-safe, all calls have to come from the same event loop.
+    """
+
+    _base: type
+    _full_error: type[Exception]
+
+    def _init_async(self):
+        self._push_waiters = deque()
+        self._pop_waiters = deque()
+        self._closed = False
+        self._batch_pushers = 0 # Coroutines waiting in `push_many`, they need more than one free place
+
+    def __aiter__(self) -> AsyncIterator:
+        return self._iterate()
+
+
+    async def push(self, item: Any, timeout: float | None = None):
+        """
+        Puts an item into the structure, suspending while `max_size` is set and it's full.
+
+        Raises the full error of the structure if there is still no place after `timeout` seconds (`None` waits forever)
+        and `AsyncIsClosedError` if the structure is closed.
+        """
+        if not await self._wait(self._push_waiters, lambda: self._closed or not self._base.is_full(self), timeout):
+            raise self._full_error(f"Cannot push to a full {self._base.__name__.lower()}.")
+        self.try_push(item)
+
+    async def push_many(self, iterable: Iterable, timeout: float | None = None):
+        """
+        Puts all items of the iterable into the structure, in order, suspending until there is place for all of them.
+        Either all items are pushed or none.
+
+        Raises the full error of the structure if there is still not enough place after `timeout` seconds
+        (`None` waits forever) or right away if there are more items than `max_size`,
+        and `AsyncIsClosedError` if the structure is closed.
+        """
+        items = list(iterable)
+        if self._max_size != None and len(items) > self._max_size:
+            raise self._full_error(f"Cannot push more items than the max_size of the {self._base.__name__.lower()}.")
+
+        self._batch_pushers += 1
+        try:
+            fits = await self._wait(
+                self._push_waiters,
+                lambda: self._closed or self._max_size == None or self._base.size(self) + len(items) <= self._max_size,
+                timeout
+            )
+        finally:
+            self._batch_pushers -= 1
+        if not fits:
+            raise self._full_error(f"Cannot push to a full {self._base.__name__.lower()}.")
+        if self._closed:
+            raise AsyncIsClosedError(f"Cannot push to a closed {self._base.__name__.lower()}.")
+        self._base.push_many(self, items)
+        for _ in items:
+            _wake_one(self._pop_waiters)
+
+    async def pop(self, timeout: float | None = None) -> Any | None:
+        """
+        Removes and returns the next item, suspending while the structure is empty.
+
+        If there is still no item after `timeout` seconds (`None` waits forever) or the structure is closed and empty
+        returns `None`/raises the empty error of the structure, depending on `raise_errors_on_empty_op`.
+        """
+        await self._wait(self._pop_waiters, lambda: self._closed or not self._base.is_empty(self), timeout)
+        if self._base.is_empty(self):
+            return self._base.pop(self)
+        return self.try_pop()
+
+    async def pop_many(self, n: int, timeout: float | None = None) -> list:
+        """
+        Removes and returns up to `n` items as a list, suspending only until the first one is there.
+
+        Returns an empty list if there is still no item after `timeout` seconds (`None` waits forever)
+        or the structure is closed and empty.
+        """
+        await self._wait(self._pop_waiters, lambda: self._closed or not self._base.is_empty(self), timeout)
+        items = self._base.pop_many(self, n)
+        self._wake_pushers(len(items))
+        return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the structure as a list without suspending."""
+        items = self._base.drain(self)
+        self._wake_pushers(len(items))
+        return items
+
+    def try_push(self, item: Any) -> bool:
+        """
+        Puts an item into the structure if there is place for it without suspending. Returns `True` if it was pushed.
+
+        Raises `AsyncIsClosedError` if the structure is closed.
+        """
+        if self._closed:
+            raise AsyncIsClosedError(f"Cannot push to a closed {self._base.__name__.lower()}.")
+        if self._base.is_full(self):
+            return False
+        self._base.push(self, item)
+        _wake_one(self._pop_waiters)
+        return True
+
+    def try_pop(self) -> Any | None:
+        """Removes and returns the next item without suspending. Returns `None` if the structure is empty."""
+        if self._base.is_empty(self):
+            return None
+        item = self._base.pop(self)
+        self._wake_pushers(1)
+        return item
+
+    def close(self):
+        """
+        Stops the structure from accepting new items and wakes up every waiting coroutine.
+        Items that are already in it can still be popped, `async for` stops after the last one.
+        """
+        self._closed = True
+        for waiters in (self._push_waiters, self._pop_waiters):
+            while waiters:
+                _wake_one(waiters)
+
+    def is_closed(self) -> bool:
+        """Returns `True` if `close` was called, otherwise `False`."""
+        return self._closed
+
+
+    def _wake_pushers(self, count: int):
+        """Wakes up coroutines waiting for `count` freed places."""
+        # A woken `push_many` may still not fit and go back to waiting, so everyone is woken while one is waiting
+        if self._batch_pushers > 0:
+            count = len(self._push_waiters)
+        for _ in range(count):
+            _wake_one(self._push_waiters)
+
+    async def _iterate(self) -> AsyncIterator:
+        while True:
+            await self._wait(self._pop_waiters, lambda: self._closed or not self._base.is_empty(self), None)
+            if self._base.is_empty(self):
+                return
+            yield self.try_pop()
+
+    async def _wait(self, waiters: deque, ready, timeout: float | None) -> bool:
+        # Waiters are woken up one at a time, a woken waiter that doesn't take its turn passes it on
+        if ready():
+            return True
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+            except BaseException:
+                waiter.cancel()
+                if ready():
+                    _wake_one(waiters)
+                raise
+            finally:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+        return True
+
+def _wake_one(waiters: deque):
+    """Inner function of the asyncio variants. Wakes up the oldest waiter that is still waiting."""
+
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+class AsyncQueue(_Async, Queue):
+    """
+    asyncio variant of `Queue`. First in, first out.
+
+    `await push(item)` suspends while the queue is full and `await pop()` suspends while it's empty, which gives
+    producers backpressure without polling. `async for item in queue` pops items until the queue is closed and empty.
+
+    Methods
+    -------
+    - await push(item, timeout=None)
+        Puts an item at the tail of the queue, suspending while it's full.
+
+    - await pop(timeout=None) -> Any | None
+        Removes and returns the item from the head of the queue, suspending while it's empty.
+
+    - await push_many(iterable, timeout=None)
+        Puts all items of the iterable at the tail of the queue, suspending until there is place for all of them.
+
+    - await pop_many(n, timeout=None) -> list
+        Removes and returns up to `n` items from the head, suspending only until the first one is there.
+
+    - drain -> list
+        Removes and returns all items of the queue without suspending.
+
+    - try_push(item) -> bool
+        Puts an item at the tail if the queue isn't full. Returns `True` if it was pushed.
+
+    - try_pop -> Any | None
+        Removes and returns the item from the head, or returns `None` if the queue is empty.
+
+    - close
+        Stops the queue from accepting new items and wakes up every waiting coroutine.
+
+    - peek, size, is_empty, is_full, is_closed
+        Same as in `Queue`.
+
+    Raises
+    ------
+    - QueueIsFullError
+        If `max_size` is set and `push` is still waiting for a free place after `timeout`.
+
+    - QueueIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True`, and `pop` is still waiting for an item after `timeout`
+        or `peek` is performed on an empty queue.
+
+    - AsyncIsClosedError
+        If `push` is performed on a closed queue.
+    """
+
+    _base = Queue
+    _full_error = QueueIsFullError
+
+    def __init__(self, max_size: int = None, raise_errors_on_empty_op: bool = False): # pyright: ignore[reportArgumentType]
+        """
+        Args
+        ----
+        - max_size : int, optional
+            Maximum size of the queue, `push` suspends when it's reached.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the queue is empty (after `timeout`) instead of returning `None`.
+            (default = False)
+        """
+        Queue.__init__(self, max_size, raise_errors_on_empty_op)
+        self._init_async()
+
+    def __repr__(self):
+        return "Async" + Queue.__repr__(self)
+
+class AsyncStack(_Async, Stack):
+    """
+    asyncio variant of `Stack`. Last in, first out.
+
+    Same methods as `AsyncQueue`, but `pop`, `pop_many` and `async for` take the item on top of the stack.
+
+    Raises
+    ------
+    - StackIsFullError
+        If `max_size` is set and `push` is still waiting for a free place after `timeout`.
+
+    - StackIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True`, and `pop` is still waiting for an item after `timeout`
+        or `peek` is performed on an empty stack.
+
+    - AsyncIsClosedError
+        If `push` is performed on a closed stack.
+    """
+
+    _base = Stack
+    _full_error = StackIsFullError
+
+    def __init__(self, max_size: int = None, raise_errors_on_empty_op: bool = False): # pyright: ignore[reportArgumentType]
+        """
+        Args
+        ----
+        - max_size : int, optional
+            Maximum size of the stack, `push` suspends when it's reached.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the stack is empty (after `timeout`) instead of returning `None`.
+            (default = False)
+        """
+        Stack.__init__(self, max_size, raise_errors_on_empty_op)
+        self._init_async()
+
+    def __repr__(self):
+        return "Async" + Stack.__repr__(self)
@@ -0,0 +1,446 @@
+from collections.abc import Iterable
+from typing import Any
+import threading
+import time
+from utilities_python.data_structures.llqueue import LLQueue, LLQueueIsFullError
+from utilities_python.data_structures.queue import Queue, QueueIsEmptyError, QueueIsFullError
+from utilities_python.data_structures.stack import Stack, StackIsFullError
+
+
+class _Blocking:
+    """
+    Base of the thread-safe variants. Guards every method of the wrapped structure (`_base`) with one lock
+    and lets `push`/`pop` wait on condition variables instead of raising or returning `None` right away.
+    """
+
+    _base: type
+    _full_error: type[Exception]
+
+    def _init_blocking(self):
+        # Reentrant, because methods of the base classes call each other (`push` calls `size`)
+        self._lock = threading.RLock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._batch_pushers = 0 # Threads waiting in `push_many`, they need more than one free place
+
+    def __iter__(self):
+        # Iterates over a copy, so other threads can keep using the structure
+        with self._lock:
+            return iter(list(self._base.__iter__(self)))
+
+    def __len__(self):
+        with self._lock:
+            return self._base.size(self)
+
+
+    def push(self, item: Any, timeout: float | None = None):
+        """
+        Puts an item into the structure, waiting for a free place if `max_size` is set and it's full.
+
+        Raises the full error of the structure if there is still no place after `timeout` seconds
+        (`None` waits forever, `0` doesn't wait).
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: not self._base.is_full(self), timeout):
+                raise self._full_error(f"Cannot push to a full {self._base.__name__.lower()}.")
+            self._base.push(self, item)
+            self._not_empty.notify()
+
+    def pop(self, timeout: float | None = None) -> Any | None:
+        """
+        Removes and returns the next item, waiting for one if the structure is empty.
+
+        If there is still no item after `timeout` seconds (`None` waits forever, `0` doesn't wait)
+        returns `None`/raises the empty error of the structure, depending on `raise_errors_on_empty_op`.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._base.is_empty(self), timeout):
+                return self._base.pop(self)
+            item = self._base.pop(self)
+            self._notify_not_full(1)
+            return item
+
+    def push_many(self, iterable: Iterable, timeout: float | None = None):
+        """
+        Puts all items of the iterable into the structure, in order, waiting until there is place for all of them.
+        Either all items are pushed or none.
+
+        Raises the full error of the structure if there is still not enough place after `timeout` seconds
+        (`None` waits forever, `0` doesn't wait), or right away if there are more items than `max_size`.
+        """
+        items = list(iterable)
+        with self._not_full:
+            if self._max_size != None and len(items) > self._max_size:
+                raise self._full_error(f"Cannot push more items than the max_size of the {self._base.__name__.lower()}.")
+            self._batch_pushers += 1
+            try:
+                fits = self._not_full.wait_for(
+                    lambda: self._max_size == None or self._base.size(self) + len(items) <= self._max_size, timeout
+                )
+            finally:
+                self._batch_pushers -= 1
+            if not fits:
+                raise self._full_error(f"Cannot push to a full {self._base.__name__.lower()}.")
+            self._base.push_many(self, items)
+            self._not_empty.notify(len(items))
+
+    def pop_many(self, n: int, timeout: float | None = None) -> list:
+        """
+        Removes and returns up to `n` items as a list, waiting only until the first one is there.
+
+        Returns an empty list if there is still no item after `timeout` seconds (`None` waits forever, `0` doesn't wait).
+        """
+        with self._not_empty:
+            self._not_empty.wait_for(lambda: not self._base.is_empty(self), timeout)
+            items = self._base.pop_many(self, n)
+            self._notify_not_full(len(items))
+            return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the structure as a list without waiting."""
+        with self._lock:
+            items = self._base.drain(self)
+            self._notify_not_full(len(items))
+            return items
+
+    def try_push(self, item: Any) -> bool:
+        """Puts an item into the structure if there is place for it without waiting. Returns `True` if it was pushed."""
+        with self._lock:
+            if self._base.is_full(self):
+                return False
+            self._base.push(self, item)
+            self._not_empty.notify()
+            return True
+
+    def try_pop(self) -> Any | None:
+        """Removes and returns the next item without waiting. Returns `None` if the structure is empty."""
+        with self._lock:
+            if self._base.is_empty(self):
+                return None
+            item = self._base.pop(self)
+            self._notify_not_full(1)
+            return item
+
+    def _notify_not_full(self, count: int):
+        """Wakes up threads waiting for `count` freed places. Requires the lock."""
+        # A woken `push_many` may still not fit and go back to sleep, so everyone is woken while one is waiting
+        if self._batch_pushers > 0:
+            self._not_full.notify_all()
+        else:
+            self._not_full.notify(count)
+
+    def peek(self) -> Any | None:
+        """Returns the next item without removing it, see the base structure."""
+        with self._lock:
+            return self._base.peek(self)
+
+    def size(self) -> int:
+        """Returns the size of the structure."""
+        with self._lock:
+            return self._base.size(self)
+
+    def is_empty(self) -> bool:
+        """Returns `True` if the structure is empty, otherwise `False`."""
+        with self._lock:
+            return self._base.is_empty(self)
+
+    def is_full(self) -> bool:
+        """Returns `True` if `max_size` is set and the structure is full, otherwise `False`."""
+        with self._lock:
+            return self._base.is_full(self)
+
+
+class BlockingQueue(_Blocking, Queue):
+    """
+    Thread-safe `Queue`. First in, first out.
+
+    `push(item, timeout=None)` waits while the queue is full and `pop(timeout=None)` waits while it's empty,
+    `try_push(item) -> bool` and `try_pop() -> Any | None` never wait. Waiting threads sleep on condition
+    variables until another thread pops or pushes, instead of polling `is_empty`.
+    `push_many(iterable, timeout=None)` (all items or none), `pop_many(n, timeout=None) -> list`
+    and `drain() -> list` move whole batches under one lock.
+
+    Raises
+    ------
+    - QueueIsFullError
+        If `max_size` is set and `push` is still waiting for a free place after `timeout`.
+
+    - QueueIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True`, and `pop` is still waiting for an item after `timeout`
+        or `peek` is performed on an empty queue.
+    """
+
+    _base = Queue
+    _full_error = QueueIsFullError
+
+    def __init__(self, max_size: int = None, raise_errors_on_empty_op: bool = False): # pyright: ignore[reportArgumentType]
+        """
+        Args
+        ----
+        - max_size : int, optional
+            Maximum size of the queue, `push` waits when it's reached.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the queue is empty (after `timeout`) instead of returning `None`.
+            (default = False)
+        """
+        Queue.__init__(self, max_size, raise_errors_on_empty_op)
+        self._init_blocking()
+
+    def __repr__(self):
+        with self._lock:
+            return "Blocking" + Queue.__repr__(self)
+
+    def __eq__(self, other):
+        with self._lock:
+            return Queue.__eq__(self, other)
+
+class BlockingStack(_Blocking, Stack):
+    """
+    Thread-safe `Stack`. Last in, first out.
+
+    `push(item, timeout=None)` waits while the stack is full and `pop(timeout=None)` waits while it's empty,
+    `try_push(item) -> bool` and `try_pop() -> Any | None` never wait.
+
+    Raises
+    ------
+    - StackIsFullError
+        If `max_size` is set and `push` is still waiting for a free place after `timeout`.
+
+    - StackIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True`, and `pop` is still waiting for an item after `timeout`
+        or `peek` is performed on an empty stack.
+    """
+
+    _base = Stack
+    _full_error = StackIsFullError
+
+    def __init__(self, max_size: int = None, raise_errors_on_empty_op: bool = False): # pyright: ignore[reportArgumentType]
+        """
+        Args
+        ----
+        - max_size : int, optional
+            Maximum size of the stack, `push` waits when it's reached.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the stack is empty (after `timeout`) instead of returning `None`.
+            (default = False)
+        """
+        Stack.__init__(self, max_size, raise_errors_on_empty_op)
+        self._init_blocking()
+
+    def __repr__(self):
+        with self._lock:
+            return "Blocking" + Stack.__repr__(self)
+
+    def __eq__(self, other):
+        with self._lock:
+            return Stack.__eq__(self, other)
+
+class BlockingLLQueue(_Blocking, LLQueue):
+    """
+    Thread-safe `LLQueue`. First in, first out.
+
+    `push(item, timeout=None)` waits while the llqueue is full and `pop(timeout=None)` waits while it's empty,
+    `try_push(item) -> bool` and `try_pop() -> Any | None` never wait.
+
+    Raises
+    ------
+    - LLQueueIsFullError
+        If `max_size` is set and `push` is still waiting for a free place after `timeout`.
+
+    - LLQueueIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True`, and `pop` is still waiting for an item after `timeout`
+        or `peek` is performed on an empty llqueue.
+    """
+
+    _base = LLQueue
+    _full_error = LLQueueIsFullError
+
+    def __init__(self, max_size: int = None, raise_errors_on_empty_op: bool = False): # pyright: ignore[reportArgumentType]
+        """
+        Args
+        ----
+        - max_size : int, optional
+            Maximum size of the llqueue, `push` waits when it's reached.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the llqueue is empty (after `timeout`) instead of returning `None`.
+            (default = False)
+        """
+        LLQueue.__init__(self, max_size, raise_errors_on_empty_op)
+        self._init_blocking()
+
+    def __repr__(self):
+        with self._lock:
+            return "Blocking" + LLQueue.__repr__(self)
+
+    def __eq__(self, other):
+        with self._lock:
+            return LLQueue.__eq__(self, other)
+
+
+class SPSCQueue:
+    """
+    Bounded queue for exactly one producer thread and one consumer thread. First in, first out.
+
+    Only the producer moves the tail and only the consumer moves the head of a preallocated circular buffer,
+    so `try_push`/`try_pop` don't take any lock. Blocking `push`/`pop` only lock when they have to wait,
+    and the other side only locks to wake a waiting thread up.
+    Using it from more than one producer or more than one consumer at the same time loses or duplicates items.
+
+    Methods
+    -------
+    - push(item, timeout=None)
+        Puts an item at the tail, waiting while the queue is full.
+
+    - pop(timeout=None) -> Any | None
+        Removes and returns the item from the head, waiting while the queue is empty.
+
+    - try_push(item) -> bool
+        Puts an item at the tail if the queue isn't full. Returns `True` if it was pushed.
+
+    - try_pop -> Any | None
+        Removes and returns the item from the head, or returns `None` if the queue is empty.
+
+    - size -> int
+        Returns the size of the queue.
+
+    - is_empty -> bool
+        Returns `True` if queue is empty, otherwise `False`.
+
+    - is_full -> bool
+        Returns `True` if the queue is full, otherwise `False`.
+
+    Raises
+    ------
+    - QueueIsFullError
+        If `push` is still waiting for a free place after `timeout`.
+
+    - QueueIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True` and `pop` is still waiting for an item after `timeout`.
+    """
+
+    def __init__(self, max_size: int, raise_errors_on_empty_op: bool = False):
+        """
+        Args
+        ----
+        - max_size : int
+            Maximum size of the queue, all slots are allocated at once.
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `pop` to raise errors if the queue is still empty after `timeout` instead of returning `None`.
+            (default = False)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self._slots = [None] * max_size
+        self._max_size = max_size
+        self._raise_errors_on_empty_op = raise_errors_on_empty_op
+        # Both only grow, the slot of an index is `index % max_size`
+        self._head = 0 # Written only by the consumer
+        self._tail = 0 # Written only by the producer
+        self._condition = threading.Condition()
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+    def __repr__(self):
+        head, tail = self._head, self._tail
+        items_repr = ", ".join(repr(self._slots[i % self._max_size]) for i in range(head, tail))
+        return f"SPSCQueue[{items_repr}]"
+
+    def __len__(self):
+        return self._tail - self._head
+
+
+    def try_push(self, item: Any) -> bool:
+        """Puts an item at the tail if the queue isn't full. Returns `True` if it was pushed. Producer only."""
+        tail = self._tail
+        if tail - self._head >= self._max_size:
+            return False
+        self._slots[tail % self._max_size] = item
+        self._tail = tail + 1 # Publishes the item after it's written
+        if self._consumer_waiting:
+            with self._condition:
+                self._condition.notify()
+        return True
+
+    def try_pop(self) -> Any | None:
+        """Removes and returns the item from the head, or returns `None` if the queue is empty. Consumer only."""
+        head = self._head
+        if head == self._tail:
+            return None
+        slot = head % self._max_size
+        item = self._slots[slot]
+        self._slots[slot] = None
+        self._head = head + 1 # Frees the slot after it's read
+        if self._producer_waiting:
+            with self._condition:
+                self._condition.notify()
+        return item
+
+    def push(self, item: Any, timeout: float | None = None):
+        """
+        Puts an item at the tail, waiting while the queue is full. Producer only.
+
+        Raises `QueueIsFullError` if there is still no place after `timeout` seconds (`None` waits forever).
+        """
+        if self.try_push(item):
+            return
+        if not self._wait(lambda: self._tail - self._head < self._max_size, timeout, producer=True):
+            raise QueueIsFullError("Cannot push to a full queue.")
+        self.try_push(item)
+
+    def pop(self, timeout: float | None = None) -> Any | None:
+        """
+        Removes and returns the item from the head, waiting while the queue is empty. Consumer only.
+
+        If there is still no item after `timeout` seconds (`None` waits forever) returns `None`/raises
+        `QueueIsEmptyError`, depending on `raise_errors_on_empty_op`.
+        """
+        if self._head != self._tail:
+            return self.try_pop()
+        if not self._wait(lambda: self._head != self._tail, timeout, producer=False):
+            if self._raise_errors_on_empty_op:
+                raise QueueIsEmptyError("Cannot pop from an empty queue.")
+            return None
+        return self.try_pop()
+
+    def size(self) -> int:
+        """Returns the size of the queue."""
+        return self._tail - self._head
+
+    def is_empty(self) -> bool:
+        """Returns `True` if the queue is empty, otherwise `False`."""
+        return self._tail == self._head
+
+    def is_full(self) -> bool:
+        """Returns `True` if the queue is full, otherwise `False`."""
+        return self._tail - self._head >= self._max_size
+
+
+    def _wait(self, ready, timeout: float | None, producer: bool) -> bool:
+        # The flag is set before checking again under the lock, so the other side either makes `ready` true
+        # before the check or sees the flag afterwards and has to take the lock to notify, after `wait` released it
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if producer:
+                self._producer_waiting = True
+            else:
+                self._consumer_waiting = True
+            try:
+                while not ready():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                if producer:
+                    self._producer_waiting = False
+                else:
+                    self._consumer_waiting = False
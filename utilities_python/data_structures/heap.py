@@ -0,0 +1,283 @@
+from collections.abc import Iterable
+from typing import Any
+from utilities_python.sorting._keys import KeySpec, compile_key
+
+
+class HeapIsEmptyError(Exception):
+    """Custom exception raised when pop or peek operation is performed on an empty heap."""
+    pass
+
+class HeapIsFullError(Exception):
+    """Custom exception raised when push operation is performed on a full heap."""
+    pass
+
+class Heap:
+    """
+    Priority queue stored as an array-backed d-ary heap (binary by default).
+    Pops the item with the smallest key first (biggest if `reverse` is set), items with equal keys are popped in the order they were pushed.
+    Complexity of `push`, `pop`, `pushpop` and `decrease_key` - O(log n), `heapify` - O(n), the rest - O(1).
+
+    Methods
+    -------
+    - push(item, priority=None) -> HeapEntry
+        Puts an item into the heap. Uses `key(item)` as its priority unless `priority` is given.
+        Returns the entry of the item that can be passed to `decrease_key`.
+
+    - pop -> Any | None
+        Removes and returns the item with the highest priority.
+        Returns `None`/raises `HeapIsEmptyError` if heap is empty, depending on `raise_errors_on_empty_op`.
+
+    - peek -> Any | None
+        Returns the item with the highest priority without removing it.
+        Returns `None`/raises `HeapIsEmptyError` if heap is empty, depending on `raise_errors_on_empty_op`.
+
+    - pushpop(item) -> Any
+        Pushes the item and pops the item with the highest priority in one step (works on a full heap).
+
+    - decrease_key(entry, priority)
+        Moves the item of the entry ahead of its current place by giving it a new priority.
+
+    - heapify(iterable)
+        Pushes all items of the iterable at once.
+
+    - size -> int
+        Returns the size of the heap.
+
+    - is_empty -> bool
+        Returns `True` if heap is empty, otherwise `False`.
+
+    - is_full -> bool
+        Returns `True` if `max_size` is set and the heap is full, otherwise `False`.
+
+    Raises
+    ------
+    - HeapIsFullError
+        If `max_size` is set and `push`/`heapify` is performed when size of the heap would exceed `max_size`.
+
+    - HeapIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True` and `peek`/`pop` is performed on an empty heap.
+    """
+
+    def __init__(
+            self,
+            key: KeySpec = None,
+            reverse: bool = False,
+            arity: int = 2,
+            max_size: int = None, # pyright: ignore[reportArgumentType]
+            raise_errors_on_empty_op: bool = False
+        ):
+        """
+        Args
+        ----
+        - key : func | str | int | tuple, optional
+            Function that returns the priority of an item. Called once per pushed item.
+            Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`, like in the sorts.
+            (default = None, uses the items themselves)
+
+        - reverse : bool, optional
+            Set to True to pop the item with the biggest key first.
+            (default = False)
+
+        - arity : int, optional
+            Amount of children of each node. Bigger arity makes `push` faster and `pop` slower.
+            (default = 2)
+
+        - max_size : int, optional
+            Maximum size of the heap.
+            (default = None)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the heap is empty instead of returning `None`.
+            (default = False)
+        """
+        if arity < 2:
+            raise ValueError("Arity must be at least 2.")
+
+        compile_key(key) # Raises `TypeError` for invalid keys right away
+
+        self._entries = []
+        self._key = key
+        self._key_compiled = callable(key) or key is None # Field specs are compiled on the first push, see `compile_key`
+        self._reverse = reverse
+        self._arity = arity
+        self._max_size = max_size
+        self._raise_errors_on_empty_op = raise_errors_on_empty_op
+        self._pushed = 0 # Counter used to pop equal keys in the order they were pushed
+
+    def __repr__(self):
+        items_repr = ", ".join(repr(entry.item) for entry in self._entries)
+        return f"Heap[{items_repr}]"
+
+    def __iter__(self):
+        return (entry.item for entry in self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def push(self, item: Any, priority: Any = None) -> "HeapEntry":
+        """
+        Puts an item into the heap. Uses `key(item)` as its priority unless `priority` is given.
+        Returns the entry of the item that can be passed to `decrease_key`.
+
+        Raises `HeapIsFullError` if `max_size` is set and size of the heap equals `max_size`.
+        """
+        if self._max_size != None and self.size() >= self._max_size:
+            raise HeapIsFullError("Cannot push to a full heap.")
+
+        entry = self._new_entry(item, priority)
+        entry.position = len(self._entries)
+        self._entries.append(entry)
+        self._sift_up(entry.position)
+        return entry
+
+    def pop(self) -> Any | None:
+        """
+        Removes and returns the item with the highest priority.
+
+        Returns `None`/raises `HeapIsEmptyError` if heap is empty, depending on `raise_errors_on_empty_op`.
+        """
+        if len(self._entries)==0:
+            if self._raise_errors_on_empty_op:
+                raise HeapIsEmptyError("Cannot pop from an empty heap.")
+            return None
+
+        root = self._entries[0]
+        last = self._entries.pop()
+        if len(self._entries) > 0:
+            self._place(last, 0)
+            self._sift_down(0)
+        root.position = None
+        return root.item
+
+    def peek(self) -> Any | None:
+        """
+        Returns the item with the highest priority without removing it.
+
+        Returns `None`/raises `HeapIsEmptyError` if heap is empty, depending on `raise_errors_on_empty_op`.
+        """
+        if len(self._entries)==0:
+            if self._raise_errors_on_empty_op:
+                raise HeapIsEmptyError("Cannot peek from an empty heap")
+            return None
+        return self._entries[0].item
+
+    def pushpop(self, item: Any) -> Any:
+        """
+        Pushes the item and pops the item with the highest priority in one step.
+        Faster than `push` followed by `pop` and works on a full heap.
+        """
+        entry = self._new_entry(item, None)
+        if len(self._entries) == 0 or self._is_before(entry, self._entries[0]):
+            return item
+
+        root = self._entries[0]
+        self._place(entry, 0)
+        self._sift_down(0)
+        root.position = None
+        return root.item
+
+    def decrease_key(self, entry: "HeapEntry", priority: Any):
+        """
+        Moves the item of the entry (returned by `push`) ahead of its current place by giving it a new priority.
+
+        Raises `ValueError` if the entry isn't in the heap or the new priority would move it back.
+        """
+        if entry.position == None or entry.position >= len(self._entries) or self._entries[entry.position] is not entry:
+            raise ValueError("Entry is not in the heap.")
+        if (not self._reverse and priority > entry.priority) or (self._reverse and priority < entry.priority):
+            raise ValueError("New priority would move the item back.")
+
+        entry.priority = priority
+        self._sift_up(entry.position)
+
+    def heapify(self, iterable: Iterable):
+        """
+        Pushes all items of the iterable at once and restores the heap bottom-up in O(n).
+
+        Raises `HeapIsFullError` (without pushing anything) if `max_size` is set and the items don't fit.
+        """
+        entries = [self._new_entry(item, None) for item in iterable]
+        if self._max_size != None and self.size() + len(entries) > self._max_size:
+            raise HeapIsFullError("Cannot push more items than the heap can fit.")
+
+        for entry in entries:
+            entry.position = len(self._entries)
+            self._entries.append(entry)
+        for i in range((len(self._entries) - 2) // self._arity, -1, -1):
+            self._sift_down(i)
+
+    def size(self) -> int:
+        """Returns the size of the heap."""
+        return len(self._entries)
+
+    def is_empty(self) -> bool:
+        """Returns `True` if the heap is empty, otherwise `False`."""
+        return len(self._entries) == 0
+
+    def is_full(self) -> bool:
+        """Returns `True` if `max_size` is set and the heap is full, otherwise `False`."""
+        return self._max_size != None and self.size() >= self._max_size
+
+
+    def _new_entry(self, item: Any, priority: Any) -> "HeapEntry":
+        self._pushed += 1
+        if priority is None:
+            if not self._key_compiled:
+                self._key, self._key_compiled = compile_key(self._key, item), True
+            priority = item if self._key is None else self._key(item)
+        return HeapEntry(priority, self._pushed, item)
+
+    def _is_before(self, left: "HeapEntry", right: "HeapEntry") -> bool:
+        if left.priority == right.priority:
+            return left.order < right.order
+        if self._reverse:
+            return left.priority > right.priority
+        return left.priority < right.priority
+
+    def _place(self, entry: "HeapEntry", position: int):
+        self._entries[position] = entry
+        entry.position = position
+
+    def _sift_up(self, position: int):
+        entry = self._entries[position]
+        while position > 0:
+            parent = (position - 1) // self._arity
+            if not self._is_before(entry, self._entries[parent]):
+                break
+            self._place(self._entries[parent], position)
+            position = parent
+        self._place(entry, position)
+
+    def _sift_down(self, position: int):
+        entry = self._entries[position]
+        size = len(self._entries)
+        while True:
+            first_child = self._arity * position + 1
+            if first_child >= size:
+                break
+
+            best = first_child
+            for child in range(first_child + 1, min(first_child + self._arity, size)):
+                if self._is_before(self._entries[child], self._entries[best]):
+                    best = child
+            if not self._is_before(self._entries[best], entry):
+                break
+            self._place(self._entries[best], position)
+            position = best
+        self._place(entry, position)
+
+
+class HeapEntry:
+    """Entry of an item in the heap. Returned by `Heap.push` and used by `Heap.decrease_key`."""
+
+    __slots__ = ("priority", "order", "item", "position")
+
+    def __init__(self, priority: Any, order: int, item: Any):
+        self.priority = priority
+        self.order = order
+        self.item = item
+        self.position = None
+
+    def __repr__(self):
+        return f"HeapEntry({self.item!r}, priority={self.priority!r})"
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -21,10 +22,19 @@ class LinkedList:
     - add_to_head(item)
         Add item to the start of the linked list.
 
+    - add_many_to_tail(iterable)
+        Add all items of the iterable to the end of the linked list, in order.
+
     - pop_from_head -> Any | None
         Removes and returns the item from the head of the linked list.
         Returns `None`/raises `LListIsEmptyError` if linked list is empty, depending on `raise_errors_on_empty_op`.
 
+    - pop_many_from_head(n) -> list
+        Removes and returns up to `n` items from the head of the linked list as a list.
+
+    - drain -> list
+        Removes and returns all items of the linked list as a list.
+
     - peek_from_head -> Any | None
         Returns the item from the head without removing it.
         Returns `None`/raises `LListIsEmptyError` if linked list is empty, depending on `raise_errors_on_empty_op`.
@@ -106,6 +116,30 @@ class LinkedList:
         self._head = new_node
         self._size += 1
 
+    def add_many_to_tail(self, iterable: Iterable):
+        """
+        Add all items of the iterable to the end of the linked list, in order.
+        Checks the size once and links the new nodes to each other before attaching them.
+
+        Raises `LListIsFullError` and adds nothing if `max_size` is set and there is no place for all of them.
+        """
+        items = list(iterable)
+        if self._max_size != None and self._size + len(items) > self._max_size:
+            raise LListIsFullError("Cannot add more items than there is place for in the linked list.")
+        if len(items) == 0:
+            return
+
+        first = last = _Node(items[0])
+        for item in items[1:]:
+            last._next = _Node(item)
+            last = last._next
+        if self._head != None:
+            self._tail.set_next(first) # pyright: ignore[reportOptionalMemberAccess]
+        else:
+            self._head = first
+        self._tail = last
+        self._size += len(items)
+
     def pop_from_head(self) -> Any:
         if self._head == None:
             if self._raise_errors_on_empty_op:
@@ -119,6 +153,27 @@ class LinkedList:
         self._size -= 1
         return node._val
     
+    def pop_many_from_head(self, n: int) -> list:
+        """
+        Removes and returns up to `n` items from the head of the linked list as a list, head first.
+        Returns fewer items (an empty list if the linked list is empty) instead of raising.
+        """
+        count = max(0, min(n, self._size))
+        items = []
+        node = self._head
+        for _ in range(count):
+            items.append(node._val) # pyright: ignore[reportOptionalMemberAccess]
+            node = node._next # pyright: ignore[reportOptionalMemberAccess]
+        self._head = node
+        if node == None:
+            self._tail = None
+        self._size -= count
+        return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the linked list as a list, head first."""
+        return self.pop_many_from_head(self._size)
+    
     def peek_from_head(self) -> Any:
         if self._head == None:
             if self._raise_errors_on_empty_op:
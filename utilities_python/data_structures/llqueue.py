@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -24,6 +25,16 @@ class LLQueue:
         Removes and returns the item from the head of the llqueue.
         Returns `None`/raises `LLQueueIsEmptyError` if llqueue is empty, depending on `raise_errors_on_empty_op`.
 
+    - push_many(iterable)
+        Adds all items of the iterable to the end of the llqueue, in order.
+        Raises `LLQueueIsFullError` and adds nothing if `max_size` is set and there is no place for all of them.
+
+    - pop_many(n) -> list
+        Removes and returns up to `n` items from the head of the llqueue as a list.
+
+    - drain -> list
+        Removes and returns all items of the llqueue as a list.
+
     - peek -> Any | None
         Returns the item from the head without removing it.
         Returns `None`/raises `LLQueueIsEmptyError` if llqueue is empty, depending on `raise_errors_on_empty_op`.
@@ -80,6 +91,19 @@ class LLQueue:
             yield node
             node = node._next
 
+    def __eq__(self, other):
+        if not isinstance(other, LLQueue):
+            return False
+
+        if self.size() != other.size():
+            return False
+
+        for node, other_node in zip(self, other):
+            if node._val != other_node._val:
+                return False
+
+        return True
+
 
     def push(self, object : Any):
         """
@@ -118,6 +142,54 @@ class LLQueue:
         self._size -= 1
         return node._val
     
+    def push_many(self, iterable: Iterable):
+        """
+        Adds all items of the iterable to the end of the llqueue, in order.
+        Checks the size once and links the new nodes to each other before attaching them.
+
+        Raises `LLQueueIsFullError` and adds nothing if `max_size` is set and there is no place for all of them.
+        """
+
+        items = list(iterable)
+        if self._max_size != None and self._size + len(items) > self._max_size:
+            raise LLQueueIsFullError("Cannot push more items than there is place for in the llqueue.")
+        if len(items) == 0:
+            return
+
+        first = last = _Node(items[0])
+        for item in items[1:]:
+            last._next = _Node(item)
+            last = last._next
+        if self._head != None:
+            self._tail.set_next(first) # pyright: ignore[reportOptionalMemberAccess]
+        else:
+            self._head = first
+        self._tail = last
+        self._size += len(items)
+
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns up to `n` items from the head of the llqueue as a list, head first.
+        Returns fewer items (an empty list if the llqueue is empty) instead of raising.
+        """
+
+        count = max(0, min(n, self._size))
+        items = []
+        node = self._head
+        for _ in range(count):
+            items.append(node._val) # pyright: ignore[reportOptionalMemberAccess]
+            node = node._next # pyright: ignore[reportOptionalMemberAccess]
+        self._head = node
+        if node == None:
+            self._tail = None
+        self._size -= count
+        return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the llqueue as a list, head first."""
+
+        return LLQueue.pop_many(self, self._size) # Not `self.pop_many`, the blocking variant overrides it
+    
     def peek(self) -> Any:
         """
         Returns the item from the head without removing it.
@@ -1,6 +1,10 @@
+from collections.abc import Iterable
 from typing import Any
 
 
+_INITIAL_CAPACITY = 8
+
+
 class QueueIsEmptyError(Exception):
     """Custom exception raised when pop or peek operation is performed on an empty queue."""
     pass
@@ -11,8 +15,9 @@ class QueueIsFullError(Exception):
 
 class Queue:
     """
-    Abstract data structure. First in, first out.
-    Complexity of `pop` - O(n), the rest - O(1).
+    Abstract data structure. First in, first out. Circular buffer used to store items.
+    Complexity of `push`/`pop` - amortised O(1), the rest - O(1).
+    Unbounded queues double their buffer when full and halve it when less than a quarter of it is used.
 
     Methods
     -------
@@ -23,6 +28,15 @@ class Queue:
         Removes and returns the item from the head of the queue.
         Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
 
+    - push_many(iterable)
+        Puts all items of the iterable at the tail of the queue, in order.
+
+    - pop_many(n) -> list
+        Removes and returns up to `n` items from the head of the queue as a list.
+
+    - drain -> list
+        Removes and returns all items of the queue as a list.
+
     - peek -> Any | None
         Returns the item from the head without removing it.
         Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
@@ -39,7 +53,8 @@ class Queue:
     Raises
     ------
     - QueueIsFullError
-        If `max_size` is set and `push` is performed when size of the queue equals `max_size`.
+        If `max_size` is set and `push` is performed when size of the queue equals `max_size`
+        or `push_many` is performed with more items than there is place for.
 
     - QueueIsEmptyError
         If `raise_errors_on_empty_op` is set to `True` and `peek`/`pop` is performed on an empty queue.
@@ -57,15 +72,21 @@ class Queue:
             Changes `peek`/`pop` to raise errors if the queue is empty instead of returning `None`.
             (default = False)
         """
-        self._items = []
         self._max_size = max_size
         self._raise_errors_on_empty_op = raise_errors_on_empty_op
+        # Bounded queues get all their slots at once and never resize,
+        # unbounded ones double when full and halve when less than a quarter full
+        self._slots = [None] * (max_size if max_size != None else _INITIAL_CAPACITY)
+        self._head = 0 # Index of the first item
+        self._size = 0
 
     def __repr__(self):
-        return f"Queue{self._items}"
+        return f"Queue{list(self)}"
 
     def __iter__(self):
-        return self._items
+        capacity = len(self._slots)
+        for i in range(self._size):
+            yield self._slots[(self._head + i) % capacity]
     
     def __eq__(self, other):
         if not isinstance(other, Queue):
@@ -74,14 +95,14 @@ class Queue:
         if self.size() != other.size():
             return False
         
-        for i in range(0, self.size()):
-            if self._items[i] != other._items[i]:
+        for item, other_item in zip(self, other):
+            if item != other_item:
                 return False
             
         return True
     
     def __len__(self):
-        return len(self._items)
+        return self._size
 
 
     def push(self, item: Any):
@@ -90,9 +111,12 @@ class Queue:
         
         Raises `QueueIsFullError` if `max_size` is set and size of the queue equals `max_size`.
         """
-        if self._max_size != None and self.size() >= self._max_size:
+        if self._max_size != None and self._size >= self._max_size:
             raise QueueIsFullError("Cannot push to a full queue.")
-        self._items.append(item)
+        if self._size == len(self._slots):
+            self._grow()
+        self._slots[(self._head + self._size) % len(self._slots)] = item
+        self._size += 1
 
     def pop(self) -> Any | None:
         """
@@ -100,33 +124,112 @@ class Queue:
         
         Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
         """
-        if len(self._items)==0:
+        if self._size==0:
             if self._raise_errors_on_empty_op:
                 raise QueueIsEmptyError("Cannot pop from an empty queue.")
             return None
-        item = self._items.pop(0)
+        item = self._slots[self._head]
+        self._slots[self._head] = None # Lets the item be garbage collected
+        self._head = (self._head + 1) % len(self._slots)
+        self._size -= 1
+        if self._max_size == None and self._size < len(self._slots) // 4:
+            self._shrink()
         return item
 
+    def push_many(self, iterable: Iterable):
+        """
+        Puts all items of the iterable at the tail of the queue, in order.
+        Checks the size once and copies the items with at most two slice assignments.
+
+        Raises `QueueIsFullError` and pushes nothing if `max_size` is set and there is no place for all of them.
+        """
+        items = list(iterable)
+        count = len(items)
+        if self._max_size != None and self._size + count > self._max_size:
+            raise QueueIsFullError("Cannot push more items than there is place for in the queue.")
+        if count == 0:
+            return
+        if self._size + count > len(self._slots):
+            self._grow(self._size + count)
+
+        # The free slots start at the tail and may wrap around the end of the buffer
+        capacity = len(self._slots)
+        start = (self._head + self._size) % capacity
+        first = min(count, capacity - start)
+        self._slots[start:start + first] = items[:first]
+        self._slots[:count - first] = items[first:]
+        self._size += count
+
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns up to `n` items from the head of the queue as a list, head first.
+        Returns fewer items (an empty list if the queue is empty) instead of raising.
+        """
+        count = max(0, min(n, self._size))
+        if count == 0:
+            return []
+
+        capacity = len(self._slots)
+        stop = self._head + count
+        if stop <= capacity:
+            items = self._slots[self._head:stop]
+            self._slots[self._head:stop] = [None] * count # Lets the items be garbage collected
+        else:
+            stop -= capacity
+            items = self._slots[self._head:] + self._slots[:stop]
+            self._slots[self._head:] = [None] * (capacity - self._head)
+            self._slots[:stop] = [None] * stop
+        self._head = stop % capacity
+        self._size -= count
+        if self._max_size == None and self._size < capacity // 4:
+            self._shrink()
+        return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the queue as a list, head first."""
+        return Queue.pop_many(self, self._size) # Not `self.pop_many`, the blocking and async variants override it
+
     def peek(self) -> Any | None:
         """
         Returns the item from the head without removing it.
 
         Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
         """
-        if len(self._items)==0:
+        if self._size==0:
             if self._raise_errors_on_empty_op:
                 raise QueueIsEmptyError("Cannot peek from an empty queue")
             return None
-        return self._items[0]
+        return self._slots[self._head]
 
     def size(self) -> int:
         """Returns the size of the queue."""
-        return len(self._items)
+        return self._size
     
     def is_empty(self) -> bool:
         """Returns `True` if the queue is empty, otherwise `False`."""
-        return len(self._items) == 0
+        return self._size == 0
     
     def is_full(self) -> bool:
         """Returns `True` if `max_size` is set and the queue is full, otherwise `False`."""
-        return self._max_size != None and self.size() >= self._max_size
\ No newline at end of file
+        return self._max_size != None and self.size() >= self._max_size
+
+
+    def _grow(self, minimum: int = 0):
+        """Doubles the amount of slots (or more, up to `minimum`), moving the items to the start of the new buffer."""
+        capacity = max(len(self._slots) * 2, minimum, 1)
+        self._slots = list(self) + [None] * (capacity - self._size)
+        self._head = 0
+
+    def _shrink(self):
+        """
+        Halves the amount of slots (down to `_INITIAL_CAPACITY`) until at least a quarter of them is used,
+        moving the items to the start of the new buffer. Halving at a quarter, not at a half, keeps a queue
+        that goes back and forth around the limit from copying its items on every push and pop.
+        """
+        capacity = len(self._slots)
+        while capacity > _INITIAL_CAPACITY and self._size < capacity // 4:
+            capacity = max(capacity // 2, _INITIAL_CAPACITY)
+        if capacity == len(self._slots):
+            return
+        self._slots = list(self) + [None] * (capacity - self._size)
+        self._head = 0
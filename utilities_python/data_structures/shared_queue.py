@@ -0,0 +1,252 @@
+from collections.abc import Iterable
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+import multiprocessing
+import os
+import struct
+from utilities_python.data_structures.queue import QueueIsEmptyError, QueueIsFullError
+
+
+_HEADER = struct.Struct("qq") # Index of the first slot, amount of items
+_LENGTH = struct.Struct("I") # Length of the item at the start of its slot
+
+
+class SharedQueue:
+    """
+    Queue of `bytes` shared between processes. First in, first out.
+    Circular buffer of fixed-size slots in `multiprocessing.shared_memory`, guarded by one `multiprocessing.Lock`.
+    Complexity of all methods - O(1) (plus the length of the item), bulk methods - O(k) for k items.
+
+    Every item is stored as its length followed by its bytes, so pushing and popping copies it once into
+    or out of the shared memory instead of pickling it through a pipe like `multiprocessing.Queue`.
+    The queue is passed to other processes by the name of its memory: give it to `multiprocessing.Process`
+    (or a pool `initializer`) as an argument. The lock can't be sent through a pipe afterwards, so the queue can't
+    be sent through another queue or as an argument of a pool task. The lock has to come from the same start method
+    as the processes, so pass `context=multiprocessing.get_context("spawn")` when starting them from that context.
+
+    The process that created the queue owns the memory and frees it in `close` (or at the end of a `with` block),
+    the other processes only detach from it. Not blocking, use `is_empty`/`is_full` or catch the errors to wait.
+
+    Methods
+    -------
+    - push(item)
+        Copies a bytes-like item to the tail of the queue.
+
+    - pop -> bytes | None
+        Removes and returns the item from the head of the queue.
+        Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
+
+    - peek -> bytes | None
+        Returns the item from the head without removing it.
+        Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
+
+    - push_many(iterable)
+        Copies all items of the iterable to the tail of the queue under one lock.
+
+    - pop_many(n) -> list[bytes]
+        Removes and returns up to `n` items from the head of the queue under one lock.
+
+    - drain -> list[bytes]
+        Removes and returns all items of the queue.
+
+    - size -> int
+        Returns the size of the queue.
+
+    - is_empty -> bool
+        Returns `True` if queue is empty, otherwise `False`.
+
+    - is_full -> bool
+        Returns `True` if the queue is full, otherwise `False`.
+
+    - close
+        Detaches from the shared memory, and frees it if this process created the queue.
+
+    Raises
+    ------
+    - QueueIsFullError
+        If `push` is performed when size of the queue equals `max_size`
+        or `push_many` is performed with more items than there is place for.
+
+    - QueueIsEmptyError
+        If `raise_errors_on_empty_op` is set to `True` and `peek`/`pop` is performed on an empty queue.
+
+    - ValueError
+        If an item is longer than `slot_size`.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            slot_size: int = 256,
+            raise_errors_on_empty_op: bool = False,
+            context: BaseContext | None = None
+        ):
+        """
+        Args
+        ----
+        - max_size : int
+            Maximum size of the queue. All slots are allocated at once.
+
+        - slot_size : int, optional
+            Maximum length of an item in bytes.
+            (default = 256)
+
+        - raise_errors_on_empty_op : bool, optional
+            Changes `peek`/`pop` to raise errors if the queue is empty instead of returning `None`.
+            (default = False)
+
+        - context : BaseContext, optional
+            Multiprocessing context to create the lock with, has to match the one the processes are started with.
+            (default = None, the default context of `multiprocessing`)
+        """
+        if max_size < 1 or slot_size < 0:
+            raise ValueError("max_size has to be at least 1 and slot_size can't be negative.")
+
+        self._max_size = max_size
+        self._slot_size = slot_size
+        self._raise_errors_on_empty_op = raise_errors_on_empty_op
+        self._lock = (context or multiprocessing).Lock()
+        self._memory = SharedMemory(create=True, size=_HEADER.size + max_size * (_LENGTH.size + slot_size))
+        self._owner_pid = os.getpid() # Forked processes get this object without pickling, so the pid tells them apart
+        _HEADER.pack_into(self._memory.buf, 0, 0, 0)
+
+    def __getstate__(self):
+        return {
+            "name": self._memory.name,
+            "max_size": self._max_size,
+            "slot_size": self._slot_size,
+            "raise_errors_on_empty_op": self._raise_errors_on_empty_op,
+            "lock": self._lock,
+        }
+
+    def __setstate__(self, state):
+        self._max_size = state["max_size"]
+        self._slot_size = state["slot_size"]
+        self._raise_errors_on_empty_op = state["raise_errors_on_empty_op"]
+        self._lock = state["lock"]
+        self._memory = SharedMemory(name=state["name"])
+        self._owner_pid = None
+
+    def __repr__(self):
+        return f"SharedQueue{list(self)}"
+
+    def __iter__(self):
+        # Iterates over a copy, so other processes can keep using the queue
+        with self._lock:
+            head, size = _HEADER.unpack_from(self._memory.buf, 0)
+            return iter([self._read(head + i) for i in range(size)])
+
+    def __len__(self):
+        return self.size()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def push(self, item: bytes | bytearray | memoryview):
+        """
+        Copies a bytes-like item to the tail of the queue.
+
+        Raises `QueueIsFullError` if size of the queue equals `max_size`
+        and `ValueError` if the item is longer than `slot_size`.
+        """
+        self.push_many((item,))
+
+    def pop(self) -> bytes | None:
+        """
+        Removes and returns the item from the head of the queue.
+
+        Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
+        """
+        items = self.pop_many(1)
+        if len(items) == 0:
+            if self._raise_errors_on_empty_op:
+                raise QueueIsEmptyError("Cannot pop from an empty queue.")
+            return None
+        return items[0]
+
+    def peek(self) -> bytes | None:
+        """
+        Returns the item from the head without removing it.
+
+        Returns `None`/raises `QueueIsEmptyError` if queue is empty, depending on `raise_errors_on_empty_op`.
+        """
+        with self._lock:
+            head, size = _HEADER.unpack_from(self._memory.buf, 0)
+            if size == 0:
+                if self._raise_errors_on_empty_op:
+                    raise QueueIsEmptyError("Cannot peek from an empty queue")
+                return None
+            return self._read(head)
+
+    def push_many(self, iterable: Iterable[bytes | bytearray | memoryview]):
+        """
+        Copies all items of the iterable to the tail of the queue, in order, under one lock.
+
+        Raises `QueueIsFullError` and pushes nothing if there is no place for all of them
+        and `ValueError` if an item is longer than `slot_size`.
+        """
+        items = [memoryview(item).cast("B") for item in iterable] # Lengths in bytes, whatever the format of the item
+        for item in items:
+            if len(item) > self._slot_size:
+                raise ValueError(f"Item of {len(item)} bytes doesn't fit into a slot of {self._slot_size} bytes.")
+
+        with self._lock:
+            head, size = _HEADER.unpack_from(self._memory.buf, 0)
+            if size + len(items) > self._max_size:
+                raise QueueIsFullError("Cannot push to a full queue.")
+            for i, item in enumerate(items):
+                start = self._slot_start(head + size + i)
+                _LENGTH.pack_into(self._memory.buf, start, len(item))
+                self._memory.buf[start + _LENGTH.size:start + _LENGTH.size + len(item)] = item
+            _HEADER.pack_into(self._memory.buf, 0, head, size + len(items))
+
+    def pop_many(self, n: int) -> list[bytes]:
+        """
+        Removes and returns up to `n` items from the head of the queue as a list, head first, under one lock.
+        Returns fewer items (an empty list if the queue is empty) instead of raising.
+        """
+        with self._lock:
+            head, size = _HEADER.unpack_from(self._memory.buf, 0)
+            count = max(0, min(n, size))
+            items = [self._read(head + i) for i in range(count)]
+            _HEADER.pack_into(self._memory.buf, 0, (head + count) % self._max_size, size - count)
+            return items
+
+    def drain(self) -> list[bytes]:
+        """Removes and returns all items of the queue as a list, head first."""
+        return self.pop_many(self._max_size)
+
+    def size(self) -> int:
+        """Returns the size of the queue."""
+        with self._lock:
+            return _HEADER.unpack_from(self._memory.buf, 0)[1]
+
+    def is_empty(self) -> bool:
+        """Returns `True` if the queue is empty, otherwise `False`."""
+        return self.size() == 0
+
+    def is_full(self) -> bool:
+        """Returns `True` if the queue is full, otherwise `False`."""
+        return self.size() >= self._max_size
+
+    def close(self):
+        """Detaches from the shared memory, and frees it if this process created the queue."""
+        self._memory.close()
+        if self._owner_pid == os.getpid():
+            self._memory.unlink()
+            self._owner_pid = None
+
+
+    def _slot_start(self, index: int) -> int:
+        """Returns the offset of the slot of the item with the given index (before wrapping around)."""
+        return _HEADER.size + (index % self._max_size) * (_LENGTH.size + self._slot_size)
+
+    def _read(self, index: int) -> bytes:
+        """Returns a copy of the item with the given index (before wrapping around). Requires the lock."""
+        start = self._slot_start(index) + _LENGTH.size
+        (length,) = _LENGTH.unpack_from(self._memory.buf, start - _LENGTH.size)
+        return bytes(self._memory.buf[start:start + length])
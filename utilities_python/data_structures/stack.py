@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -23,6 +24,15 @@ class Stack:
         Removes and returns the item on top of the stack.
         Returns `None`/raises `StackIsEmptyError` if stack is empty, depending on `raise_errors_on_empty_op`.
 
+    - push_many(iterable)
+        Puts all items of the iterable on top of the stack, in order.
+
+    - pop_many(n) -> list
+        Removes and returns up to `n` items from the top of the stack as a list.
+
+    - drain -> list
+        Removes and returns all items of the stack as a list.
+
     - peek -> Any | None
         Returns the item on top without removing it.
         Returns `None`/raises `StackIsEmptyError` if stack is empty, depending on `raise_errors_on_empty_op`.
@@ -39,7 +49,8 @@ class Stack:
     Raises
     ------
     - StackIsFullError
-        If `max_size` is set and `push` is performed when size of the stack equals `max_size`.
+        If `max_size` is set and `push` is performed when size of the stack equals `max_size`
+        or `push_many` is performed with more items than there is place for.
 
     - StackIsEmptyError
         If `raise_errors_on_empty_op` is set to `True` and `peek`/`pop` is performed on an empty stack.
@@ -108,6 +119,37 @@ class Stack:
         item = self._items.pop(-1)
         return item
 
+    def push_many(self, iterable: Iterable):
+        """
+        Puts all items of the iterable on top of the stack, in order (the last one ends up on top).
+        Checks the size once and adds the items with a single `extend`.
+
+        Raises `StackIsFullError` and pushes nothing if `max_size` is set and there is no place for all of them.
+        """
+        items = list(iterable)
+        if self._max_size != None and self.size() + len(items) > self._max_size:
+            raise StackIsFullError("Cannot push more items than there is place for in the stack.")
+        self._items.extend(items)
+
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns up to `n` items from the top of the stack as a list, top first.
+        Returns fewer items (an empty list if the stack is empty) instead of raising.
+        """
+        count = max(0, min(n, len(self._items)))
+        if count == 0:
+            return []
+        items = self._items[-count:]
+        del self._items[-count:]
+        items.reverse()
+        return items
+
+    def drain(self) -> list:
+        """Removes and returns all items of the stack as a list, top first."""
+        items = self._items[::-1]
+        self._items.clear()
+        return items
+
     def peek(self) -> Any | None:
         """
         Returns the item on top without removing it.
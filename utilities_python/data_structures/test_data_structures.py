@@ -1,3 +1,7 @@
+import asyncio
+import multiprocessing
+import threading
+import time
 import unittest
 
 from utilities_python.data_structures.stack import Stack, StackIsEmptyError, StackIsFullError
@@ -6,8 +10,12 @@ from utilities_python.data_structures.linked_list import LinkedList, LListIsEmpt
 from utilities_python.data_structures.llqueue import LLQueue, LLQueueIsEmptyError, LLQueueIsFullError
 from utilities_python.data_structures.binary_tree import BinaryTree, ValueAlreadyInBinaryTreeError
 from utilities_python.data_structures.hashmap import HashMap, HashMapIsFullError
+from utilities_python.data_structures.heap import Heap, HeapIsEmptyError, HeapIsFullError
 from utilities_python.data_structures.trie import Trie
 from utilities_python.data_structures.red_black_tree import RedBlackTree, ValueAlreadyInRedBlackTreeError
+from utilities_python.data_structures.blocking import BlockingLLQueue, BlockingQueue, BlockingStack, SPSCQueue
+from utilities_python.data_structures.asynchronous import AsyncIsClosedError, AsyncQueue, AsyncStack
+from utilities_python.data_structures.shared_queue import SharedQueue
 
 
 class Node:
@@ -21,6 +29,15 @@ class Node:
         return self.val == node.val
 
 
+def produce_shared(queue: SharedQueue, count: int):
+    """Pushes `count` numbered items into the queue from another process."""
+    for i in range(count):
+        while queue.is_full():
+            pass
+        queue.push(str(i).encode())
+    queue.close()
+
+
 class TestStack(unittest.TestCase):
     def test__data_structures__stack__push(self):
         stack = Stack()
@@ -90,6 +107,24 @@ class TestStack(unittest.TestCase):
         self.assertEqual(check, True)
 
 
+    def test__data_structures__stack__push_many_pop_many(self):
+        stack = Stack(max_size=5)
+        stack.push(Node(1))
+        stack.push_many([Node(2), Node(3), Node(4)])
+        self.assertEqual(repr(stack), "Stack[Node(4), Node(3), Node(2), Node(1)]")
+        self.assertEqual(stack.pop_many(2), [Node(4), Node(3)])
+        self.assertEqual(stack.pop_many(0), [])
+        self.assertEqual(stack.drain(), [Node(2), Node(1)])
+        self.assertEqual(stack.pop_many(3), [])
+
+    def test__data_structures__stack__push_many_on_full__exception(self):
+        stack = Stack(max_size=3)
+        stack.push(1)
+        with self.assertRaises(StackIsFullError):
+            stack.push_many([2, 3, 4])
+        self.assertEqual(stack.size(), 1)
+
+
 class TestQueue(unittest.TestCase):
     def test__data_structures__queue__push(self):
         queue = Queue()
@@ -158,6 +193,191 @@ class TestQueue(unittest.TestCase):
         check = queue.is_full()
         self.assertEqual(check, True)
 
+    def test__data_structures__queue__wrap_around(self):
+        queue = Queue(max_size=3)
+        for i in range(10):
+            queue.push(i)
+            if queue.is_full():
+                self.assertEqual(queue.pop(), i - 2)
+        self.assertEqual(list(queue), [8, 9])
+        self.assertEqual(len(queue._slots), 3)
+
+    def test__data_structures__queue__grow(self):
+        queue = Queue()
+        for i in range(5):
+            queue.push(i)
+        queue.pop()
+        queue.pop()
+        for i in range(5, 100):
+            queue.push(i)
+        self.assertEqual(len(queue), 98)
+        self.assertEqual([queue.pop() for _ in range(98)], list(range(2, 100)))
+        self.assertEqual(queue.pop(), None)
+
+    def test__data_structures__queue__eq(self):
+        first, second = Queue(), Queue(max_size=5)
+        for i in range(4):
+            first.push(i)
+            second.push(i)
+        second.pop()
+        second.push(4)
+        self.assertNotEqual(first, second)
+        first.pop()
+        first.push(4)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, [1, 2, 3, 4])
+
+    def test__data_structures__queue__iter(self):
+        queue = Queue()
+        queue.push(Node(1))
+        queue.push(Node(2))
+        self.assertEqual(list(queue), [Node(1), Node(2)])
+        self.assertEqual(list(queue), [Node(1), Node(2)])
+
+
+    def test__data_structures__queue__push_many_pop_many(self):
+        queue = Queue(max_size=5)
+        queue.push_many(range(4))
+        self.assertEqual(queue.pop_many(3), [0, 1, 2])
+        queue.push_many([4, 5, 6, 7]) # Wraps around the end of the buffer
+        self.assertEqual(list(queue), [3, 4, 5, 6, 7])
+        self.assertEqual(queue.pop_many(4), [3, 4, 5, 6])
+        self.assertEqual(queue.drain(), [7])
+        self.assertEqual(queue.pop_many(1), [])
+        self.assertEqual(queue._slots, [None] * 5)
+
+    def test__data_structures__queue__shrink(self):
+        queue = Queue()
+        queue.push_many(range(1000))
+        self.assertEqual(len(queue._slots), 1000)
+        self.assertEqual([queue.pop() for _ in range(990)], list(range(990)))
+        self.assertLess(len(queue._slots), 64)
+        self.assertEqual(list(queue), list(range(990, 1000)))
+        queue.drain()
+        self.assertEqual(len(queue._slots), 8)
+        bounded = Queue(max_size=100)
+        bounded.push_many(range(100))
+        bounded.drain()
+        self.assertEqual(len(bounded._slots), 100)
+
+    def test__data_structures__queue__push_many_grow(self):
+        queue = Queue()
+        queue.push(0)
+        queue.push_many(range(1, 100))
+        self.assertEqual(queue.drain(), list(range(100)))
+        queue.push_many([])
+        self.assertEqual(queue.is_empty(), True)
+
+    def test__data_structures__queue__push_many_on_full__exception(self):
+        queue = Queue(max_size=3)
+        queue.push(1)
+        with self.assertRaises(QueueIsFullError):
+            queue.push_many([2, 3, 4])
+        self.assertEqual(list(queue), [1])
+
+
+class TestHeap(unittest.TestCase):
+    def test__data_structures__heap__push_pop(self):
+        heap = Heap()
+        for i in [5, 3, 8, 1, 9, 2]:
+            heap.push(i)
+        self.assertEqual([heap.pop() for _ in range(6)], [1, 2, 3, 5, 8, 9])
+
+    def test__data_structures__heap__reverse(self):
+        heap = Heap(key=lambda node: node.val, reverse=True)
+        for i in [5, 3, 8, 1]:
+            heap.push(Node(i))
+        self.assertEqual([heap.pop() for _ in range(4)], [Node(8), Node(5), Node(3), Node(1)])
+
+    def test__data_structures__heap__equal_keys_in_push_order(self):
+        heap = Heap(key=lambda pair: pair[0])
+        for pair in [(1, "a"), (0, "b"), (1, "c"), (0, "d"), (1, "e")]:
+            heap.push(pair)
+        self.assertEqual([heap.pop()[1] for _ in range(5)], ["b", "d", "a", "c", "e"])
+
+    def test__data_structures__heap__peek(self):
+        heap = Heap()
+        heap.push(2)
+        heap.push(1)
+        self.assertEqual(heap.peek(), 1)
+        self.assertEqual(heap.size(), 2)
+
+    def test__data_structures__heap__pushpop(self):
+        heap = Heap(max_size=2)
+        heap.push(3)
+        heap.push(5)
+        self.assertEqual(heap.pushpop(1), 1)
+        self.assertEqual(heap.pushpop(4), 3)
+        self.assertEqual([heap.pop(), heap.pop()], [4, 5])
+
+    def test__data_structures__heap__decrease_key(self):
+        heap = Heap(key=lambda task: task[1])
+        heap.push(("a", 1))
+        entry = heap.push(("b", 5))
+        heap.push(("c", 3))
+        heap.decrease_key(entry, 0)
+        self.assertEqual(heap.pop(), ("b", 5))
+        with self.assertRaises(ValueError):
+            heap.decrease_key(entry, -1)
+
+    def test__data_structures__heap__decrease_key_backwards__exception(self):
+        heap = Heap()
+        entry = heap.push(1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(entry, 2)
+
+    def test__data_structures__heap__heapify(self):
+        heap = Heap()
+        heap.push(4)
+        heap.heapify([7, 1, 9, 3, 3, 0])
+        self.assertEqual([heap.pop() for _ in range(7)], [0, 1, 3, 3, 4, 7, 9])
+
+    def test__data_structures__heap__d_ary(self):
+        heap = Heap(arity=4)
+        nums = [(i * 37) % 101 for i in range(101)]
+        heap.heapify(nums[:50])
+        for num in nums[50:]:
+            heap.push(num)
+        self.assertEqual([heap.pop() for _ in range(101)], list(range(101)))
+
+    def test__data_structures__heap__push_on_full__exception(self):
+        heap = Heap(max_size=1)
+        heap.push(1)
+        with self.assertRaises(HeapIsFullError):
+            heap.push(2)
+        with self.assertRaises(HeapIsFullError):
+            heap.heapify([2])
+
+    def test__data_structures__heap__pop_on_empty__exception(self):
+        heap = Heap(raise_errors_on_empty_op=True)
+        with self.assertRaises(HeapIsEmptyError):
+            heap.pop()
+        with self.assertRaises(HeapIsEmptyError):
+            heap.peek()
+
+    def test__data_structures__heap__pop_on_empty(self):
+        heap = Heap()
+        self.assertEqual(heap.pop(), None)
+        self.assertEqual(heap.peek(), None)
+
+    def test__data_structures__heap__is_empty_is_full(self):
+        heap = Heap(max_size=1)
+        self.assertEqual((heap.is_empty(), heap.is_full()), (True, False))
+        heap.push(1)
+        self.assertEqual((heap.is_empty(), heap.is_full()), (False, True))
+
+
+    def test__data_structures__heap__key_spec(self):
+        heap = Heap(key="val", reverse=True)
+        heap.heapify([Node(3), Node(9), Node(1)])
+        self.assertEqual([heap.pop(), heap.pop(), heap.pop()], [Node(9), Node(3), Node(1)])
+        heap = Heap(key=("rank", "name"))
+        for task in [{"rank": 2, "name": "b"}, {"rank": 1, "name": "z"}, {"rank": 2, "name": "a"}]:
+            heap.push(task)
+        self.assertEqual([heap.pop()["name"] for _ in range(3)], ["z", "a", "b"])
+        with self.assertRaises(TypeError):
+            Heap(key=1.5)
+
 
 class TestLinkedList(unittest.TestCase):
     def test__data_structures__llist__push_to_tail(self):
@@ -237,6 +457,21 @@ class TestLinkedList(unittest.TestCase):
         self.assertEqual(check, True)
 
 
+    def test__data_structures__llist__add_many_pop_many(self):
+        llist = LinkedList(max_size=5)
+        llist.add_to_tail(Node(1))
+        llist.add_many_to_tail([Node(2), Node(3), Node(4)])
+        self.assertEqual(repr(llist), "[Node(1) -> Node(2) -> Node(3) -> Node(4)]")
+        self.assertEqual(llist.pop_many_from_head(2), [Node(1), Node(2)])
+        self.assertEqual(llist.drain(), [Node(3), Node(4)])
+        self.assertEqual(llist.is_empty(), True)
+        llist.add_many_to_tail([Node(5)])
+        self.assertEqual(repr(llist), "[Node(5)]")
+        with self.assertRaises(LListIsFullError):
+            llist.add_many_to_tail(Node(i) for i in range(5))
+        self.assertEqual(llist.size(), 1)
+
+
 class TestLLQueue(unittest.TestCase):
     def test__data_structures__llqueue__push(self):
         llist = LLQueue()
@@ -308,6 +543,32 @@ class TestLLQueue(unittest.TestCase):
         self.assertEqual(check, True)
 
 
+    def test__data_structures__llqueue__eq(self):
+        first, second = LLQueue(), LLQueue(max_size=5)
+        first.push_many([Node(1), Node(2)])
+        second.push_many([Node(1), Node(3)])
+        self.assertNotEqual(first, second)
+        second.pop()
+        second.pop()
+        second.push_many([Node(1), Node(2)])
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, [Node(1), Node(2)])
+
+    def test__data_structures__llqueue__push_many_pop_many(self):
+        llqueue = LLQueue(max_size=5)
+        llqueue.push(Node(1))
+        llqueue.push_many([Node(2), Node(3), Node(4)])
+        self.assertEqual(repr(llqueue), "LLQueue[Node(1) <- Node(2) <- Node(3) <- Node(4)]")
+        self.assertEqual(llqueue.pop_many(3), [Node(1), Node(2), Node(3)])
+        self.assertEqual(llqueue.drain(), [Node(4)])
+        self.assertEqual(llqueue.pop_many(1), [])
+        llqueue.push_many([Node(5), Node(6)])
+        self.assertEqual(repr(llqueue), "LLQueue[Node(5) <- Node(6)]")
+        with self.assertRaises(LLQueueIsFullError):
+            llqueue.push_many([Node(7)] * 4)
+        self.assertEqual(llqueue.size(), 2)
+
+
 class TestBinaryTree(unittest.TestCase):
     def test__data_structures__binary_tree__inorder(self):
         bt = BinaryTree()
@@ -461,3 +722,304 @@ class TestTrie(unittest.TestCase):
     def test__data_structures__trie__exists(self):
         self.assertEqual(self.trie.exists("bone"), True)
         self.assertEqual(self.trie.exists("skull"), False)
+
+
+class TestBlocking(unittest.TestCase):
+    def test__data_structures__blocking__same_as_base(self):
+        queue, stack, llqueue = BlockingQueue(), BlockingStack(), BlockingLLQueue()
+        for structure in [queue, stack, llqueue]:
+            structure.push(1)
+            structure.push("two")
+            structure.push(3)
+        self.assertEqual(repr(queue), "BlockingQueue[1, 'two', 3]")
+        self.assertEqual(repr(stack), "BlockingStack[3, 'two', 1]")
+        self.assertEqual(repr(llqueue), "BlockingLLQueue[1 <- two <- 3]")
+        self.assertEqual([queue.pop(), stack.pop(), llqueue.pop()], [1, 3, 1])
+        self.assertEqual([queue.peek(), stack.peek(), llqueue.peek()], ["two", "two", "two"])
+        self.assertEqual([len(queue), stack.size(), llqueue.size()], [2, 2, 2])
+        self.assertNotEqual(llqueue, BlockingLLQueue())
+        other = BlockingLLQueue()
+        other.push_many(["two", 3])
+        self.assertEqual(llqueue, other)
+
+    def test__data_structures__blocking__pop_timeout(self):
+        for structure in [BlockingQueue(), BlockingStack(), BlockingLLQueue()]:
+            start = time.monotonic()
+            self.assertEqual(structure.pop(timeout=0.05), None)
+            self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test__data_structures__blocking__pop_timeout__exception(self):
+        errors = [QueueIsEmptyError, StackIsEmptyError, LLQueueIsEmptyError]
+        for structure, error in zip([BlockingQueue, BlockingStack, BlockingLLQueue], errors):
+            with self.assertRaises(error):
+                structure(raise_errors_on_empty_op=True).pop(timeout=0)
+
+    def test__data_structures__blocking__push_timeout__exception(self):
+        errors = [QueueIsFullError, StackIsFullError, LLQueueIsFullError]
+        for structure, error in zip([BlockingQueue, BlockingStack, BlockingLLQueue], errors):
+            full = structure(max_size=1)
+            full.push(1)
+            with self.assertRaises(error):
+                full.push(2, timeout=0.01)
+
+    def test__data_structures__blocking__try(self):
+        queue = BlockingQueue(max_size=1)
+        self.assertEqual(queue.try_pop(), None)
+        self.assertEqual(queue.try_push(1), True)
+        self.assertEqual(queue.try_push(2), False)
+        self.assertEqual(queue.try_pop(), 1)
+
+    def test__data_structures__blocking__pop_waits_for_push(self):
+        queue = BlockingQueue()
+        threading.Timer(0.05, queue.push, args=(Node(1),)).start()
+        self.assertEqual(queue.pop(timeout=5), Node(1))
+
+    def test__data_structures__blocking__push_waits_for_pop(self):
+        stack = BlockingStack(max_size=1)
+        stack.push(1)
+        threading.Timer(0.05, stack.pop).start()
+        stack.push(2, timeout=5)
+        self.assertEqual(stack.pop(), 2)
+
+    def test__data_structures__blocking__producers_consumers(self):
+        queue = BlockingLLQueue(max_size=4)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for i in range(start, start + 500):
+                queue.push(i)
+
+        def consume():
+            for _ in range(500):
+                item = queue.pop(timeout=5)
+                with lock:
+                    results.append(item)
+
+        threads = [threading.Thread(target=produce, args=(i * 500,)) for i in range(3)]
+        threads += [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), list(range(1500)))
+        self.assertEqual(queue.is_empty(), True)
+
+
+    def test__data_structures__blocking__push_many_pop_many(self):
+        queue = BlockingQueue(max_size=4)
+        results = []
+
+        def consume():
+            while len(results) < 999:
+                results.extend(queue.pop_many(2, timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(0, 999, 3):
+            queue.push_many(range(i, i + 3), timeout=5) # Waits for place for the whole batch
+        consumer.join()
+        self.assertEqual(results, list(range(999)))
+        self.assertEqual(queue.drain(), [])
+        self.assertEqual(queue.pop_many(2, timeout=0), [])
+
+    def test__data_structures__blocking__push_many_all_or_nothing(self):
+        queue = BlockingQueue(max_size=2)
+        with self.assertRaises(QueueIsFullError):
+            queue.push_many([1, 2, 3], timeout=0)
+        self.assertEqual(queue.size(), 0)
+        queue.push(1)
+        with self.assertRaises(QueueIsFullError):
+            queue.push_many([2, 3], timeout=0.01)
+        self.assertEqual(list(queue), [1])
+
+        # A single freed place doesn't wake the batch up for good, a second one lets it in
+        pusher = threading.Thread(target=queue.push_many, args=([2, 3],), kwargs={"timeout": 5})
+        queue.push(2)
+        pusher.start()
+        time.sleep(0.01)
+        self.assertEqual(queue.pop(), 1)
+        time.sleep(0.01)
+        self.assertEqual(list(queue), [2])
+        self.assertEqual(queue.pop(), 2)
+        pusher.join()
+        self.assertEqual(queue.drain(), [2, 3])
+
+
+class TestSPSCQueue(unittest.TestCase):
+    def test__data_structures__spsc_queue__push_pop(self):
+        queue = SPSCQueue(max_size=2)
+        queue.push(Node(1))
+        queue.push(Node(2))
+        self.assertEqual(repr(queue), "SPSCQueue[Node(1), Node(2)]")
+        self.assertEqual(queue.is_full(), True)
+        self.assertEqual(queue.try_push(Node(3)), False)
+        self.assertEqual(queue.pop(), Node(1))
+        self.assertEqual(queue.try_push(Node(3)), True)
+        self.assertEqual([queue.pop(), queue.try_pop(), queue.try_pop()], [Node(2), Node(3), None])
+        self.assertEqual(queue.is_empty(), True)
+
+    def test__data_structures__spsc_queue__timeouts(self):
+        queue = SPSCQueue(max_size=1, raise_errors_on_empty_op=True)
+        with self.assertRaises(QueueIsEmptyError):
+            queue.pop(timeout=0.01)
+        queue.push(1)
+        with self.assertRaises(QueueIsFullError):
+            queue.push(2, timeout=0.01)
+        self.assertEqual(SPSCQueue(max_size=1).pop(timeout=0), None)
+
+    def test__data_structures__spsc_queue__size__exception(self):
+        with self.assertRaises(ValueError):
+            SPSCQueue(max_size=0)
+
+    def test__data_structures__spsc_queue__threads(self):
+        queue = SPSCQueue(max_size=8)
+        results = []
+
+        def consume():
+            for _ in range(5000):
+                results.append(queue.pop(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(5000):
+            queue.push(i, timeout=5)
+        consumer.join()
+        self.assertEqual(results, list(range(5000)))
+
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+    async def test__data_structures__async_queue__push_pop(self):
+        queue = AsyncQueue(max_size=2)
+        await queue.push(Node(1))
+        await queue.push(Node(2))
+        self.assertEqual(repr(queue), "AsyncQueue[Node(1), Node(2)]")
+        self.assertEqual(queue.try_push(Node(3)), False)
+        self.assertEqual(await queue.pop(), Node(1))
+        self.assertEqual(queue.try_push(Node(3)), True)
+        self.assertEqual([await queue.pop(), queue.try_pop(), queue.try_pop()], [Node(2), Node(3), None])
+
+    async def test__data_structures__async_stack__push_pop(self):
+        stack = AsyncStack(max_size=2)
+        await stack.push(Node(1))
+        await stack.push(Node(2))
+        self.assertEqual(repr(stack), "AsyncStack[Node(2), Node(1)]")
+        self.assertEqual([await stack.pop(), await stack.pop()], [Node(2), Node(1)])
+
+    async def test__data_structures__async__timeouts(self):
+        queue = AsyncQueue(max_size=1, raise_errors_on_empty_op=True)
+        with self.assertRaises(QueueIsEmptyError):
+            await queue.pop(timeout=0.01)
+        await queue.push(1)
+        with self.assertRaises(QueueIsFullError):
+            await queue.push(2, timeout=0.01)
+        stack = AsyncStack(max_size=1)
+        self.assertEqual(await stack.pop(timeout=0), None)
+        await stack.push(1)
+        with self.assertRaises(StackIsFullError):
+            await stack.push(2, timeout=0)
+        self.assertEqual(await stack.pop_many(3, timeout=0), [1])
+        self.assertEqual(await stack.pop_many(3, timeout=0), [])
+
+    async def test__data_structures__async__backpressure(self):
+        queue = AsyncQueue(max_size=2)
+        pushed = []
+
+        async def produce():
+            for i in range(5):
+                await queue.push(i)
+                pushed.append(i)
+
+        producer = asyncio.create_task(produce())
+        await asyncio.sleep(0.01)
+        self.assertEqual(pushed, [0, 1])
+        self.assertEqual(await queue.pop(), 0)
+        await asyncio.sleep(0.01)
+        self.assertEqual(pushed, [0, 1, 2])
+        self.assertEqual(await queue.pop_many(10), [1, 2])
+        await producer
+        self.assertEqual(queue.is_full(), True)
+
+    async def test__data_structures__async__pop_waits(self):
+        stack = AsyncStack()
+        consumer = asyncio.create_task(stack.pop_many(3))
+        await asyncio.sleep(0.01)
+        self.assertEqual(consumer.done(), False)
+        await stack.push(1)
+        self.assertEqual(await consumer, [1])
+
+    async def test__data_structures__async__async_for(self):
+        queue = AsyncQueue(max_size=3)
+        results = []
+
+        async def consume():
+            async for item in queue:
+                results.append(item)
+
+        consumers = [asyncio.create_task(consume()) for _ in range(3)]
+        for i in range(100):
+            await queue.push(i)
+        queue.close()
+        await asyncio.gather(*consumers)
+        self.assertEqual(sorted(results), list(range(100)))
+        self.assertEqual(queue.is_closed(), True)
+        with self.assertRaises(AsyncIsClosedError):
+            await queue.push(100)
+
+    async def test__data_structures__async__close_wakes_waiters(self):
+        queue = AsyncQueue()
+        consumer = asyncio.create_task(queue.pop())
+        await asyncio.sleep(0.01)
+        queue.close()
+        self.assertEqual(await consumer, None)
+
+    async def test__data_structures__async__cancel(self):
+        queue = AsyncQueue()
+        cancelled = asyncio.create_task(queue.pop())
+        waiting = asyncio.create_task(queue.pop())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await queue.push(1)
+        self.assertEqual(await waiting, 1)
+        self.assertEqual(cancelled.cancelled(), True)
+
+    async def test__data_structures__async__push_many_drain(self):
+        stack = AsyncStack(max_size=3)
+        await stack.push(0)
+        producer = asyncio.create_task(stack.push_many([1, 2, 3]))
+        await asyncio.sleep(0.01)
+        self.assertEqual(stack.size(), 1)
+        self.assertEqual(stack.drain(), [0])
+        await producer
+        self.assertEqual(await stack.pop_many(5), [3, 2, 1])
+
+    async def test__data_structures__async__push_many_all_or_nothing(self):
+        queue = AsyncQueue(max_size=2)
+        with self.assertRaises(QueueIsFullError):
+            await queue.push_many([1, 2, 3])
+        await queue.push(1)
+        with self.assertRaises(QueueIsFullError):
+            await queue.push_many([2, 3], timeout=0.01)
+        self.assertEqual(list(queue), [1])
+
+        # The batch waits for both places, a single push waiting behind it still gets the first one
+        await queue.push(2)
+        batch = asyncio.create_task(queue.push_many([3, 4]))
+        single = asyncio.create_task(queue.push(5))
+        await asyncio.sleep(0.01)
+        self.assertEqual(queue.try_pop(), 1)
+        await single
+        self.assertEqual(batch.done(), False)
+        self.assertEqual(queue.drain(), [2, 5])
+        await batch
+        self.assertEqual(queue.drain(), [3, 4])
+
+    def test__data_structures__shared_queue__spawn_context(self):
+        context = multiprocessing.get_context("spawn")
+        with SharedQueue(max_size=4, slot_size=8, context=context) as queue:
+            producer = context.Process(target=produce_shared, args=(queue, 100))
+            producer.start()
+            results = []
+            while len(results) < 100:
+                results.extend(queue.drain())
+            producer.join()
+            self.assertEqual(results, [str(i).encode() for i in range(100)])
@@ -0,0 +1,177 @@
+from collections.abc import Iterable
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from random import Random
+import os
+from utilities_python.shuffle import _get_rng, _inner_shuffle
+
+
+_PARALLEL_CUTOFF = 100_000
+_PART_SIZE = 16_384 # Smallest average size of a part
+_MAX_PARTS = 256 # Bucket of an item is a single random byte, so there can't be more buckets than byte values
+
+
+def parallel_shuffle(iterable: Iterable, rng: Random | int | str | None = None, workers: int | None = None) -> list:
+    """
+    Shuffles a copy of the iterable using several processes and returns it as a list.
+
+    Only a permutation of indexes is built in the workers (see `parallel_permutation`), so the items don't have to be
+    picklable. The same seed gives the same order for any amount of workers.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable to be shuffled.
+    - rng : Random | int | str, optional
+        `random.Random` instance to draw the seed of the shuffle from, or a seed to create one with.
+        (default = None, shared generator of the `random` module, so `random.seed` applies)
+    - workers : int, optional
+        Amount of worker processes. Uses the amount of CPUs if not set.
+        (default = None)
+
+    Returns
+    -------
+    - list
+        A shuffled *copy* of the iterable.
+    """
+
+    items = list(iterable)
+    return [items[i] for i in parallel_permutation(len(items), rng, workers)]
+
+def parallel_permutation(size: int, rng: Random | int | str | None = None, workers: int | None = None) -> array:
+    """
+    Returns a uniformly random permutation of `range(size)` as an int64 `array`, built by several processes.
+
+    Bucket scatter shuffle: every index is sent to one of up to 256 buckets picked uniformly at random,
+    then every bucket is shuffled with Fisher-Yates and the buckets are put one after another.
+    Both steps are split into parts with their own generators seeded from `rng` and the part number,
+    and the parts are written straight into shared memory. The amount of parts only depends on `size`,
+    so the result doesn't depend on the amount of workers. Sizes below 100 000 are shuffled in the main process.
+
+    Parameters
+    ----------
+    - size : int
+        Amount of indexes.
+    - rng : Random | int | str, optional
+        `random.Random` instance to draw the seed of the shuffle from, or a seed to create one with.
+        (default = None, shared generator of the `random` module, so `random.seed` applies)
+    - workers : int, optional
+        Amount of worker processes. Uses the amount of CPUs if not set.
+        (default = None)
+
+    Returns
+    -------
+    - array
+        `array("q")` with every index from 0 to `size - 1` exactly once.
+    """
+
+    rng = _get_rng(rng)
+    seed = rng.getrandbits(64)
+    workers = workers or os.cpu_count() or 1
+
+    parts = 1
+    while parts * 2 <= min(_MAX_PARTS, size // _PART_SIZE):
+        parts *= 2
+    step = max(1, -(-size // parts))
+    bounds = [(start, min(start + step, size)) for start in range(0, size, step)]
+
+    memory = SharedMemory(create=True, size=max(size * 8, 1))
+    try:
+        if workers == 1 or size < _PARALLEL_CUTOFF:
+            _inner_permutation(None, memory.name, seed, parts, bounds)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as executor:
+                _inner_permutation(executor, memory.name, seed, parts, bounds)
+
+        final = array("q")
+        final.frombytes(memory.buf[:size * 8])
+        return final
+    finally:
+        memory.close()
+        memory.unlink()
+
+def _inner_permutation(executor: Executor | None, name: str, seed: int, parts: int, bounds: list):
+    """
+    Inner function for parallel_permutation.
+
+    Runs the three steps of the shuffle on every part, in the executor or in this process if it's `None`:
+    counts how many indexes of each part go to each bucket, writes the indexes into their buckets
+    (each part into its own place inside the bucket) and shuffles every bucket.
+    """
+
+    def run_all(function, arguments: list) -> list:
+        if executor is None:
+            return [function(*args) for args in arguments]
+        futures = [executor.submit(function, *args) for args in arguments]
+        return [future.result() for future in futures]
+
+    counts = run_all(_count_part, [(seed, part, stop - start, parts) for part, (start, stop) in enumerate(bounds)])
+
+    # Bucket b starts after all smaller buckets, part p goes after the indexes of smaller parts in the same bucket
+    offsets = []
+    bucket_bounds = []
+    position = 0
+    for bucket in range(parts):
+        start = position
+        for part in range(len(bounds)):
+            if bucket == 0:
+                offsets.append([0] * parts)
+            offsets[part][bucket] = position
+            position += counts[part][bucket]
+        bucket_bounds.append((start, position))
+
+    run_all(_scatter_part, [(name, seed, part, start, stop, offsets[part]) for part, (start, stop) in enumerate(bounds)])
+    run_all(_shuffle_bucket, [(name, seed, bucket, start, stop) for bucket, (start, stop) in enumerate(bucket_bounds)])
+
+def _bucket_ids(seed: int, part: int, size: int, parts: int) -> bytes:
+    """
+    Inner function for parallel_permutation.
+
+    Returns the bucket of every index of the part as one random byte each. `parts` is a power of two up to 256,
+    so masking the bytes keeps them uniform.
+    """
+
+    ids = Random(f"{seed}/scatter/{part}").randbytes(size)
+    if parts == 256:
+        return ids
+    return ids.translate(bytes(value & (parts - 1) for value in range(256)))
+
+def _count_part(seed: int, part: int, size: int, parts: int) -> list[int]:
+    """Inner function for parallel_permutation, runs in a worker. Returns how many indexes of the part go to each bucket."""
+
+    ids = _bucket_ids(seed, part, size, parts)
+    return [ids.count(bucket) for bucket in range(parts)]
+
+def _scatter_part(name: str, seed: int, part: int, start: int, stop: int, offsets: list[int]):
+    """
+    Inner function for parallel_permutation, runs in a worker.
+
+    Writes the indexes from `start` to `stop` into their buckets in shared memory, starting at `offsets`.
+    """
+
+    parts = len(offsets)
+    positions = [array("q") for _ in range(parts)]
+    for index, bucket in enumerate(_bucket_ids(seed, part, stop - start, parts), start):
+        positions[bucket].append(index)
+
+    memory = SharedMemory(name=name)
+    try:
+        permutation = memory.buf.cast("q")
+        for bucket, indexes in enumerate(positions):
+            permutation[offsets[bucket]:offsets[bucket] + len(indexes)] = indexes
+        permutation.release()
+    finally:
+        memory.close()
+
+def _shuffle_bucket(name: str, seed: int, bucket: int, start: int, stop: int):
+    """Inner function for parallel_permutation, runs in a worker. Shuffles `permutation[start:stop]` in shared memory."""
+
+    memory = SharedMemory(name=name)
+    try:
+        indexes = array("q")
+        indexes.frombytes(memory.buf[start * 8:stop * 8])
+        _inner_shuffle(indexes, Random(f"{seed}/bucket/{bucket}"))
+        memory.buf[start * 8:stop * 8] = indexes.tobytes()
+    finally:
+        memory.close()
@@ -1,30 +1,170 @@
-from collections.abc import Iterable
-from random import randint
+from collections.abc import Iterable, MutableSequence
+from itertools import islice
+from math import exp, floor, log, log1p
+from random import Random
+from types import ModuleType
+import random
+from utilities_python._inplace import check_inplace
+from utilities_python.sorting import _numpy_backend
 
 
-def shuffle(iterable: Iterable) -> list:
+_END = object() # Returned by `next` when reservoir_sample runs out of items
+
+
+def shuffle(iterable: Iterable, rng: Random | int | str | None = None, backend: str = "python", inplace: bool = False) -> list | None:
     """
     Shuffles a copy of the iterable in place and returns it as a list.
 
-    Uses Fisher-Yates shuffle (complexity - O(n)).
+    Uses Fisher-Yates shuffle (complexity - O(n)). Random indexes are drawn with `getrandbits`,
+    the fastest way to get bounded integers out of `random.Random`.
 
     Parameters
     ----------
     - iterable : Iterable
         Iterable to be shuffled.
-    
+    - rng : Random | int | str, optional
+        `random.Random` instance to draw from, or a seed to create one with. The same seed always gives the same order.
+        (default = None, shared generator of the `random` module, so `random.seed` applies)
+    - backend : str, optional
+        Set to "numpy" to shuffle with `numpy.random.Generator.permutation` (requires NumPy), seeded from `rng`.
+        Faster on big iterables, but gives a different order than the Python backend for the same seed.
+        (default = "python")
+    - inplace : bool, optional
+        Set to True to shuffle a list, `array.array` or writable memoryview itself instead of a copy and return `None`.
+        Can't be combined with `backend="numpy"`.
+        (default = False)
+
     Returns
     -------
-    - list
-        A shuffled *copy* of the iterable.
+    - list | None
+        A shuffled *copy* of the iterable, or `None` if `inplace` is set.
     """
 
+    _numpy_backend.check_backend(backend, ("python", "numpy"))
+    rng = _get_rng(rng)
+
+    if inplace:
+        check_inplace(iterable, backend, "shuffle")
+        _inner_shuffle(iterable, rng)
+        return None
+
     iterable = list(iterable)
-    i = len(iterable)
+    if backend == "numpy":
+        generator = _numpy_backend.np.random.default_rng(rng.getrandbits(128)) # pyright: ignore[reportOptionalMemberAccess]
+        return [iterable[i] for i in generator.permutation(len(iterable)).tolist()]
+
+    _inner_shuffle(iterable, rng)
+    return iterable
+
+def _inner_shuffle(iterable: Iterable, rng: Random | ModuleType):
+    """
+    Inner function for shuffle.
+
+    Swaps every item with a random one before it (or itself). Indexes are drawn as `bit_length` random bits
+    and drawn again if they're too big, which is what `Random.randrange` does under several layers of checks.
+    """
+
+    getrandbits = rng.getrandbits
+    for i in range(len(iterable) - 1, 0, -1): # pyright: ignore[reportArgumentType]
+        bits = (i + 1).bit_length()
+        rnd = getrandbits(bits)
+        while rnd > i:
+            rnd = getrandbits(bits)
+        iterable[i], iterable[rnd] = iterable[rnd], iterable[i] # pyright: ignore[reportIndexIssue]
+
+def reservoir_sample(iterable: Iterable, k: int, rng: Random | int | str | None = None) -> list:
+    """
+    Returns `k` random items of the iterable (all of them if it's shorter) in no particular order.
+
+    Streams the iterable with Algorithm L: instead of drawing a random number for every item it computes how many
+    items to skip before the next one that goes into the sample (memory - O(k), random draws - O(k log(n/k))).
+    Works on unbounded generators as long as they end.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable to take the items from. Can be a generator.
+    - k : int
+        Amount of items to return.
+    - rng : Random | int | str, optional
+        `random.Random` instance to draw from, or a seed to create one with.
+        (default = None, shared generator of the `random` module, so `random.seed` applies)
+
+    Returns
+    -------
+    - list
+        `k` random items of the iterable.
+    """
+
+    rng = _get_rng(rng)
+    if k <= 0:
+        return []
+
+    iterator = iter(iterable)
+    sample = list(islice(iterator, k))
+    if len(sample) < k:
+        return sample
+
+    # `weight` is the biggest of k random numbers given to the items in the sample, the next item gets in
+    # if its own random number is smaller, which happens after a geometrically distributed amount of items
+    weight = exp(log(_random_open(rng)) / k)
+    while True:
+        skip = floor(log(_random_open(rng)) / log1p(-weight)) if weight < 1.0 else 0
+        item = next(islice(iterator, skip, None), _END)
+        if item is _END:
+            return sample
+        sample[rng.randrange(k)] = item
+        weight *= exp(log(_random_open(rng)) / k)
+
+def partial_shuffle(sequence: MutableSequence | memoryview, k: int, rng: Random | int | str | None = None):
+    """
+    Shuffles only the first `k` positions of a list, `array.array` or writable memoryview in place.
+
+    Afterwards `sequence[:k]` holds `k` random items in random order, the rest holds the other items
+    in no particular order (complexity - O(k)).
+
+    Parameters
+    ----------
+    - sequence : MutableSequence | memoryview
+        Sequence to shuffle.
+    - k : int
+        Amount of positions to shuffle (all of them if it's bigger than the sequence).
+    - rng : Random | int | str, optional
+        `random.Random` instance to draw from, or a seed to create one with.
+        (default = None, shared generator of the `random` module, so `random.seed` applies)
+    """
+
+    check_inplace(sequence, "python", "shuffle")
+    rng = _get_rng(rng)
+
+    size = len(sequence)
+    getrandbits = rng.getrandbits
+    for i in range(min(k, size - 1)):
+        # Swaps position i with a random position at or after it
+        bound = size - i - 1
+        bits = bound.bit_length()
+        rnd = getrandbits(bits)
+        while rnd > bound:
+            rnd = getrandbits(bits)
+        sequence[i], sequence[i + rnd] = sequence[i + rnd], sequence[i]
+
+def _get_rng(rng: Random | int | str | None) -> Random | ModuleType:
+    """
+    Inner function for the shuffles. Returns `rng` if it's a generator, the `random` module itself if it's `None`
+    (its functions draw from its shared generator, creating a new one per call would reseed it from the OS every time)
+    or a new generator seeded with it. Only `getrandbits`, `random` and `randrange` are used from the result.
+    """
+
+    if isinstance(rng, Random):
+        return rng
+    if rng == None:
+        return random
+    return Random(rng)
 
-    while i > 1:
-        i -= 1
-        rnd = randint(0, i)
-        iterable[i], iterable[rnd] = iterable[rnd], iterable[i]
+def _random_open(rng: Random | ModuleType) -> float:
+    """Inner function for reservoir_sample. Returns a random float in (0, 1), so it can be passed to `log`."""
 
-    return iterable
\ No newline at end of file
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
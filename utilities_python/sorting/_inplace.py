@@ -0,0 +1,18 @@
+from collections.abc import Callable
+from typing import Any
+from utilities_python._inplace import check_inplace as _check_inplace
+from utilities_python.sorting._keys import KeySpec, compile_key
+
+
+def check_inplace(sequence: Any, backend: str):
+    """Raises the errors of `utilities_python._inplace.check_inplace` if the sequence can't be sorted in place."""
+
+    _check_inplace(sequence, backend, "sort")
+
+def inplace_key(key: KeySpec, sequence: Any) -> Callable[[Any], Any] | None:
+    """
+    Returns the key function to call on every comparison of an in-place sort. Key specs are compiled with `compile_key`.
+    Stays `None` without a key, the inner functions of the sorts then compare the items themselves.
+    """
+
+    return compile_key(key, sequence[0] if len(sequence) > 0 else None)
@@ -0,0 +1,53 @@
+from collections.abc import Callable, Iterable, Mapping
+from operator import attrgetter, itemgetter
+from typing import Any, TypeAlias
+from utilities_python.sorting.stats import counting_records
+
+
+KeySpec: TypeAlias = Callable[[Any], Any] | str | int | tuple | None
+"""Accepted `key` of the sorts: a function, a field name/index, a tuple of them or `None` for the items themselves."""
+
+record_key = itemgetter(0)
+"""Returns the cached key of a record. Passed as `key` to the inner functions of the sorts."""
+
+
+def compile_key(key: KeySpec, item: Any = None) -> Callable[[Any], Any] | None:
+    """
+    Turns a key spec into a function, using `item` (any item of the sorted iterable) to pick the getter.
+
+    Functions are returned as they are and `None` (the items themselves) stays `None`. Field names become
+    `operator.attrgetter`, or `operator.itemgetter` if the item is a mapping. Indexes always become `itemgetter`.
+    A tuple of fields returns a tuple of their values.
+
+    Raises `TypeError` if the key is none of those.
+    """
+
+    if key is None or callable(key):
+        return key
+
+    fields = key if isinstance(key, tuple) else (key,)
+    if len(fields) == 0 or not all(isinstance(field, (str, int)) for field in fields):
+        raise TypeError("key has to be a function, a field name, an index or a tuple of them.")
+    if isinstance(item, Mapping) or all(isinstance(field, int) for field in fields):
+        return itemgetter(*fields)
+    return attrgetter(*fields) # pyright: ignore[reportArgumentType]
+
+def decorate(iterable: Iterable, key: KeySpec) -> list[tuple[Any, int, Any]]:
+    """
+    Evaluates `key` exactly once per item and returns a list of `(key, index, item)` records.
+    Without a key the item itself is used as its key and nothing is called.
+
+    The index makes sure that two records are never compared by their items, which keeps
+    heap based merges stable and allows items that don't support comparison.
+    """
+
+    if key is not None and not callable(key):
+        iterable = list(iterable)
+        key = compile_key(key, iterable[0] if len(iterable) > 0 else None)
+    if key is None:
+        return counting_records([(item, i, item) for i, item in enumerate(iterable)])
+    return counting_records([(key(item), i, item) for i, item in enumerate(iterable)])
+
+def undecorate(records: Iterable[tuple[Any, int, Any]]) -> list:
+    """Returns the items of the records as a list."""
+    return [record[2] for record in records]
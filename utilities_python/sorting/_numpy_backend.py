@@ -0,0 +1,97 @@
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+BACKENDS = ("auto", "python", "numpy")
+AUTO_MIN_SIZE = 256 # Shorter lists sort faster in Python than they are converted into an array
+
+
+def check_backend(backend: str, backends: tuple[str, ...] = BACKENDS):
+    """
+    Raises `ValueError` if the backend is unknown and `ImportError` if `backend="numpy"` is used without NumPy installed.
+    """
+
+    if backend not in backends:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {backends}.")
+    if backend == "numpy" and np is None:
+        raise ImportError("backend=\"numpy\" requires NumPy to be installed.")
+
+def use_numpy(backend: str, iterable: Any, key: Any, size: int) -> bool:
+    """
+    Returns `True` if the keys should be sorted with NumPy: always with `backend="numpy"`, and with `backend="auto"`
+    if NumPy is installed, the items are sorted by themselves or by a field (not by a key function)
+    and the iterable is a NumPy array or has at least `AUTO_MIN_SIZE` items.
+    Keys that turn out not to be plain numbers are still sorted in Python.
+    """
+
+    if backend != "auto":
+        return backend == "numpy"
+    if np is None or callable(key):
+        return False
+    return isinstance(iterable, np.ndarray) or size >= AUTO_MIN_SIZE
+
+def integer_order(keys: list, reverse: bool) -> list[int] | None:
+    """
+    Returns the indexes of integer keys in stably sorted order.
+
+    Uses LSD radix sort over 16 bit digits, each digit is sorted by NumPy's own radix sort.
+    Returns `None` if the keys don't fit into int64.
+    """
+
+    try:
+        array = np.array(keys, dtype=np.int64)
+    except OverflowError:
+        return None
+
+    if reverse:
+        # Stable descending order is the reversed stable ascending order of the reversed keys
+        array = array[::-1]
+    shifted = (array - array.min()).astype(np.uint64)
+    highest = int(shifted.max())
+
+    order = np.arange(len(shifted))
+    shift = 0
+    while True:
+        digits = ((shifted[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+        shift += 16
+        if highest >> shift == 0:
+            break
+
+    if reverse:
+        order = len(order) - 1 - order[::-1]
+    return order.tolist()
+
+def sort_records(records: list, reverse: bool, stable: bool) -> list | None:
+    """
+    Sorts the records by their keys with `numpy.argsort` and returns their items as a list.
+
+    Returns `None` if the keys aren't plain numbers (or ints too big to be compared as floats),
+    so the caller can fall back to sorting in Python.
+    """
+
+    keys = [record[0] for record in records]
+    try:
+        array = np.asarray(keys)
+    except (OverflowError, ValueError):
+        return None
+    if array.ndim != 1 or array.dtype.kind not in "biuf":
+        return None
+    if array.dtype.kind == "f" and any(type(k) is int and abs(k) > 2**53 for k in keys):
+        return None
+
+    if not stable:
+        order = np.argsort(array, kind="quicksort")
+        if reverse:
+            order = order[::-1]
+    elif reverse:
+        # Stable descending order is the reversed stable ascending order of the reversed keys
+        order = len(array) - 1 - np.argsort(array[::-1], kind="stable")[::-1]
+    else:
+        order = np.argsort(array, kind="stable")
+
+    return [records[i][2] for i in order.tolist()]
@@ -0,0 +1,288 @@
+"""
+Benchmark of the sorting package.
+
+Times every sort on reproducible workloads and saves the results as JSON, then compares two runs to find regressions.
+
+```
+python3 -m utilities_python.sorting.benchmark run --sizes 10 1000 100000 --output before.json
+python3 -m utilities_python.sorting.benchmark compare before.json after.json --threshold 0.1
+```
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+
+from utilities_python.sorting._keys import KeySpec, compile_key
+from utilities_python.sorting.bubble_sort import bubble_sort
+from utilities_python.sorting.counting_sort import counting_sort
+from utilities_python.sorting.heap_sort import heap_sort
+from utilities_python.sorting.insertion_sort import insertion_sort
+from utilities_python.sorting.merge_sort import merge_sort
+from utilities_python.sorting.quick_sort import quick_sort
+from utilities_python.sorting.radix_sort import radix_sort
+from utilities_python.sorting.selection_sort import selection_sort
+from utilities_python.sorting.smart_sort import smart_sort
+
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000)
+QUADRATIC_MAX_SIZE = 2_000 # O(n^2) sorts are skipped above this size
+
+
+def _builtin_sorted(iterable: list, key: KeySpec = None) -> list:
+    return sorted(iterable, key=compile_key(key, iterable[0] if len(iterable) > 0 else None))
+
+
+# Name -> (sort function, is O(n^2)), sorts are pinned to the Python backend so the algorithms themselves are timed
+SORTS: dict[str, tuple[Callable, bool]] = {
+    "builtin_sorted": (_builtin_sorted, False),
+    "bubble_sort": (partial(bubble_sort, backend="python"), True),
+    "selection_sort": (partial(selection_sort, backend="python"), True),
+    "insertion_sort": (partial(insertion_sort, backend="python"), True),
+    "insertion_sort_binary": (partial(insertion_sort, binary=True, backend="python"), True),
+    "heap_sort": (partial(heap_sort, backend="python"), False),
+    "merge_sort": (partial(merge_sort, backend="python"), False),
+    "merge_sort_iterative": (partial(merge_sort, iterative=True, backend="python"), False),
+    "merge_sort_adaptive": (partial(merge_sort, adaptive=True, backend="python"), False),
+    "quick_sort": (partial(quick_sort, backend="python"), False),
+    "quick_sort_three_way": (partial(quick_sort, three_way=True, backend="python"), False),
+    "counting_sort": (partial(counting_sort, backend="python"), False),
+    "radix_sort": (partial(radix_sort, backend="python"), False),
+    "smart_sort": (smart_sort, False),
+}
+
+
+class BenchNode:
+    """Item with an attribute key, like the `Node` class of the sorting tests."""
+
+    __slots__ = ("val", "val2")
+
+    def __init__(self, val: int, val2: int):
+        self.val = val
+        self.val2 = val2
+
+
+def _random(size: int, rng: random.Random) -> list:
+    return [rng.randrange(size) for _ in range(size)]
+
+def _sorted(size: int, rng: random.Random) -> list:
+    return list(range(size))
+
+def _reversed(size: int, rng: random.Random) -> list:
+    return list(range(size, 0, -1))
+
+def _few_unique(size: int, rng: random.Random) -> list:
+    return [rng.randrange(8) for _ in range(size)]
+
+def _organ_pipe(size: int, rng: random.Random) -> list:
+    half = size // 2
+    return list(range(half)) + list(range(size - half, 0, -1))
+
+def _nodes(size: int, rng: random.Random) -> list:
+    return [BenchNode(rng.randrange(size), i) for i in range(size)]
+
+# Name -> (function that builds the items from the size and a seeded random generator, key)
+WORKLOADS: dict[str, tuple[Callable[[int, random.Random], list], KeySpec]] = {
+    "random": (_random, None),
+    "sorted": (_sorted, None),
+    "reversed": (_reversed, None),
+    "few_unique": (_few_unique, None),
+    "organ_pipe": (_organ_pipe, None),
+    "nodes": (_nodes, lambda node: node.val), # Python key function, called once per item
+    "nodes_field": (_nodes, "val"), # Same items, key compiled into `operator.attrgetter`
+}
+
+
+def run(
+        sizes: tuple = DEFAULT_SIZES,
+        sorts: list[str] | None = None,
+        workloads: list[str] | None = None,
+        repeat: int = 5,
+        seed: int = 0,
+        min_time: float = 0.2
+    ) -> dict:
+    """
+    Times the sorts on the workloads and returns the results as a JSON compatible dict.
+
+    Every workload is generated from a generator seeded with `seed`, its name and the size, so runs with the same
+    arguments sort the same items. Each sort is timed `repeat` times with `timeit`, every time enough calls to take
+    at least `min_time` seconds (at least one call), the best and the median time of a single call are saved.
+
+    Parameters
+    ----------
+    - sizes : tuple, optional
+        Amounts of items to sort.
+        (default = (10, 100, 1_000, 10_000))
+    - sorts : list[str], optional
+        Names of the sorts from `SORTS` to time, all of them if `None`.
+        (default = None)
+    - workloads : list[str], optional
+        Names of the workloads from `WORKLOADS` to use, all of them if `None`.
+        (default = None)
+    - repeat : int, optional
+        Amount of timings of each sort.
+        (default = 5)
+    - seed : int, optional
+        Seed of the workloads.
+        (default = 0)
+    - min_time : float, optional
+        Minimal time of a single timing in seconds.
+        (default = 0.2)
+
+    Returns
+    -------
+    - dict
+        `{"meta": {...}, "results": [{"sort", "workload", "size", "best", "median", "calls"}, ...]}`, times in seconds.
+
+    Raises
+    ------
+    - ValueError
+        If an unknown sort or workload name is given.
+    """
+
+    sorts = list(SORTS) if sorts is None else sorts
+    workloads = list(WORKLOADS) if workloads is None else workloads
+    for name in sorts:
+        if name not in SORTS:
+            raise ValueError(f"Unknown sort {name!r}, expected one of {tuple(SORTS)}.")
+    for name in workloads:
+        if name not in WORKLOADS:
+            raise ValueError(f"Unknown workload {name!r}, expected one of {tuple(WORKLOADS)}.")
+
+    results = []
+    for workload in workloads:
+        make_items, key = WORKLOADS[workload]
+        for size in sizes:
+            items = make_items(size, random.Random(f"{seed}/{workload}/{size}"))
+            for name in sorts:
+                sort, quadratic = SORTS[name]
+                if quadratic and size > QUADRATIC_MAX_SIZE:
+                    continue
+
+                timer = timeit.Timer(partial(sort, items, key=key))
+                calls = _calls_per_timing(timer, min_time)
+                times = [total / calls for total in timer.repeat(repeat, calls)]
+                results.append({
+                    "sort": name,
+                    "workload": workload,
+                    "size": size,
+                    "best": min(times),
+                    "median": statistics.median(times),
+                    "calls": calls,
+                })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "seed": seed,
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+def compare(old: dict, new: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    Compares the best times of two runs returned by `run` (or loaded from their JSON).
+
+    Parameters
+    ----------
+    - old : dict
+        Results of the baseline run.
+    - new : dict
+        Results of the run to check.
+    - threshold : float, optional
+        Relative slowdown above which a result counts as a regression (0.1 = 10% slower).
+        (default = 0.1)
+
+    Returns
+    -------
+    - list[dict]
+        `{"sort", "workload", "size", "old", "new", "ratio", "regression"}` for every result found in both runs,
+        where `ratio` is the new best time divided by the old one.
+    """
+
+    old_results = {(result["sort"], result["workload"], result["size"]): result for result in old["results"]}
+    rows = []
+    for result in new["results"]:
+        old_result = old_results.get((result["sort"], result["workload"], result["size"]))
+        if old_result is None:
+            continue
+        ratio = result["best"] / old_result["best"]
+        rows.append({
+            "sort": result["sort"],
+            "workload": result["workload"],
+            "size": result["size"],
+            "old": old_result["best"],
+            "new": result["best"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+def _calls_per_timing(timer: timeit.Timer, min_time: float) -> int:
+    """Inner function for run. Same as `Timer.autorange` (1, 2, 5, 10, 20, 50... calls), but with any `min_time`."""
+
+    calls = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            if timer.timeit(calls * multiplier) >= min_time:
+                return calls * multiplier
+        calls *= 10
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line interface, see the module docstring. Returns 1 if `compare` finds a regression."""
+
+    parser = argparse.ArgumentParser(prog="python3 -m utilities_python.sorting.benchmark", description="Benchmark of the sorting package.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the sorts and print or save the results as JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--sorts", nargs="+", choices=list(SORTS))
+    run_parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="minimal time of a single timing in seconds")
+    run_parser.add_argument("--output", help="JSON file to save the results to, printed if not set")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs and flag regressions")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(tuple(args.sizes), args.sorts, args.workloads, args.repeat, args.seed, args.min_time)
+        if args.output is None:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+        return 0
+
+    with open(args.old) as file:
+        old = json.load(file)
+    with open(args.new) as file:
+        new = json.load(file)
+    rows = compare(old, new, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"{row['sort']:<24}{row['workload']:<12}{row['size']:>10}{row['old']:>14.6f}{row['new']:>14.6f}{row['ratio']:>8.2f}x {flag}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
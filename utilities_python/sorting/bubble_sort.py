@@ -1,9 +1,12 @@
-from collections.abc import Callable, Iterable
-from typing import Any
+from collections.abc import Iterable
 from numbers import Number
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._keys import KeySpec, decorate, undecorate
+from utilities_python.sorting.stats import instrumented
 
 
-def bubble_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reverse: bool = False) -> list:
+@instrumented
+def bubble_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, backend: str = "auto") -> list:
     """
     Baby's first sort.
     Here just to party.
@@ -16,12 +19,20 @@ def bubble_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, rev
     ----------
     - iterable : Iterable
         Iterable that needs to be sorted.
-    - key : func, optional
-        Function that returns key used for sorting.
-        (default = lambda x: x)
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
     - reverse : bool, optional
         Set to True to sort from biggest to lowest.
         (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
 
     Returns
     -------
@@ -29,21 +40,26 @@ def bubble_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, rev
         Sorted *copy* of the iterable.
     """
 
-    iterable = list(iterable)
+    _numpy_backend.check_backend(backend)
+    records = decorate(iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=True)
+        if final is not None:
+            return final
     swapping = True
-    end = len(iterable)
+    end = len(records)
 
     while swapping:
         swapping = False
 
         for i in range(1, end):
-            left_val = key(iterable[i-1])
-            right_val = key(iterable[i])
+            left_val = records[i-1][0]
+            right_val = records[i][0]
 
             if (not reverse and left_val > right_val) or (reverse and left_val < right_val):
-                iterable[i-1], iterable[i] = iterable[i], iterable[i-1]
+                records[i-1], records[i] = records[i], records[i-1]
                 swapping = True
 
         end -= 1
 
-    return iterable
+    return undecorate(records)
@@ -0,0 +1,74 @@
+from collections.abc import Iterable
+from numbers import Integral
+from utilities_python.sorting._keys import KeySpec, decorate, undecorate
+from utilities_python.sorting import _numpy_backend
+
+
+def counting_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, backend: str = "auto") -> list:
+    """
+    Sorts the iterable by counting how many items have each key, then puts every item straight into its place.
+    Returns it as a list.
+
+    Complexity - O(n + k), where k is the difference between the biggest and the smallest key.
+
+    Pros: linear, stable, no comparisons.
+    Cons: only works with integer keys, requires O(k) memory.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item. Has to return an integer.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort the keys as a NumPy array (requires NumPy).
+        Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+
+    Returns
+    -------
+    - list
+        Sorted *copy* of the iterable.
+
+    Raises
+    ------
+    - TypeError
+        If `key` returns something other than an integer.
+    """
+
+    _numpy_backend.check_backend(backend)
+    records = decorate(iterable, key)
+    if len(records) == 0:
+        return []
+    for record in records:
+        if not isinstance(record[0], Integral):
+            raise TypeError(f"counting_sort only supports integer keys, got {type(record[0]).__name__}.")
+
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        order = _numpy_backend.integer_order([record[0] for record in records], reverse)
+        if order is not None:
+            return [records[i][2] for i in order]
+
+    low = min(record[0] for record in records)
+    high = max(record[0] for record in records)
+
+    counts = [0] * (high - low + 1)
+    for record in records:
+        counts[record[0] - low] += 1
+
+    # Turns counts into the index of the first item with each key
+    total = 0
+    for i in (range(len(counts) - 1, -1, -1) if reverse else range(len(counts))):
+        counts[i], total = total, total + counts[i]
+
+    final = [None] * len(records)
+    for record in records:
+        final[counts[record[0] - low]] = record
+        counts[record[0] - low] += 1
+
+    return undecorate(final)
@@ -0,0 +1,173 @@
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import BinaryIO
+from heapq import merge
+from itertools import islice
+import os
+import pickle
+import tempfile
+from utilities_python.sorting._keys import KeySpec, decorate, record_key
+from utilities_python.sorting.merge_sort import _inner_adaptive
+
+try:
+    import resource # Unix only
+except ImportError:
+    resource = None
+
+
+_BATCH_SIZE = 1024
+_MAX_OPEN_FILES = 128
+
+
+def external_sort(
+        iterable: Iterable,
+        key: KeySpec = None,
+        reverse: bool = False,
+        chunk_size: int = 100_000,
+        temp_dir: str | None = None,
+        max_open_files: int | None = None
+    ) -> Iterator:
+    """
+    Sorts an iterable that doesn't fit into memory and lazily yields its items in sorted order.
+
+    Reads `chunk_size` items at a time, sorts them with adaptive merge sort and spills them into a temporary file.
+    Then merges the files with a heap (k-way merge), reading them back in small batches. If there are more than
+    `max_open_files` files, groups of them are first merged into bigger files until the rest can be merged at once.
+    Nothing is read until the first item is requested.
+
+    Pros: stable, memory is bounded by `chunk_size` (and 1024 items per open file while merging)
+    instead of the size of the iterable, at most `max_open_files + 1` files are open at once.
+    Cons: items (and keys) have to be picklable, disk I/O.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted. Can be a generator.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item. Has to return picklable keys.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - chunk_size : int, optional
+        Maximum amount of items kept in memory while sorting the chunks.
+        (default = 100_000)
+    - temp_dir : str, optional
+        Directory for the temporary files. Uses the system default if not set.
+        (default = None)
+    - max_open_files : int, optional
+        Maximum amount of files merged at once. Files above it are merged in several passes.
+        (default = None, 128 or half of the open file limit of the process if it's lower)
+
+    Returns
+    -------
+    - Iterator
+        Generator yielding items of the iterable in sorted order.
+
+    Raises
+    ------
+    - ValueError
+        If `chunk_size` is lower than 1 or `max_open_files` is lower than 2. Raised right away, not on the first item.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size has to be at least 1.")
+    if max_open_files == None:
+        max_open_files = _default_max_open_files()
+    if max_open_files < 2:
+        raise ValueError("max_open_files has to be at least 2.")
+
+    return _inner_sort(iterable, key, reverse, chunk_size, temp_dir, max_open_files)
+
+def _inner_sort(iterable: Iterable, key: KeySpec, reverse: bool, chunk_size: int, temp_dir: str | None, max_open_files: int) -> Iterator:
+    """
+    Inner generator for external_sort.
+
+    Spills sorted chunks into temporary files and merges them, the arguments are already checked by external_sort.
+    """
+
+    iterator = iter(iterable)
+    runs = [] # Paths of the sorted files, closed until they're merged
+    created = [] # Every file made by this call, removed at the end
+    try:
+        while True:
+            records = decorate(islice(iterator, chunk_size), key)
+            if len(records) == 0:
+                break
+            records = _inner_adaptive(records, record_key, reverse)
+
+            if len(runs) == 0 and len(records) < chunk_size:
+                # Everything fits into one chunk, no need to touch the disk
+                for record in records:
+                    yield record[2]
+                return
+
+            with _new_run(temp_dir, created) as file:
+                _spill(file, records)
+            runs.append(created[-1])
+            del records
+
+        # Merges neighbouring runs, so equal keys keep their order
+        while len(runs) > max_open_files:
+            runs = [
+                _merge_runs(runs[i:i+max_open_files], reverse, temp_dir, created)
+                for i in range(0, len(runs), max_open_files)
+            ]
+
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(path, "rb")) for path in runs]
+            for record in merge(*(_read(file) for file in files), key=record_key, reverse=reverse):
+                yield record[2]
+    finally:
+        for path in created:
+            if os.path.exists(path):
+                os.remove(path)
+
+def _default_max_open_files() -> int:
+    """Inner function for external_sort. Returns 128, or half of the soft limit on open files if it's lower."""
+
+    if resource == None:
+        return _MAX_OPEN_FILES
+    limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if limit == resource.RLIM_INFINITY:
+        return _MAX_OPEN_FILES
+    return max(2, min(_MAX_OPEN_FILES, limit // 2))
+
+def _new_run(temp_dir: str | None, created: list) -> BinaryIO:
+    """Inner function for external_sort. Opens a new temporary file for writing and adds its path to `created`."""
+
+    descriptor, path = tempfile.mkstemp(dir=temp_dir)
+    created.append(path)
+    return os.fdopen(descriptor, "wb")
+
+def _merge_runs(paths: list, reverse: bool, temp_dir: str | None, created: list) -> str:
+    """Inner function for external_sort. Merges the runs into a new one, removes them and returns its path."""
+
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, "rb")) for path in paths]
+        output = stack.enter_context(_new_run(temp_dir, created))
+        _spill(output, merge(*(_read(file) for file in files), key=record_key, reverse=reverse))
+    for path in paths:
+        os.remove(path)
+    return created[-1]
+
+def _spill(file: BinaryIO, records: Iterable):
+    """Inner function for external_sort. Writes sorted records into the file in batches."""
+
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, _BATCH_SIZE))
+        if len(batch) == 0:
+            return
+        pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _read(file: BinaryIO) -> Iterator:
+    """Inner function for external_sort. Lazily yields records from a file written by _spill."""
+
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
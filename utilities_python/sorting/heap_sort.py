@@ -0,0 +1,105 @@
+# pyright: reportIndexIssue=false
+
+from collections.abc import Callable, Iterable
+from typing import Any
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._inplace import check_inplace, inplace_key
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.stats import instrumented
+
+
+@instrumented
+def heap_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, backend: str = "auto", inplace: bool = False) -> list | None:
+    """
+    Sorts a copy of the iterable in place and returns it as a list.
+
+    Builds a heap with the biggest (lowest if `reverse`) item on top in O(n),
+    then repeatedly swaps the top to the end of the list and restores the heap.
+
+    Pros: in-place, O(n log n) worst case, no recursion.
+    Cons: unstable, slower than quick sort on average.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - inplace : bool, optional
+        Set to True to sort a list, `array.array` or writable memoryview itself instead of a copy and return `None`.
+        Uses O(1) extra memory, but calls `key` on every comparison instead of once per item.
+        (default = False)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
+
+    Returns
+    -------
+    - list | None
+        Sorted *copy* of the iterable, or `None` if `inplace` is set.
+    """
+
+    _numpy_backend.check_backend(backend)
+    if inplace:
+        check_inplace(iterable, backend)
+        key = inplace_key(key, iterable)
+        _inner_sort(iterable, 0, len(iterable) - 1, key, reverse)
+        return None
+
+    records = decorate(iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=False)
+        if final is not None:
+            return final
+
+    _inner_sort(records, 0, len(records) - 1, record_key, reverse)
+
+    return undecorate(records)
+
+def _inner_sort(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool):
+    """
+    Inner function for heap_sort, also used by quick_sort when partitioning goes too deep.
+
+    Sorts `iterable[low:high+1]` in place.
+    """
+
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(iterable, low, root, size, key, reverse)
+
+    for end in range(size - 1, 0, -1):
+        iterable[low], iterable[low+end] = iterable[low+end], iterable[low]
+        _sift_down(iterable, low, 0, end, key, reverse)
+
+def _sift_down(iterable: Iterable, offset: int, root: int, size: int, key: Callable[[Any], Any] | None, reverse: bool):
+    """
+    Inner function for heap_sort.
+
+    Moves the root down the heap stored in `iterable[offset:offset+size]` until both children go before it.
+    """
+
+    root_val = iterable[offset + root] if key is None else key(iterable[offset + root])
+    while True:
+        child = 2*root + 1
+        if child >= size:
+            return
+
+        child_val = iterable[offset + child] if key is None else key(iterable[offset + child])
+        if child + 1 < size:
+            right_val = iterable[offset + child + 1] if key is None else key(iterable[offset + child + 1])
+            if (not reverse and right_val > child_val) or (reverse and right_val < child_val):
+                child, child_val = child + 1, right_val
+
+        if (not reverse and child_val <= root_val) or (reverse and child_val >= root_val):
+            return
+        iterable[offset + root], iterable[offset + child] = iterable[offset + child], iterable[offset + root]
+        root = child
@@ -1,9 +1,16 @@
+# pyright: reportIndexIssue=false
+
 from collections.abc import Callable, Iterable
 from typing import Any
 from numbers import Number
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._inplace import check_inplace, inplace_key
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.stats import instrumented
 
 
-def insertion_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reverse: bool = False) -> list:
+@instrumented
+def insertion_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, binary: bool = False, backend: str = "auto", inplace: bool = False) -> list | None:
     """
     Sorts a copy of the iterable in place and returns it as a list.
 
@@ -13,30 +20,97 @@ def insertion_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x,
     ----------
     - iterable : Iterable
         Iterable that needs to be sorted.
-    - key : func, optional
-        Function that returns key used for sorting.
-        (default = lambda x: x)
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
     - reverse : bool, optional
         Set to True to sort from biggest to lowest.
         (default = False)
+    - binary : bool, optional
+        Set to True to find the place of each item with binary search (O(log n) comparisons)
+        and move the items after it with a single slice assignment instead of swapping them one by one.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - inplace : bool, optional
+        Set to True to sort a list, `array.array` or writable memoryview itself instead of a copy and return `None`.
+        Uses O(1) extra memory, but calls `key` on every comparison instead of once per item.
+        (default = False)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
 
     Returns
     -------
-    - list
-        Sorted *copy* of the iterable.
+    - list | None
+        Sorted *copy* of the iterable, or `None` if `inplace` is set.
     """
 
-    iterable = list(iterable)
+    _numpy_backend.check_backend(backend)
+    if inplace:
+        check_inplace(iterable, backend)
+        key = inplace_key(key, iterable)
+        if binary:
+            _inner_sort_binary(iterable, 0, len(iterable) - 1, key, reverse)
+        else:
+            _inner_sort(iterable, 0, len(iterable) - 1, key, reverse)
+        return None
 
-    for i in range(1, len(iterable)):
+    records = decorate(iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=True)
+        if final is not None:
+            return final
+
+    if binary:
+        _inner_sort_binary(records, 0, len(records) - 1, record_key, reverse)
+    else:
+        _inner_sort(records, 0, len(records) - 1, record_key, reverse)
+    
+    return undecorate(records)
+
+def _inner_sort(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool):
+    """
+    Inner function for insertion_sort, also used by other sorts to finish small parts of the list.
+
+    Sorts `iterable[low:high+1]` in place by swapping each item to the left until it's in place.
+    """
+
+    for i in range(low + 1, high + 1):
         j = i
-        while j>0:
-            left_val = key(iterable[j-1])
-            right_val = key(iterable[j])
+        while j>low:
+            left_val = iterable[j-1] if key is None else key(iterable[j-1])
+            right_val = iterable[j] if key is None else key(iterable[j])
 
             if (not reverse and left_val <= right_val) or (reverse and left_val >= right_val):
                 break
             iterable[j-1], iterable[j] = iterable[j], iterable[j-1]
             j -= 1
-    
-    return iterable
+
+def _inner_sort_binary(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool, start: int | None = None):
+    """
+    Inner function for insertion_sort, also used by other sorts to finish small parts of the list.
+
+    Sorts `iterable[low:high+1]` in place. Finds the place of each item with binary search (after all equal items,
+    so it stays stable) and moves the items after it with a single slice assignment.
+    Items before `start` are expected to be sorted already.
+    """
+
+    for i in range(low + 1 if start is None else max(start, low + 1), high + 1):
+        item = iterable[i]
+        item_val = item if key is None else key(item)
+        left, right = low, i
+        while left < right:
+            middle = (left + right) // 2
+            middle_val = iterable[middle] if key is None else key(iterable[middle])
+            if (not reverse and item_val < middle_val) or (reverse and item_val > middle_val):
+                right = middle
+            else:
+                left = middle + 1
+
+        if left < i:
+            iterable[left+1:i+1] = iterable[left:i]
+            iterable[left] = item
@@ -4,25 +4,44 @@
 from collections.abc import Callable, Iterable
 from typing import Any
 from numbers import Number
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.insertion_sort import _inner_sort_binary as _binary_insertion_sort
+from utilities_python.sorting.stats import instrumented, recursive
 
 
-def merge_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reverse: bool = False) -> list:
+@instrumented
+def merge_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, iterative: bool = False, adaptive: bool = False, backend: str = "auto") -> list:
     """
     Sorts the iterable by splitting into smaller and smaller iterables before merging back. Then returns it as a list.
 
-    Pros: fast and stable.
-    Cons: requires more memory, recursive.
+    Pros: fast and stable, close to O(n) on nearly sorted iterables (if `adaptive` is set).
+    Cons: requires more memory, recursive (unless `iterative` or `adaptive` is set).
 
     Parameters
     ----------
     - iterable : Iterable
         Iterable that needs to be sorted.
-    - key : func, optional
-        Function that returns key used for sorting.
-        (default = lambda x: x)
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
     - reverse : bool, optional
         Set to True to sort from biggest to lowest.
         (default = False)
+    - iterative : bool, optional
+        Set to True to merge bottom-up without recursion, using a single buffer of the same size as the iterable.
+        (default = False)
+    - adaptive : bool, optional
+        Set to True to detect already sorted (or reverse sorted) runs and merge them with galloping. Non-recursive.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
 
     Returns
     -------
@@ -30,13 +49,271 @@ def merge_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reve
         Sorted *copy* of the iterable.
     """
 
+    _numpy_backend.check_backend(backend)
+    records = decorate(iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=True)
+        if final is not None:
+            return final
+
+    if adaptive:
+        return undecorate(_inner_adaptive(records, record_key, reverse))
+    if iterative:
+        return undecorate(_inner_iteration(records, record_key, reverse))
+    return undecorate(_inner_recursion(records, record_key, reverse))
+
+@recursive
+def _inner_recursion(iterable: Iterable, key: Callable[[Any], Any], reverse: bool) -> list:
+    """
+    Inner recursive function for merge_sort.
+
+    Splits the iterable in half, calls itself on both halves and merges them back.
+    """
+
     if len(iterable) < 2:
         return iterable # pyright: ignore[reportReturnType]
     
     middle = len(iterable) // 2
     left, right = iterable[:middle], iterable[middle:] 
 
-    return _merge(merge_sort(left, key, reverse), merge_sort(right, key, reverse), key, reverse)
+    return _merge(_inner_recursion(left, key, reverse), _inner_recursion(right, key, reverse), key, reverse)
+
+def _inner_iteration(iterable: list, key: Callable[[Any], Any], reverse: bool) -> list:
+    """
+    Inner non-recursive function for merge_sort.
+
+    Merges neighbouring runs of width 1, 2, 4... bottom-up. Each pass merges from one list into the other,
+    so the only extra memory is a single buffer allocated once.
+    """
+
+    size = len(iterable)
+    source, target = iterable, [None] * size
+    width = 1
+
+    while width < size:
+        for low in range(0, size, 2 * width):
+            middle = min(low + width, size)
+            high = min(low + 2 * width, size)
+            _merge_into(source, target, low, middle, high, key, reverse)
+        source, target = target, source
+        width *= 2
+
+    return source
+
+def _merge_into(source: list, target: list, low: int, middle: int, high: int, key: Callable[[Any], Any], reverse: bool):
+    """
+    Inner function for merge_sort used to merge `source[low:middle]` and `source[middle:high]` into `target[low:high]`.
+    """
+
+    i, j = low, middle
+
+    for k in range(low, high):
+        if j >= high:
+            target[k:high] = source[i:middle]
+            return
+        if i >= middle:
+            target[k:high] = source[j:high]
+            return
+
+        left_val = key(source[i])
+        right_val = key(source[j])
+        if (not reverse and left_val <= right_val) or (reverse and (left_val >= right_val)):
+            target[k] = source[i]
+            i += 1
+        else:
+            target[k] = source[j]
+            j += 1
+
+def _inner_adaptive(iterable: list, key: Callable[[Any], Any], reverse: bool) -> list:
+    """
+    Inner non-recursive function for merge_sort.
+
+    Splits the iterable into natural runs (extending short ones to `_min_run` with binary insertion)
+    and keeps them on a stack, merging neighbours whenever the run lengths stop shrinking fast enough.
+    """
+
+    size = len(iterable)
+    min_run = _min_run(size)
+    runs = []
+    low = 0
+
+    while low < size:
+        run_length = _count_run(iterable, low, size, key, reverse)
+        if run_length < min_run:
+            forced_length = min(min_run, size - low)
+            _binary_insertion_sort(iterable, low, low + forced_length - 1, key, reverse, start=low + run_length)
+            run_length = forced_length
+
+        runs.append([low, run_length])
+        _merge_collapse(iterable, runs, key, reverse, force=False)
+        low += run_length
+
+    _merge_collapse(iterable, runs, key, reverse, force=True)
+    return iterable
+
+def _min_run(size: int) -> int:
+    """
+    Inner function for merge_sort.
+
+    Returns the minimal run length (between 32 and 64) so that `size / min_run` is equal to or slightly less than a power of 2.
+    """
+
+    extra = 0
+    while size >= 64:
+        extra |= size & 1
+        size >>= 1
+    return size + extra
+
+def _count_run(iterable: list, low: int, high: int, key: Callable[[Any], Any], reverse: bool) -> int:
+    """
+    Inner function for merge_sort.
+
+    Returns the length of the run starting at `low`. Strictly descending runs are reversed in place,
+    so equal items never swap places.
+    """
+
+    end = low + 1
+    if end == high:
+        return 1
+
+    prev_val = key(iterable[low])
+    next_val = key(iterable[end])
+    if (not reverse and next_val < prev_val) or (reverse and next_val > prev_val):
+        while end < high:
+            next_val = key(iterable[end])
+            if (not reverse and next_val >= prev_val) or (reverse and next_val <= prev_val):
+                break
+            prev_val = next_val
+            end += 1
+        iterable[low:end] = iterable[low:end][::-1]
+    else:
+        while end < high:
+            next_val = key(iterable[end])
+            if (not reverse and next_val < prev_val) or (reverse and next_val > prev_val):
+                break
+            prev_val = next_val
+            end += 1
+
+    return end - low
+
+def _merge_collapse(iterable: list, runs: list, key: Callable[[Any], Any], reverse: bool, force: bool):
+    """
+    Inner function for merge_sort.
+
+    Merges runs on top of the stack until each run is longer than the two above it combined,
+    which keeps the merges balanced. Merges all of them if `force` is set.
+    """
+
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if force:
+            if n > 0 and runs[n-1][1] < runs[n+1][1]:
+                n -= 1
+        elif (
+                (n > 0 and runs[n-1][1] <= runs[n][1] + runs[n+1][1])
+                or (n > 1 and runs[n-2][1] <= runs[n-1][1] + runs[n][1])
+            ):
+            if runs[n-1][1] < runs[n+1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n+1][1]:
+            break
+
+        low, left_length = runs[n]
+        right_length = runs[n+1][1]
+        _merge_runs(iterable, low, low + left_length, low + left_length + right_length, key, reverse)
+        runs[n][1] = left_length + right_length
+        del runs[n+1]
+
+_MIN_GALLOP = 7
+
+def _merge_runs(iterable: list, low: int, middle: int, high: int, key: Callable[[Any], Any], reverse: bool):
+    """
+    Inner function for merge_sort used to merge neighbouring runs `iterable[low:middle]` and `iterable[middle:high]` in place.
+
+    Skips the items that are already in their place and switches to galloping once one run wins `_MIN_GALLOP` times in a row.
+    """
+
+    # Items of the left run that go before the whole right run are already in place, same for the end of the right run
+    first_right_val = key(iterable[middle])
+    low = _gallop(iterable, low, middle, lambda other: _is_before(first_right_val, key(other), reverse))
+    if low == middle:
+        return
+    last_left_val = key(iterable[middle-1])
+    high = _gallop(iterable, middle, high, lambda other: not _is_before(key(other), last_left_val, reverse))
+
+    left = iterable[low:middle]
+    i, j, k = 0, middle, low
+
+    while i < len(left) and j < high:
+        left_wins, right_wins = 0, 0
+        while i < len(left) and j < high and left_wins < _MIN_GALLOP and right_wins < _MIN_GALLOP:
+            if _is_before(key(iterable[j]), key(left[i]), reverse):
+                iterable[k] = iterable[j]
+                j += 1
+                left_wins, right_wins = 0, right_wins + 1
+            else:
+                iterable[k] = left[i]
+                i += 1
+                left_wins, right_wins = left_wins + 1, 0
+            k += 1
+
+        while i < len(left) and j < high:
+            right_val = key(iterable[j])
+            end = _gallop(left, i, len(left), lambda other: _is_before(right_val, key(other), reverse))
+            left_count = end - i
+            iterable[k:k+left_count] = left[i:end]
+            k, i = k + left_count, end
+            if i == len(left):
+                break
+            iterable[k] = iterable[j]
+            k, j = k + 1, j + 1
+            if j == high:
+                break
+
+            left_val = key(left[i])
+            end = _gallop(iterable, j, high, lambda other: not _is_before(key(other), left_val, reverse))
+            right_count = end - j
+            iterable[k:k+right_count] = iterable[j:end]
+            k, j = k + right_count, end
+            if j == high:
+                break
+            iterable[k] = left[i]
+            k, i = k + 1, i + 1
+
+            if left_count < _MIN_GALLOP and right_count < _MIN_GALLOP:
+                break
+
+    if i < len(left):
+        iterable[k:high] = left[i:]
+
+def _gallop(iterable: list, low: int, high: int, predicate: Callable[[Any], bool]) -> int:
+    """
+    Inner function for merge_sort.
+
+    Returns the first index in `iterable[low:high]` for which `predicate` is True (or `high`),
+    given that it is False for all items before it and True after.
+    Probes `low`, `low+1`, `low+3`, `low+7`... before finishing with binary search, so it's fast when the answer is close to `low`.
+    """
+
+    last, offset = low, 1
+    while low + offset - 1 < high and not predicate(iterable[low + offset - 1]):
+        last = low + offset
+        offset *= 2
+    high = min(low + offset - 1, high)
+
+    while last < high:
+        middle = (last + high) // 2
+        if predicate(iterable[middle]):
+            high = middle
+        else:
+            last = middle + 1
+
+    return last
+
+def _is_before(left_val: Any, right_val: Any, reverse: bool) -> bool:
+    """Inner function for merge_sort. Returns `True` if `left_val` has to strictly go before `right_val`."""
+
+    return (not reverse and left_val < right_val) or (reverse and left_val > right_val)
 
 def _merge(left: Iterable, right: Iterable, key: Callable[[Any], Any], reverse: bool) -> list:
     """
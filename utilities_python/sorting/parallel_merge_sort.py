@@ -0,0 +1,136 @@
+from collections.abc import Iterable
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from multiprocessing.shared_memory import SharedMemory
+import os
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.merge_sort import _inner_adaptive
+
+
+_PARALLEL_CUTOFF = 10_000
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+
+def parallel_merge_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, workers: int | None = None) -> list:
+    """
+    Sorts the iterable by splitting it into one chunk per worker process, sorting the chunks at the same time
+    and merging them back with a heap (k-way merge). Then returns it as a list.
+
+    Keys are calculated in the main process and only keys are sent to the workers, so neither the items nor `key`
+    have to be picklable. Integer and float keys are shared through `multiprocessing.shared_memory` without pickling,
+    other keys are pickled once. Iterables shorter than 10 000 items are sorted in the main process.
+
+    Pros: stable, uses all cores.
+    Cons: requires more memory, starting processes is slow for small iterables.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - workers : int, optional
+        Amount of worker processes. Uses the amount of CPUs if not set.
+        (default = None)
+
+    Returns
+    -------
+    - list
+        Sorted *copy* of the iterable.
+    """
+
+    records = decorate(iterable, key)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(records) < _PARALLEL_CUTOFF:
+        return undecorate(_inner_adaptive(records, record_key, reverse))
+
+    keys = [record[0] for record in records]
+    step = -(-len(keys) // workers)
+    bounds = [(start, min(start + step, len(keys))) for start in range(0, len(keys), step)]
+
+    typecode = _shared_typecode(keys)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if typecode is None:
+            futures = [executor.submit(_sort_chunk, keys[start:stop], start, reverse) for start, stop in bounds]
+            orders = [future.result() for future in futures]
+        else:
+            orders = _sort_shared(executor, keys, typecode, bounds, reverse)
+
+    return [records[i][2] for i in merge(*orders, key=keys.__getitem__, reverse=reverse)]
+
+def _shared_typecode(keys: list) -> str | None:
+    """
+    Inner function for parallel_merge_sort.
+
+    Returns the `array` typecode that fits all keys (`"q"` for int64, `"d"` for floats) or `None` if they have to be pickled.
+    """
+
+    if all(type(k) is float for k in keys):
+        return "d"
+    if all(type(k) is int and _INT64_MIN <= k <= _INT64_MAX for k in keys):
+        return "q"
+    return None
+
+def _sort_shared(executor: ProcessPoolExecutor, keys: list, typecode: str, bounds: list, reverse: bool) -> list[list[int]]:
+    """
+    Inner function for parallel_merge_sort.
+
+    Copies the keys into shared memory once, lets the workers write the sorted indexes of their chunks into
+    another shared block and returns them per chunk.
+    """
+
+    keys_array = array(typecode, keys)
+    keys_memory = SharedMemory(create=True, size=max(len(keys_array) * keys_array.itemsize, 1))
+    order_memory = SharedMemory(create=True, size=max(len(keys) * 8, 1))
+    try:
+        keys_memory.buf[:len(keys_array) * keys_array.itemsize] = keys_array.tobytes()
+        del keys_array
+
+        futures = [
+            executor.submit(_sort_shared_chunk, keys_memory.name, order_memory.name, typecode, start, stop, reverse)
+            for start, stop in bounds]
+        for future in futures:
+            future.result()
+
+        order = order_memory.buf.cast("q")
+        orders = [order[start:stop].tolist() for start, stop in bounds]
+        order.release()
+        return orders
+    finally:
+        keys_memory.close()
+        keys_memory.unlink()
+        order_memory.close()
+        order_memory.unlink()
+
+def _sort_chunk(keys: list, start: int, reverse: bool) -> list[int]:
+    """Inner function for parallel_merge_sort, runs in a worker. Returns the indexes of the keys in sorted order."""
+
+    records = _inner_adaptive([(k, start + i) for i, k in enumerate(keys)], record_key, reverse)
+    return [record[1] for record in records]
+
+def _sort_shared_chunk(keys_name: str, order_name: str, typecode: str, start: int, stop: int, reverse: bool):
+    """
+    Inner function for parallel_merge_sort, runs in a worker.
+
+    Sorts `keys[start:stop]` from shared memory and writes their indexes in sorted order into `order[start:stop]`.
+    """
+
+    keys_memory = SharedMemory(name=keys_name)
+    order_memory = SharedMemory(name=order_name)
+    try:
+        keys = keys_memory.buf.cast(typecode)
+        records = _inner_adaptive([(keys[i], i) for i in range(start, stop)], record_key, reverse)
+        keys.release()
+
+        order = order_memory.buf.cast("q")
+        order[start:stop] = array("q", [record[1] for record in records])
+        order.release()
+    finally:
+        keys_memory.close()
+        order_memory.close()
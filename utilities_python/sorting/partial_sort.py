@@ -0,0 +1,168 @@
+from collections.abc import Iterable
+from typing import Any
+from utilities_python.sorting._keys import KeySpec, compile_key, decorate, record_key
+from utilities_python.sorting.heap_sort import _inner_sort as _heap_sort
+from utilities_python.sorting.insertion_sort import _inner_sort_binary as _binary_insertion_sort
+from utilities_python.sorting.quick_sort import _INSERTION_CUTOFF, _inner_sort_three_way
+
+
+def partial_sort(iterable: Iterable, k: int, key: KeySpec = None, reverse: bool = False) -> list:
+    """
+    Returns the first `k` items of the sorted iterable as a list, without sorting the rest.
+
+    Streams the iterable through a heap of the best `k` items seen so far (complexity - O(n log k), memory - O(k)).
+    Same result as `merge_sort(iterable, key, reverse)[:k]`, including the order of equal items.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable to take the items from. Can be a generator.
+    - k : int
+        Amount of items to return.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to return the biggest items, from biggest to lowest.
+        (default = False)
+
+    Returns
+    -------
+    - list
+        `k` first items of the sorted iterable (less if the iterable is shorter).
+    """
+
+    if k <= 0:
+        return []
+
+    # The root of the heap is the worst record kept so far, a new item only has to beat it
+    heap = []
+    for index, item in enumerate(iterable):
+        if index == 0:
+            key = compile_key(key, item)
+        record = (item if key is None else key(item), index, item)
+        if len(heap) < k:
+            heap.append(record)
+            _sift_up(heap, len(heap) - 1, reverse)
+        elif _is_worse(heap[0], record, reverse):
+            heap[0] = record
+            _sift_down(heap, 0, reverse)
+
+    final = []
+    while heap:
+        final.append(heap[0][2])
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            _sift_down(heap, 0, reverse)
+    final.reverse()
+    return final
+
+def nsmallest(iterable: Iterable, k: int, key: KeySpec = None) -> list:
+    """
+    Returns `k` smallest items of the iterable from lowest to biggest (memory - O(k)).
+
+    Same as `partial_sort(iterable, k, key)`.
+    """
+
+    return partial_sort(iterable, k, key)
+
+def nlargest(iterable: Iterable, k: int, key: KeySpec = None) -> list:
+    """
+    Returns `k` biggest items of the iterable from biggest to lowest (memory - O(k)).
+
+    Same as `partial_sort(iterable, k, key, reverse=True)`.
+    """
+
+    return partial_sort(iterable, k, key, reverse=True)
+
+def quick_select(iterable: Iterable, k: int, key: KeySpec = None, reverse: bool = False) -> Any:
+    """
+    Returns the item that would be at index `k` of the sorted iterable, without sorting it.
+
+    Partitions the items around a pivot like quick_sort, but only keeps going into the part that contains `k`
+    (average complexity - O(n)). Falls back to heap sort if partitioning goes too deep, so the worst case is O(n log n).
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable to select the item from.
+    - k : int
+        Index of the item in the sorted iterable.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to count from the biggest item.
+        (default = False)
+
+    Returns
+    -------
+    - Any
+        The `k`-th item.
+
+    Raises
+    ------
+    - IndexError
+        If `k` is out of range of the iterable.
+    """
+
+    records = decorate(iterable, key)
+    if not 0 <= k < len(records):
+        raise IndexError("k is out of range of the iterable.")
+
+    low, high = 0, len(records) - 1
+    depth_limit = 2 * len(records).bit_length()
+    while high - low + 1 > _INSERTION_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort(records, low, high, record_key, reverse)
+            return records[k][2]
+        depth_limit -= 1
+
+        pivot_low, pivot_high = _inner_sort_three_way(records, low, high, record_key, reverse)
+        if k < pivot_low:
+            high = pivot_low - 1
+        elif k > pivot_high:
+            low = pivot_high + 1
+        else:
+            return records[k][2]
+
+    _binary_insertion_sort(records, low, high, record_key, reverse)
+    return records[k][2]
+
+def _is_worse(left: tuple, right: tuple, reverse: bool) -> bool:
+    """
+    Inner function for partial_sort.
+
+    Returns `True` if the `left` record would go after the `right` one in the sorted iterable (later index loses ties).
+    """
+
+    if left[0] == right[0]:
+        return left[1] > right[1]
+    return left[0] < right[0] if reverse else left[0] > right[0]
+
+def _sift_up(heap: list, i: int, reverse: bool):
+    """Inner function for partial_sort. Moves the record up the heap while it's worse than its parent."""
+
+    while i > 0:
+        parent = (i - 1) // 2
+        if not _is_worse(heap[i], heap[parent], reverse):
+            return
+        heap[i], heap[parent] = heap[parent], heap[i]
+        i = parent
+
+def _sift_down(heap: list, i: int, reverse: bool):
+    """Inner function for partial_sort. Moves the record down the heap while one of its children is worse."""
+
+    while True:
+        child = 2*i + 1
+        if child >= len(heap):
+            return
+        if child + 1 < len(heap) and _is_worse(heap[child + 1], heap[child], reverse):
+            child += 1
+        if not _is_worse(heap[child], heap[i], reverse):
+            return
+        heap[i], heap[child] = heap[child], heap[i]
+        i = child
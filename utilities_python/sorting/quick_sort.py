@@ -4,73 +4,196 @@ from collections.abc import Callable, Iterable
 from typing import Any
 from numbers import Number
 from utilities_python.shuffle import shuffle
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._inplace import check_inplace, inplace_key
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.heap_sort import _inner_sort as _heap_sort
+from utilities_python.sorting.insertion_sort import _inner_sort_binary as _insertion_sort
+from utilities_python.sorting.stats import instrumented, recursive
 
 
-def quick_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reverse: bool = False, shuffling: bool = True) -> list:
+_INSERTION_CUTOFF = 16
+_NINTHER_CUTOFF = 128
+
+
+@instrumented
+def quick_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, shuffling: bool = False, three_way: bool = False, backend: str = "auto", inplace: bool = False) -> list | None:
     """
-    Sorts a shuffled (can be turned off) copy of the iterable in place and returns it as a list.
+    Sorts a copy of the iterable in place and returns it as a list.
+
+    Introsort: picks median-of-three (ninther for big parts) pivots, leaves small parts to insertion sort
+    and falls back to heap sort if partitioning goes too deep, so the worst case is O(n log n).
+
+    Pros: fast, in-place, no need to shuffle pre-sorted iterables, close to O(n) on few unique keys (if `three_way` is set).
+    Cons: unstable.
 
-    Pros: fast, in-place.
-    Cons: Slow if iterable is pre-sorted (shuffles it by default), unstable, recursive.
-    
     Parameters
     ----------
     - iterable : Iterable
         Iterable that needs to be sorted.
-    - key : func, optional
-        Function that returns key used for sorting.
-        (default = lambda x: x)
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
     - reverse : bool, optional
         Set to True to sort from biggest to lowest.
         (default = False)
     - shuffling : bool, optional
-        Shuffles the iterable to make sure it isn't pre-sorted.
-        (default = True)
+        Shuffles the iterable before sorting. Not needed to avoid the worst case anymore.
+        (default = False)
+    - three_way : bool, optional
+        Set to True to split parts into items before, equal to and after the pivot in one pass.
+        Equal items are never touched again, which is a lot faster when many items share a key.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - inplace : bool, optional
+        Set to True to sort a list, `array.array` or writable memoryview itself instead of a copy and return `None`.
+        Uses O(1) extra memory, but calls `key` on every comparison instead of once per item.
+        (default = False)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
 
     Returns
     -------
-    - list
-        Sorted *copy* of the iterable.
+    - list | None
+        Sorted *copy* of the iterable, or `None` if `inplace` is set.
     """
 
-    iterable = shuffle(iterable) if shuffling else list(iterable)
+    _numpy_backend.check_backend(backend)
+    if inplace:
+        check_inplace(iterable, backend)
+        key = inplace_key(key, iterable)
+        if shuffling:
+            shuffle(iterable, inplace=True)
+        _inner_recursion(iterable, 0, len(iterable) - 1, key, reverse, 2 * len(iterable).bit_length(), three_way)
+        return None
+
+    records = decorate(shuffle(iterable) if shuffling else iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=False)
+        if final is not None:
+            return final
+
     low = 0
-    high = len(iterable) - 1
+    high = len(records) - 1
+
+    _inner_recursion(records, low, high, record_key, reverse, 2 * len(records).bit_length(), three_way)
 
-    _inner_recursion(iterable, low, high, key, reverse)
+    return undecorate(records)
 
-    return iterable
-    
-def _inner_recursion(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any], reverse: bool):
+@recursive
+def _inner_recursion(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool, depth_limit: int, three_way: bool):
     """
-    Inner recursive function for quick_sort. 
-    
-    Calls _inner_sort, gets a pivot, then calls itself twice to the left and around parts around the pivot.
+    Inner recursive function for quick_sort.
+
+    Calls _inner_sort (or _inner_sort_three_way) to get the pivot's place, then calls itself on the smaller part
+    around the pivot and loops on the larger one, so the recursion depth stays under log2(n).
+    Parts shorter than `_INSERTION_CUTOFF` are finished with binary insertion sort and parts still unsorted
+    after `depth_limit` partitions are finished with heap sort.
     """
 
-    if low < high:
-        pivot = _inner_sort(iterable, low, high, key, reverse)
-        _inner_recursion(iterable, low, pivot-1, key, reverse)
-        _inner_recursion(iterable, pivot+1, high, key, reverse)
+    while high - low + 1 > _INSERTION_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort(iterable, low, high, key, reverse)
+            return
+        depth_limit -= 1
+
+        if three_way:
+            pivot_low, pivot_high = _inner_sort_three_way(iterable, low, high, key, reverse)
+        else:
+            pivot_low = pivot_high = _inner_sort(iterable, low, high, key, reverse)
 
+        if pivot_low - low < high - pivot_high:
+            _inner_recursion(iterable, low, pivot_low-1, key, reverse, depth_limit, three_way)
+            low = pivot_high + 1
+        else:
+            _inner_recursion(iterable, pivot_high+1, high, key, reverse, depth_limit, three_way)
+            high = pivot_low - 1
 
-def _inner_sort(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any], reverse: bool) -> int:
+    _insertion_sort(iterable, low, high, key, reverse)
+
+def _inner_sort(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool) -> int:
     """
-    Inner function for quick_sort. 
-    
-    Chooses the last object in the chosen part of the list as pivot and sorts around it.
+    Inner function for quick_sort.
+
+    Moves the pivot chosen by _choose_pivot to the end of the chosen part of the list and sorts around it.
     """
-    
-    pivot = key(iterable[high]) 
+
+    chosen = _choose_pivot(iterable, low, high, key)
+    iterable[chosen], iterable[high] = iterable[high], iterable[chosen]
+
+    pivot = iterable[high] if key is None else key(iterable[high])
     i = low - 1
     for j in range(low, high):
-        if (
-                ((not reverse and key(iterable[j]) < pivot) 
-                or (reverse and key(iterable[j]) > pivot)) 
-            ):
+        val = iterable[j] if key is None else key(iterable[j])
+        if (not reverse and val < pivot) or (reverse and val > pivot):
             i+=1
-            iterable[i], iterable[j] = iterable[j], iterable[i] 
-        
+            iterable[i], iterable[j] = iterable[j], iterable[i]
+
     i+=1
-    iterable[i], iterable[high] = iterable[high], iterable[i] 
-    return i
\ No newline at end of file
+    iterable[i], iterable[high] = iterable[high], iterable[i]
+    return i
+
+def _inner_sort_three_way(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool) -> tuple[int, int]:
+    """
+    Inner function for quick_sort.
+
+    Sorts the chosen part of the list around the pivot chosen by _choose_pivot in one pass (Dutch national flag)
+    and returns the first and the last index of the items equal to the pivot.
+    """
+
+    pivot = iterable[_choose_pivot(iterable, low, high, key)]
+    if key is not None:
+        pivot = key(pivot)
+    lt, i, gt = low, low, high
+    while i <= gt:
+        val = iterable[i] if key is None else key(iterable[i])
+        if (not reverse and val < pivot) or (reverse and val > pivot):
+            iterable[lt], iterable[i] = iterable[i], iterable[lt]
+            lt += 1
+            i += 1
+        elif (not reverse and val > pivot) or (reverse and val < pivot):
+            iterable[i], iterable[gt] = iterable[gt], iterable[i]
+            gt -= 1
+        else:
+            i += 1
+
+    return lt, gt
+
+def _choose_pivot(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None) -> int:
+    """
+    Inner function for quick_sort.
+
+    Returns the index of the median of the first, middle and last items.
+    For parts longer than `_NINTHER_CUTOFF` returns the median of three such medians (ninther) instead.
+    """
+
+    middle = (low + high) // 2
+    if high - low + 1 <= _NINTHER_CUTOFF:
+        return _median_of_three(iterable, low, middle, high, key)
+
+    step = (high - low + 1) // 8
+    return _median_of_three(
+        iterable,
+        _median_of_three(iterable, low, low + step, low + 2*step, key),
+        _median_of_three(iterable, middle - step, middle, middle + step, key),
+        _median_of_three(iterable, high - 2*step, high - step, high, key),
+        key)
+
+def _median_of_three(iterable: Iterable, a: int, b: int, c: int, key: Callable[[Any], Any] | None) -> int:
+    """Inner function for quick_sort. Returns the index of the median of the three items (same for both directions)."""
+
+    a_val, b_val, c_val = iterable[a], iterable[b], iterable[c]
+    if key is not None:
+        a_val, b_val, c_val = key(a_val), key(b_val), key(c_val)
+    if a_val < b_val:
+        if b_val < c_val:
+            return b
+        return c if a_val < c_val else a
+    if a_val < c_val:
+        return a
+    return c if b_val < c_val else b
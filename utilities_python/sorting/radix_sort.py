@@ -0,0 +1,131 @@
+from collections.abc import Iterable
+from numbers import Integral
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.insertion_sort import _inner_sort_binary as _binary_insertion_sort
+from utilities_python.sorting import _numpy_backend
+
+
+_DIGIT_BITS = 8
+_DIGIT_MASK = (1 << _DIGIT_BITS) - 1
+_MSD_CUTOFF = 32
+
+
+def radix_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, backend: str = "auto") -> list:
+    """
+    Sorts the iterable digit by digit without comparing keys. Then returns it as a list.
+
+    Integer keys are sorted from the least significant byte (LSD), complexity - O(n * k), where k is the amount of bytes
+    in the biggest difference between keys. String and bytes keys are sorted from the first character (MSD),
+    complexity - O(n * k), where k is the average length of the common prefixes.
+
+    Pros: linear, stable.
+    Cons: only works with integer, string or bytes keys, requires O(n) memory.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Has to return integers, strings or bytes (but not a mix).
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer keys as a NumPy array (requires NumPy). String keys are always sorted in Python.
+        Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+
+    Returns
+    -------
+    - list
+        Sorted *copy* of the iterable.
+
+    Raises
+    ------
+    - TypeError
+        If `key` returns something other than integers, strings or bytes, or a mix of them.
+    """
+
+    _numpy_backend.check_backend(backend)
+    records = decorate(iterable, key)
+    if len(records) == 0:
+        return []
+
+    if all(isinstance(record[0], Integral) for record in records):
+        if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+            order = _numpy_backend.integer_order([record[0] for record in records], reverse)
+            if order is not None:
+                return [records[i][2] for i in order]
+        return undecorate(_inner_sort_lsd(records, reverse))
+
+    for key_type in (str, bytes):
+        if all(isinstance(record[0], key_type) for record in records):
+            return undecorate(_inner_sort_msd(records, reverse))
+
+    raise TypeError("radix_sort only supports integer, string or bytes keys of the same type.")
+
+def _inner_sort_lsd(iterable: list, reverse: bool) -> list:
+    """
+    Inner function for radix_sort.
+
+    Distributes the records into buckets by one byte of the key at a time, starting from the least significant one.
+    Every pass is stable, so the order of the previous bytes is kept for equal bytes.
+    """
+
+    low = min(record[0] for record in iterable)
+    high = max(record[0] for record in iterable)
+    shift = 0
+
+    while True:
+        buckets = [[] for _ in range(_DIGIT_MASK + 1)]
+        for record in iterable:
+            buckets[((record[0] - low) >> shift) & _DIGIT_MASK].append(record)
+        if reverse:
+            buckets.reverse()
+        iterable = [record for bucket in buckets for record in bucket]
+
+        shift += _DIGIT_BITS
+        if (high - low) >> shift == 0:
+            return iterable
+
+def _inner_sort_msd(iterable: list, reverse: bool) -> list:
+    """
+    Inner function for radix_sort.
+
+    Splits the records into groups by the first character of the key, then splits each group by the next character
+    and so on, keeping a stack of groups instead of recursing. Keys that end at the current character go before the rest.
+    Groups shorter than `_MSD_CUTOFF` are finished with binary insertion sort.
+    """
+
+    final = []
+    stack = [(iterable, 0, False)]
+
+    while stack:
+        group, depth, finished = stack.pop()
+        if finished:
+            final.extend(group)
+            continue
+        if len(group) <= _MSD_CUTOFF:
+            _binary_insertion_sort(group, 0, len(group) - 1, record_key, reverse)
+            final.extend(group)
+            continue
+
+        ended = []
+        buckets = {}
+        for record in group:
+            if len(record[0]) == depth:
+                ended.append(record)
+            else:
+                buckets.setdefault(record[0][depth], []).append(record)
+
+        groups = [(buckets[char], depth + 1, False) for char in sorted(buckets, reverse=reverse)]
+        if reverse:
+            groups.append((ended, depth, True))
+        else:
+            groups.insert(0, (ended, depth, True))
+        stack.extend(reversed(groups))
+
+    return final
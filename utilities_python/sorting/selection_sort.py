@@ -1,9 +1,16 @@
+# pyright: reportIndexIssue=false
+
 from collections.abc import Callable, Iterable
 from typing import Any
 from numbers import Number
+from utilities_python.sorting import _numpy_backend
+from utilities_python.sorting._inplace import check_inplace, inplace_key
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.stats import instrumented
 
 
-def selection_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x, reverse: bool = False) -> list:
+@instrumented
+def selection_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, backend: str = "auto", inplace: bool = False) -> list | None:
     """
     Sorts a copy of the iterable in place and returns it as a list.
 
@@ -14,30 +21,62 @@ def selection_sort(iterable: Iterable, key: Callable[[Any], Any] = lambda x: x,
     ----------
     - iterable : Iterable
         Iterable that needs to be sorted.
-    - key : func, optional
-        Function that returns key used for sorting.
-        (default = lambda x: x)
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
     - reverse : bool, optional
         Set to True to sort from biggest to lowest.
         (default = False)
+    - backend : str, optional
+        Set to "numpy" to sort integer, float and boolean keys with `numpy.argsort` (requires NumPy).
+        Other keys are still sorted in Python. Set to "python" to always sort in Python.
+        (default = "auto", NumPy for NumPy arrays and iterables of at least 256 items without a key function)
+    - inplace : bool, optional
+        Set to True to sort a list, `array.array` or writable memoryview itself instead of a copy and return `None`.
+        Uses O(1) extra memory, but calls `key` on every comparison instead of once per item.
+        (default = False)
+    - stats : SortStats, optional
+        Collects comparisons, key calls, writes, call depth and time of this call (see `stats.py`).
+        (default = None)
 
     Returns
     -------
-    - list
-        Sorted *copy* of the iterable.
+    - list | None
+        Sorted *copy* of the iterable, or `None` if `inplace` is set.
+    """
+
+    _numpy_backend.check_backend(backend)
+    if inplace:
+        check_inplace(iterable, backend)
+        key = inplace_key(key, iterable)
+        _inner_sort(iterable, 0, len(iterable) - 1, key, reverse)
+        return None
+
+    records = decorate(iterable, key)
+    if _numpy_backend.use_numpy(backend, iterable, key, len(records)):
+        final = _numpy_backend.sort_records(records, reverse, stable=False)
+        if final is not None:
+            return final
+
+    _inner_sort(records, 0, len(records) - 1, record_key, reverse)
+
+    return undecorate(records)
+
+def _inner_sort(iterable: Iterable, low: int, high: int, key: Callable[[Any], Any] | None, reverse: bool):
     """
+    Inner function for selection_sort.
 
-    iterable = list(iterable)
+    Sorts `iterable[low:high+1]` in place by swapping the next smallest (biggest if `reverse`) item into each position.
+    """
 
-    for i in range(0, len(iterable)):
+    for i in range(low, high + 1):
         next_i = i
-        for j in range(i+1, len(iterable)):
-            next_val = key(iterable[next_i])
-            current_val = key(iterable[j])
+        next_val = iterable[i] if key is None else key(iterable[i])
+        for j in range(i+1, high + 1):
+            current_val = iterable[j] if key is None else key(iterable[j])
 
             if (not reverse and current_val < next_val) or (reverse and current_val > next_val):
-                next_i = j
+                next_i, next_val = j, current_val
         
-        iterable[i], iterable[next_i] = iterable[next_i], iterable[i]
-
-    return iterable
\ No newline at end of file
+        iterable[i], iterable[next_i] = iterable[next_i], iterable[i]
\ No newline at end of file
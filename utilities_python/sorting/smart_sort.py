@@ -0,0 +1,164 @@
+from collections.abc import Iterable
+from numbers import Integral
+from utilities_python.sorting._keys import KeySpec, decorate, record_key, undecorate
+from utilities_python.sorting.insertion_sort import _inner_sort_binary as _binary_insertion_sort
+from utilities_python.sorting.merge_sort import _inner_adaptive
+from utilities_python.sorting.quick_sort import _inner_recursion as _quick_sort
+from utilities_python.sorting.radix_sort import _inner_sort_lsd
+
+
+# Thresholds used to choose the algorithm, can be changed for tuning
+TINY_SIZE = 16
+SAMPLE_SIZE = 256
+PRESORTED_RATIO = 0.1 # Share of sampled neighbours out of order below which the input counts as nearly sorted
+DUPLICATE_RATIO = 0.5 # Share of repeated keys in the sample above which the input counts as duplicate-heavy
+RADIX_MAX_BITS = 32 # Biggest difference between integer keys (in bits) that radix sort is used for
+
+
+class SortChoice:
+    """
+    Algorithm chosen by `smart_sort` and the sampled features of the input it was chosen by.
+
+    Attributes
+    ----------
+    - algorithm : str
+        One of "insertion", "adaptive_merge", "radix", "three_way_quick" or "quick".
+
+    - reason : str
+        Short explanation of the choice.
+
+    - size : int
+        Amount of items.
+
+    - unsorted_ratio : float
+        Share of sampled neighbouring keys that are out of order (in the closer of both directions).
+
+    - duplicate_ratio : float
+        Share of sampled keys that repeat another sampled key (0 if the keys aren't hashable).
+
+    - key_type : str
+        "int" if all keys are integers, otherwise "other".
+    """
+
+    def __init__(self):
+        self.algorithm = ""
+        self.reason = ""
+        self.size = 0
+        self.unsorted_ratio = 0.0
+        self.duplicate_ratio = 0.0
+        self.key_type = "other"
+
+    def __repr__(self):
+        return f"SortChoice({self.algorithm}, reason={self.reason!r})"
+
+
+def smart_sort(iterable: Iterable, key: KeySpec = None, reverse: bool = False, stable: bool = True, choice: SortChoice | None = None) -> list:
+    """
+    Samples the iterable and sorts it with the algorithm that fits it best. Then returns it as a list.
+
+    - Up to `TINY_SIZE` items - binary insertion sort.
+    - Nearly sorted or reverse sorted - adaptive merge sort (close to O(n)).
+    - Integer keys with a difference up to `RADIX_MAX_BITS` bits - LSD radix sort.
+    - Many duplicate keys and `stable=False` - three-way quick sort.
+    - Otherwise adaptive merge sort, or quick sort if `stable=False`.
+
+    Parameters
+    ----------
+    - iterable : Iterable
+        Iterable that needs to be sorted.
+    - key : func | str | int | tuple, optional
+        Function that returns key used for sorting. Called exactly once per item.
+        Field names/indexes (or a tuple of them) are fetched with `operator.attrgetter`/`itemgetter`.
+        (default = None, sorts by the items themselves)
+    - reverse : bool, optional
+        Set to True to sort from biggest to lowest.
+        (default = False)
+    - stable : bool, optional
+        Set to False to allow algorithms that don't keep the order of equal items.
+        (default = True)
+    - choice : SortChoice, optional
+        Gets filled with the chosen algorithm, the reason and the sampled features.
+        (default = None)
+
+    Returns
+    -------
+    - list
+        Sorted *copy* of the iterable.
+    """
+
+    records = decorate(iterable, key)
+    choice = _choose(records, stable, choice if choice is not None else SortChoice())
+
+    high = len(records) - 1
+    if choice.algorithm == "insertion":
+        _binary_insertion_sort(records, 0, high, record_key, reverse)
+    elif choice.algorithm == "radix":
+        records = _inner_sort_lsd(records, reverse)
+    elif choice.algorithm in ("three_way_quick", "quick"):
+        _quick_sort(records, 0, high, record_key, reverse, 2 * len(records).bit_length(), choice.algorithm == "three_way_quick")
+    else:
+        records = _inner_adaptive(records, record_key, reverse)
+
+    return undecorate(records)
+
+def choose_sort(iterable: Iterable, key: KeySpec = None, stable: bool = True) -> SortChoice:
+    """
+    Returns the `SortChoice` that `smart_sort` would make for the iterable, without sorting it.
+    """
+
+    return _choose(decorate(iterable, key), stable, SortChoice())
+
+def _choose(records: list, stable: bool, choice: SortChoice) -> SortChoice:
+    """
+    Inner function for smart_sort.
+
+    Samples evenly spaced neighbouring pairs for presortedness and evenly spaced keys for duplicates.
+    Integer keys and their range are checked on all records, since radix sort needs them anyway.
+    """
+
+    size = choice.size = len(records)
+    if size <= TINY_SIZE:
+        choice.algorithm, choice.reason = "insertion", f"{size} items, at most {TINY_SIZE}"
+        return choice
+
+    step = max(1, (size - 1) // SAMPLE_SIZE)
+    pairs = range(0, size - 1, step)
+    ascending = sum(records[i][0] < records[i + 1][0] for i in pairs)
+    descending = sum(records[i][0] > records[i + 1][0] for i in pairs)
+    # Adaptive merge sort handles runs in both directions, so the closer direction counts
+    choice.unsorted_ratio = min(ascending, descending) / len(pairs)
+
+    sample = [records[i][0] for i in range(0, size, max(1, size // SAMPLE_SIZE))]
+    try:
+        choice.duplicate_ratio = 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        choice.duplicate_ratio = 0.0
+
+    if all(isinstance(record[0], Integral) for record in records):
+        choice.key_type = "int"
+
+    if choice.unsorted_ratio <= PRESORTED_RATIO:
+        choice.algorithm = "adaptive_merge"
+        choice.reason = f"nearly sorted, {choice.unsorted_ratio:.0%} of sampled neighbours out of order"
+        return choice
+
+    if choice.key_type == "int":
+        bits = (max(record[0] for record in records) - min(record[0] for record in records)).bit_length()
+        if bits <= RADIX_MAX_BITS:
+            choice.algorithm, choice.reason = "radix", f"integer keys within {bits} bits"
+            return choice
+
+    if choice.duplicate_ratio >= DUPLICATE_RATIO:
+        if not stable:
+            choice.algorithm = "three_way_quick"
+            choice.reason = f"{choice.duplicate_ratio:.0%} of sampled keys are duplicates"
+            return choice
+        choice.algorithm = "adaptive_merge"
+        choice.reason = f"{choice.duplicate_ratio:.0%} of sampled keys are duplicates, but the sort has to be stable"
+        return choice
+
+    if stable:
+        choice.algorithm, choice.reason = "adaptive_merge", "no pattern found, stable"
+    else:
+        choice.algorithm, choice.reason = "quick", "no pattern found, unstable allowed"
+    return choice
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, MutableSequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import signature
+from typing import Any
+import time
+
+
+_profile: ContextVar[list | None] = ContextVar("_profile", default=None)
+_current: ContextVar[SortStats | None] = ContextVar("_current", default=None)
+
+
+class SortStats:
+    """
+    Counters collected during a single sort call. Pass one as `stats` to a sort or use `profile()` to collect them.
+
+    Attributes
+    ----------
+    - name : str
+        Name of the sort function.
+
+    - size : int
+        Amount of sorted items.
+
+    - comparisons : int
+        Amount of comparisons between keys.
+
+    - key_calls : int
+        Amount of `key` calls. Stays 0 without a key, the items themselves are compared then.
+
+    - writes : int
+        Amount of items written into the list being sorted (a swap counts as 2, a slice assignment as its length).
+        Merge sorts also write into separate buffers, which aren't counted.
+
+    - max_depth : int
+        Deepest recursion of the sort (calls of its recursive helper nested in each other).
+        Stays 0 for sorts that don't recurse, like the iterative and adaptive merge sorts.
+
+    - wall_time : float
+        Time spent in the call, in seconds.
+    """
+
+    def __init__(self):
+        self.name = ""
+        self.size = 0
+        self.comparisons = 0
+        self.key_calls = 0
+        self.writes = 0
+        self.max_depth = 0
+        self.wall_time = 0.0
+        self._depth = 0
+
+    def __repr__(self):
+        return (
+            f"SortStats({self.name}, size={self.size}, comparisons={self.comparisons}, key_calls={self.key_calls}, "
+            f"writes={self.writes}, max_depth={self.max_depth}, wall_time={self.wall_time:.6f})")
+
+
+@contextmanager
+def profile() -> Iterator[list[SortStats]]:
+    """
+    Context manager that collects `SortStats` of every instrumented sort called inside it, without changing the calls.
+
+    ```python
+    with profile() as calls:
+        quick_sort(items, key=lambda item: item.val)
+    print(calls[0].comparisons)
+    ```
+    """
+
+    calls = []
+    token = _profile.set(calls)
+    try:
+        yield calls
+    finally:
+        _profile.reset(token)
+
+def instrumented(sort: Callable) -> Callable:
+    """
+    Decorator that adds the `stats` argument to a sort function.
+
+    Without `stats` and outside of `profile()` only adds a single check to the call. Otherwise wraps `key`
+    and the cached keys to count calls and comparisons, and the list being sorted to count writes.
+    Keys are wrapped, so the NumPy backend falls back to sorting in Python while measured.
+    """
+
+    sort_signature = signature(sort)
+
+    @wraps(sort)
+    def wrapper(*args, stats: SortStats | None = None, **kwargs):
+        calls = _profile.get()
+        if stats is None and calls is None:
+            return sort(*args, **kwargs)
+
+        stats = stats if stats is not None else SortStats()
+        if calls is not None:
+            calls.append(stats)
+
+        arguments = sort_signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        stats.name = sort.__name__
+        arguments.arguments["key"] = _counting_key(arguments.arguments["key"], stats)
+        if arguments.arguments.get("inplace"):
+            sequence = arguments.arguments["iterable"]
+            stats.size = len(sequence)
+            if isinstance(sequence, (MutableSequence, memoryview)):
+                arguments.arguments["iterable"] = _CountingSequence(sequence, stats)
+
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            return sort(*arguments.args, **arguments.kwargs)
+        finally:
+            stats.wall_time = time.perf_counter() - start
+            _current.reset(token)
+
+    return wrapper
+
+def recursive(helper: Callable) -> Callable:
+    """
+    Decorator for the recursive helpers of the sorts. Counts how deep their calls are nested into `max_depth`
+    of the sort being measured. Otherwise only adds a single check to every call.
+    """
+
+    @wraps(helper)
+    def wrapper(*args):
+        stats = _current.get()
+        if stats is None:
+            return helper(*args)
+
+        stats._depth += 1
+        if stats._depth > stats.max_depth:
+            stats.max_depth = stats._depth
+        try:
+            return helper(*args)
+        finally:
+            stats._depth -= 1
+
+    return wrapper
+
+def counting_records(records: list) -> list:
+    """
+    Used by `decorate`. Returns the records as a list that counts writes if a sort is being measured,
+    otherwise returns them unchanged.
+    """
+
+    stats = _current.get()
+    if stats is None:
+        return records
+    stats.size = len(records)
+    return _CountingList(records, stats)
+
+
+def _counting_key(key: Any, stats: SortStats) -> Callable[[Any], Any]:
+    # Imported here, because _keys imports this module
+    from utilities_python.sorting._keys import compile_key
+
+    compiled = False
+    def counting_key(item):
+        nonlocal key, compiled
+        if not compiled:
+            key, compiled = compile_key(key, item), True
+        if key is None:
+            return _CountedKey(item, stats)
+        stats.key_calls += 1
+        return _CountedKey(key(item), stats)
+    return counting_key
+
+
+class _CountedKey:
+    """Wrapper of a key that counts comparisons."""
+
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value: Any, stats: SortStats):
+        self.value = value
+        self.stats = stats
+
+    def __repr__(self):
+        return repr(self.value)
+
+    def _count(self):
+        self.stats.comparisons += 1
+
+    def __lt__(self, other):
+        self._count()
+        return self.value < _unwrap(other)
+
+    def __le__(self, other):
+        self._count()
+        return self.value <= _unwrap(other)
+
+    def __gt__(self, other):
+        self._count()
+        return self.value > _unwrap(other)
+
+    def __ge__(self, other):
+        self._count()
+        return self.value >= _unwrap(other)
+
+    def __eq__(self, other):
+        self._count()
+        return self.value == _unwrap(other)
+
+    def __ne__(self, other):
+        self._count()
+        return self.value != _unwrap(other)
+
+    __hash__ = None # pyright: ignore[reportAssignmentType]
+
+def _unwrap(value: Any) -> Any:
+    return value.value if isinstance(value, _CountedKey) else value
+
+
+class _CountingList(list):
+    """List of records that counts item writes."""
+
+    def __init__(self, records: list, stats: SortStats):
+        super().__init__(records)
+        self._stats = stats
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self._stats.writes += len(value)
+        else:
+            self._stats.writes += 1
+        super().__setitem__(index, value)
+
+
+class _CountingSequence(MutableSequence):
+    """Wrapper of a sequence sorted in place that counts item writes."""
+
+    def __init__(self, sequence: MutableSequence | memoryview, stats: SortStats):
+        self._sequence = sequence
+        self._stats = stats
+
+    def __len__(self):
+        return len(self._sequence)
+
+    def __getitem__(self, index):
+        return self._sequence[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._stats.writes += len(range(*index.indices(len(self._sequence))))
+        else:
+            self._stats.writes += 1
+        self._sequence[index] = value
+
+    def __delitem__(self, index):
+        del self._sequence[index] # pyright: ignore[reportIndexIssue]
+
+    def insert(self, index, value):
+        self._sequence.insert(index, value) # pyright: ignore[reportAttributeAccessIssue]
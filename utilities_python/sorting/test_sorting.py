@@ -1,9 +1,30 @@
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
+from array import array
+from utilities_python.sorting import benchmark
+from utilities_python.sorting._inplace import inplace_key
+from utilities_python.sorting._keys import compile_key, decorate
 from utilities_python.sorting.bubble_sort import bubble_sort
+from utilities_python.sorting.counting_sort import counting_sort
+from utilities_python.sorting.external_sort import external_sort
+from utilities_python.sorting.heap_sort import heap_sort
 from utilities_python.sorting.merge_sort import merge_sort
+from utilities_python.sorting.parallel_merge_sort import parallel_merge_sort
+from utilities_python.sorting.partial_sort import nlargest, nsmallest, partial_sort, quick_select
 from utilities_python.sorting.insertion_sort import insertion_sort
 from utilities_python.sorting.quick_sort import quick_sort
+from utilities_python.sorting.radix_sort import radix_sort
 from utilities_python.sorting.selection_sort import selection_sort
+from utilities_python.sorting.smart_sort import SortChoice, choose_sort, smart_sort
+from utilities_python.sorting.stats import SortStats, profile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Node():
@@ -108,6 +129,80 @@ class TestSorting(unittest.TestCase):
         nodes2 = merge_sort(nodes2, key=lambda node: node.val, reverse=True)
         self.assertEqual(nodes2, self.nodes2_reverse)
 
+    def test__sort__merge_iterative__numbers(self):
+        nums = self.nums.copy()
+        nums = merge_sort(nums, iterative=True)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__merge_iterative__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = merge_sort(nums, reverse=True, iterative=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__merge_iterative__stability(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = merge_sort(nodes2, key=lambda node: node.val, iterative=True)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__merge_iterative__stability_reverse(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = merge_sort(nodes2, key=lambda node: node.val, reverse=True, iterative=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    def test__sort__merge_adaptive__numbers(self):
+        nums = self.nums.copy()
+        nums = merge_sort(nums, adaptive=True)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__merge_adaptive__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = merge_sort(nums, reverse=True, adaptive=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__merge_adaptive__stability(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = merge_sort(nodes2, key=lambda node: node.val, adaptive=True)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__merge_adaptive__stability_reverse(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = merge_sort(nodes2, key=lambda node: node.val, reverse=True, adaptive=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    def test__sort__merge_adaptive__runs(self):
+        # Ascending, descending and equal runs long enough to be merged with galloping
+        nodes = (
+            [Node(i, "a") for i in range(100)]
+            + [Node(i, "b") for i in range(150, 50, -1)]
+            + [Node(i % 3, "c") for i in range(100)])
+        self.assertEqual(merge_sort(nodes, key=lambda node: node.val, adaptive=True), merge_sort(nodes, key=lambda node: node.val))
+        self.assertEqual(
+            merge_sort(nodes, key=lambda node: node.val, reverse=True, adaptive=True),
+            merge_sort(nodes, key=lambda node: node.val, reverse=True))
+
+    # Parallel merge sort
+    def test__sort__parallel_merge__numbers(self):
+        nums = self.nums.copy()
+        nums = parallel_merge_sort(nums, workers=2)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__parallel_merge__stability_long(self):
+        # Long enough to be split between processes, int keys go through shared memory
+        nodes = [Node(i % 7, i) for i in range(12000)]
+        expected = merge_sort(nodes, key=lambda node: node.val)
+        self.assertEqual(parallel_merge_sort(nodes, key=lambda node: node.val, workers=3), expected)
+
+    def test__sort__parallel_merge__stability_reverse_long(self):
+        nodes = [Node(i % 7 / 2, i) for i in range(12000)]
+        expected = merge_sort(nodes, key=lambda node: node.val, reverse=True)
+        self.assertEqual(parallel_merge_sort(nodes, key=lambda node: node.val, reverse=True, workers=3), expected)
+
+    def test__sort__parallel_merge__string_keys_long(self):
+        # String keys are pickled to the workers instead
+        nodes = [Node(str(i % 13), i) for i in range(12000)]
+        expected = merge_sort(nodes, key=lambda node: node.val)
+        self.assertEqual(parallel_merge_sort(nodes, key=lambda node: node.val, workers=3), expected)
+
     # Insertion sort
     def test__sort__insertion__numbers(self):
         nums = self.nums.copy()
@@ -144,6 +239,26 @@ class TestSorting(unittest.TestCase):
         nodes2 = insertion_sort(nodes2, key=lambda node: node.val, reverse=True)
         self.assertEqual(nodes2, self.nodes2_reverse)
 
+    def test__sort__insertion_binary__numbers(self):
+        nums = self.nums.copy()
+        nums = insertion_sort(nums, binary=True)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__insertion_binary__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = insertion_sort(nums, reverse=True, binary=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__insertion_binary__stability(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = insertion_sort(nodes2, key=lambda node: node.val, binary=True)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__insertion_binary__stability_reverse(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = insertion_sort(nodes2, key=lambda node: node.val, reverse=True, binary=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
     # Quick sort
     def test__sort__quick__numbers(self):
         nums = self.nums.copy()
@@ -170,6 +285,69 @@ class TestSorting(unittest.TestCase):
         nodes = quick_sort(nodes, key=lambda node: node.val, reverse=True)
         self.assertEqual(nodes, self.nodes_reverse)
 
+    def test__sort__quick__shuffling(self):
+        nums = self.nums.copy()
+        nums = quick_sort(nums, shuffling=True)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__quick__presorted_long(self):
+        # Used to hit the recursion limit without shuffling
+        nums = list(range(5000))
+        self.assertEqual(quick_sort(nums, backend="python"), nums)
+        self.assertEqual(quick_sort(nums, reverse=True, backend="python"), nums[::-1])
+
+    def test__sort__quick__equal_keys_long(self):
+        # Lomuto partitioning can't split equal keys, heap sort fallback finishes the job
+        nodes = [Node(i % 2, i) for i in range(5000)]
+        nodes = quick_sort(nodes, key=lambda node: node.val)
+        self.assertEqual([node.val for node in nodes], [0] * 2500 + [1] * 2500)
+
+    def test__sort__quick_three_way__numbers(self):
+        nums = self.nums.copy()
+        nums = quick_sort(nums, three_way=True)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__quick_three_way__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = quick_sort(nums, reverse=True, three_way=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__quick_three_way__nodes(self):
+        nodes = self.nodes.copy()
+        nodes = quick_sort(nodes, key=lambda node: node.val, three_way=True)
+        self.assertEqual(nodes, self.nodes_sorted)
+
+    def test__sort__quick_three_way__equal_keys_long(self):
+        nodes = [Node(i % 3, i) for i in range(5000)]
+        nodes = quick_sort(nodes, key=lambda node: node.val, reverse=True, three_way=True)
+        self.assertEqual([node.val for node in nodes], [2] * 1666 + [1] * 1667 + [0] * 1667)
+
+    # Heap sort
+    def test__sort__heap__numbers(self):
+        nums = self.nums.copy()
+        nums = heap_sort(nums)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__heap__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = heap_sort(nums, reverse=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__heap__numbers_tuple(self):
+        nums = self.nums_tuple
+        nums = heap_sort(nums)
+        self.assertEqual(nums, self.nums_tuple_sorted)
+
+    def test__sort__heap__nodes(self):
+        nodes = self.nodes.copy()
+        nodes = heap_sort(nodes, key=lambda node: node.val)
+        self.assertEqual(nodes, self.nodes_sorted)
+
+    def test__sort__heap__nodes_reverse(self):
+        nodes = self.nodes.copy()
+        nodes = heap_sort(nodes, key=lambda node: node.val, reverse=True)
+        self.assertEqual(nodes, self.nodes_reverse)
+
     # Selection sort
     def test__sort__selection__numbers(self):
         nums = self.nums.copy()
@@ -196,6 +374,472 @@ class TestSorting(unittest.TestCase):
         nodes = selection_sort(nodes, key=lambda node: node.val, reverse=True)
         self.assertEqual(nodes, self.nodes_reverse)
 
+    # Counting sort
+    def test__sort__counting__numbers(self):
+        nums = self.nums.copy()
+        nums = counting_sort(nums)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__counting__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = counting_sort(nums, reverse=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__counting__stability(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = counting_sort(nodes2, key=lambda node: node.val)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__counting__stability_reverse(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = counting_sort(nodes2, key=lambda node: node.val, reverse=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    def test__sort__counting__float_keys__exception(self):
+        with self.assertRaises(TypeError):
+            counting_sort([1.5, 0.5])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__counting__numpy(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = counting_sort(nodes2, key=lambda node: node.val, reverse=True, backend="numpy")
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    # Radix sort
+    def test__sort__radix__numbers(self):
+        nums = self.nums.copy()
+        nums = radix_sort(nums)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__radix__numbers_reverse(self):
+        nums = self.nums.copy()
+        nums = radix_sort(nums, reverse=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__radix__stability(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = radix_sort(nodes2, key=lambda node: node.val)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__radix__stability_reverse(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = radix_sort(nodes2, key=lambda node: node.val, reverse=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    def test__sort__radix__strings(self):
+        words = ["banana", "", "apple", "band", "ban", "apple pie", "b"] * 10
+        self.assertEqual(radix_sort(words), sorted(words))
+        self.assertEqual(radix_sort(words, reverse=True), sorted(words, reverse=True))
+
+    def test__sort__radix__bytes(self):
+        words = [b"banana", b"", b"apple", b"band", b"ban"]
+        self.assertEqual(radix_sort(words), [b"", b"apple", b"ban", b"banana", b"band"])
+
+    def test__sort__radix__mixed_keys__exception(self):
+        with self.assertRaises(TypeError):
+            radix_sort([1, "one"])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__radix__numpy(self):
+        nodes2 = self.nodes2.copy()
+        nodes2 = radix_sort(nodes2, key=lambda node: node.val, backend="numpy")
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__radix__unknown_backend__exception(self):
+        with self.assertRaises(ValueError):
+            radix_sort(self.nums, backend="fortran")
+
+    # External sort
+    def test__sort__external__numbers(self):
+        nums = external_sort(self.nums, chunk_size=2)
+        self.assertEqual(list(nums), self.nums_sorted)
+
+    def test__sort__external__numbers_reverse(self):
+        nums = external_sort(self.nums, reverse=True, chunk_size=2)
+        self.assertEqual(list(nums), self.nums_reverse)
+
+    def test__sort__external__stability(self):
+        nodes2 = external_sort(self.nodes2, key=lambda node: node.val, chunk_size=2)
+        self.assertEqual(list(nodes2), self.nodes2_sorted)
+
+    def test__sort__external__stability_reverse(self):
+        nodes2 = external_sort(self.nodes2, key=lambda node: node.val, reverse=True, chunk_size=2)
+        self.assertEqual(list(nodes2), self.nodes2_reverse)
+
+    def test__sort__external__single_chunk(self):
+        nums = external_sort(num for num in self.nums)
+        self.assertEqual(list(nums), self.nums_sorted)
+
+    def test__sort__external__lazy(self):
+        consumed = []
+        def generator():
+            for num in self.nums:
+                consumed.append(num)
+                yield num
+        nums = external_sort(generator(), chunk_size=2)
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(nums), -400)
+
+    def test__sort__external__several_merge_passes(self):
+        rng = random.Random(0)
+        nodes = [Node(rng.randrange(50), i) for i in range(1000)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 100 runs merged 3 at a time need four passes before the final merge
+            sorted_nodes = list(external_sort(nodes, key="val", chunk_size=10, temp_dir=temp_dir, max_open_files=3))
+            self.assertEqual(os.listdir(temp_dir), [])
+        self.assertEqual(sorted_nodes, sorted(nodes, key=lambda node: node.val))
+        reverse_nodes = list(external_sort(nodes, key="val", reverse=True, chunk_size=10, max_open_files=3))
+        self.assertEqual(reverse_nodes, sorted(nodes, key=lambda node: node.val, reverse=True))
+
+    def test__sort__external__max_open_files__exception(self):
+        with self.assertRaises(ValueError):
+            list(external_sort(self.nums, chunk_size=2, max_open_files=1))
+
+    def test__sort__external__raises_on_call(self):
+        # Arguments are checked before the generator starts, nothing has to be iterated
+        with self.assertRaises(ValueError):
+            external_sort(self.nums, chunk_size=0)
+        with self.assertRaises(ValueError):
+            external_sort(self.nums, max_open_files=1)
+
+    # Partial sort
+    def test__sort__partial__numbers(self):
+        nums = partial_sort(self.nums, 3)
+        self.assertEqual(nums, self.nums_sorted[:3])
+
+    def test__sort__partial__numbers_reverse(self):
+        nums = partial_sort(self.nums, 3, reverse=True)
+        self.assertEqual(nums, self.nums_reverse[:3])
+
+    def test__sort__partial__stability(self):
+        nodes2 = partial_sort(self.nodes2, 5, key=lambda node: node.val)
+        self.assertEqual(nodes2, self.nodes2_sorted[:5])
+
+    def test__sort__partial__stability_reverse(self):
+        nodes2 = partial_sort(self.nodes2, 3, key=lambda node: node.val, reverse=True)
+        self.assertEqual(nodes2, self.nodes2_reverse[:3])
+
+    def test__sort__partial__k_bigger_than_iterable(self):
+        nums = partial_sort((num for num in self.nums_tuple), 10)
+        self.assertEqual(nums, self.nums_tuple_sorted)
+
+    def test__sort__partial__nsmallest_nlargest(self):
+        self.assertEqual(nsmallest(self.nums_tuple, 2), [-18, -3])
+        self.assertEqual(nlargest(self.nums_tuple, 2), [77, 16])
+
+    def test__sort__quick_select(self):
+        for k in range(len(self.nums)):
+            self.assertEqual(quick_select(self.nums, k), self.nums_sorted[k])
+            self.assertEqual(quick_select(self.nums, k, reverse=True), self.nums_reverse[k])
+
+    def test__sort__quick_select__out_of_range__exception(self):
+        with self.assertRaises(IndexError):
+            quick_select(self.nums, len(self.nums))
+
+    # NumPy backend
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__all__numpy_backend(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            self.assertEqual(sort(self.nums, backend="numpy"), self.nums_sorted)
+            self.assertEqual(sort(self.nums, reverse=True, backend="numpy"), self.nums_reverse)
+            self.assertEqual(sort(numpy.array(self.nums_tuple), backend="numpy"), self.nums_tuple_sorted)
+            self.assertEqual(sort(self.nodes, key=lambda node: node.val, backend="numpy"), self.nodes_sorted)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__stable__numpy_backend_stability(self):
+        for sort in [bubble_sort, insertion_sort, merge_sort]:
+            self.assertEqual(sort(self.nodes2, key=lambda node: node.val, backend="numpy"), self.nodes2_sorted)
+            self.assertEqual(sort(self.nodes2, key=lambda node: node.val, reverse=True, backend="numpy"), self.nodes2_reverse)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__all__auto_backend(self):
+        nums = [(i * 7919) % 1000 for i in range(1000)]
+        nodes = [Node(i % 7, i) for i in range(1000)]
+        for sort in [bubble_sort, counting_sort, heap_sort, insertion_sort, merge_sort, quick_sort, radix_sort, selection_sort]:
+            with mock.patch.object(numpy, "argsort", wraps=numpy.argsort) as argsort:
+                self.assertEqual(sort(nums), list(range(1000)))
+                self.assertEqual(sort(numpy.array(self.nums_tuple)), self.nums_tuple_sorted)
+                self.assertEqual([node.val for node in sort(nodes, key="val")], sorted(node.val for node in nodes))
+                self.assertTrue(argsort.called)
+                argsort.reset_mock()
+                # Key functions and short lists stay in Python
+                sort(nodes, key=lambda node: node.val)
+                sort(self.nums)
+                sort(nums, backend="python")
+                self.assertFalse(argsort.called)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__all__numpy_backend_fallback(self):
+        # Keys that NumPy can't sort are sorted in Python
+        words = ["pear", "apple", "fig"]
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            self.assertEqual(sort(words, backend="numpy"), ["apple", "fig", "pear"])
+            self.assertEqual(sort([2**70, 1.5, 2**70 + 1], reverse=True, backend="numpy"), [2**70 + 1, 2**70, 1.5])
+
+    # In-place mode
+    def test__sort__inplace__list(self):
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            nodes2 = self.nodes2.copy()
+            self.assertIsNone(sort(nodes2, key=lambda node: node.val, inplace=True))
+            self.assertEqual([node.val for node in nodes2], [node.val for node in self.nodes2_sorted])
+
+    def test__sort__inplace__stability(self):
+        nodes2 = self.nodes2.copy()
+        insertion_sort(nodes2, key=lambda node: node.val, reverse=True, inplace=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+        nodes2 = self.nodes2.copy()
+        insertion_sort(nodes2, key=lambda node: node.val, binary=True, inplace=True)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__inplace__array(self):
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            nums = array("q", self.nums)
+            sort(nums, reverse=True, inplace=True)
+            self.assertEqual(nums.tolist(), self.nums_reverse)
+
+    def test__sort__inplace__memoryview(self):
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            nums = array("q", self.nums)
+            sort(memoryview(nums), inplace=True)
+            self.assertEqual(nums.tolist(), self.nums_sorted)
+
+    def test__sort__inplace__quick_long(self):
+        # Long enough to go through partitioning and the binary insertion cutoff
+        nums = [(i * 7919) % 1000 for i in range(1000)]
+        quick_sort(nums, three_way=True, inplace=True)
+        self.assertEqual(nums, list(range(1000)))
+
+    def test__sort__inplace__tuple__exception(self):
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            with self.assertRaises(TypeError):
+                sort(self.nums_tuple, inplace=True)
+
+    # Key caching
+    def test__sort__all__key_called_once_per_item(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            calls = []
+            def key(node):
+                calls.append(node)
+                return node.val
+            nodes2 = sort(self.nodes2, key=key)
+            self.assertEqual([node.val for node in nodes2], [node.val for node in self.nodes2_sorted])
+            self.assertEqual(len(calls), len(self.nodes2))
+
+    def test__sort__all__generator(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            nums = sort(num for num in self.nums)
+            self.assertEqual(nums, self.nums_sorted)
+
+    # Instrumentation
+    def test__sort__stats__counters(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            stats = SortStats()
+            nodes2 = sort(self.nodes2, key=lambda node: node.val, stats=stats)
+            self.assertEqual([node.val for node in nodes2], [node.val for node in self.nodes2_sorted])
+            self.assertEqual(stats.name, sort.__name__)
+            self.assertEqual(stats.size, len(self.nodes2))
+            self.assertEqual(stats.key_calls, len(self.nodes2))
+            self.assertGreaterEqual(stats.comparisons, len(self.nodes2) - 1)
+            self.assertGreater(stats.wall_time, 0)
+
+    def test__sort__stats__depth(self):
+        # Only recursion is counted, one level per nested call of the recursive helper
+        nums = list(range(64))
+        for sort, kwargs, depth in [
+                (merge_sort, {}, 7),
+                (merge_sort, {"iterative": True}, 0),
+                (merge_sort, {"adaptive": True}, 0),
+                (heap_sort, {}, 0),
+                (insertion_sort, {}, 0)]:
+            stats = SortStats()
+            sort(nums, backend="python", stats=stats, **kwargs)
+            self.assertEqual(stats.max_depth, depth)
+
+    def test__sort__stats__writes(self):
+        stats = SortStats()
+        selection_sort(self.nums, stats=stats)
+        self.assertGreater(stats.writes, 0)
+        stats = SortStats()
+        bubble_sort(self.nums_sorted, stats=stats)
+        self.assertEqual(stats.writes, 0)
+        self.assertEqual(stats.comparisons, len(self.nums_sorted) - 1)
+
+    def test__sort__stats__inplace(self):
+        nums = array("q", self.nums)
+        stats = SortStats()
+        heap_sort(nums, inplace=True, stats=stats)
+        self.assertEqual(nums.tolist(), self.nums_sorted)
+        self.assertEqual(stats.size, len(self.nums))
+        self.assertGreater(stats.writes, 0)
+        self.assertEqual(stats.key_calls, 0)
+        stats = SortStats()
+        heap_sort(array("q", self.nums), key=abs, inplace=True, stats=stats)
+        self.assertGreater(stats.key_calls, len(self.nums))
+
+    def test__sort__stats__no_key_calls_without_key(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort]:
+            stats = SortStats()
+            self.assertEqual(sort(self.nums, stats=stats), self.nums_sorted)
+            self.assertEqual(stats.key_calls, 0)
+            self.assertGreater(stats.comparisons, 0)
+
+    def test__sort__stats__quick_depth(self):
+        nums = [(i * 7919) % 1000 for i in range(1000)]
+        stats = SortStats()
+        quick_sort(nums, stats=stats)
+        self.assertGreater(stats.max_depth, 2)
+
+    def test__sort__stats__profile(self):
+        with profile() as calls:
+            merge_sort(self.nums)
+            quick_sort(self.nums, reverse=True)
+        self.assertEqual([stats.name for stats in calls], ["merge_sort", "quick_sort"])
+        self.assertTrue(all(stats.comparisons > 0 for stats in calls))
+        merge_sort(self.nums)
+        self.assertEqual(len(calls), 2)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__sort__stats__numpy(self):
+        stats = SortStats()
+        nums = merge_sort(self.nums, backend="numpy", stats=stats)
+        self.assertEqual(nums, self.nums_sorted)
+        self.assertGreater(stats.comparisons, 0)
+
+    # Smart sort
+    def test__sort__smart__numbers(self):
+        nums = smart_sort(self.nums)
+        self.assertEqual(nums, self.nums_sorted)
+
+    def test__sort__smart__numbers_reverse(self):
+        nums = smart_sort(self.nums, reverse=True)
+        self.assertEqual(nums, self.nums_reverse)
+
+    def test__sort__smart__nodes(self):
+        nodes2 = smart_sort(self.nodes2, key=lambda node: node.val)
+        self.assertEqual(nodes2, self.nodes2_sorted)
+
+    def test__sort__smart__nodes_reverse(self):
+        nodes2 = smart_sort(self.nodes2, key=lambda node: node.val, reverse=True)
+        self.assertEqual(nodes2, self.nodes2_reverse)
+
+    def test__sort__smart__choices(self):
+        rng = random.Random(0)
+        random_nums = [rng.randrange(1000) for _ in range(1000)]
+        cases = [
+            (self.nums, True, "insertion"),
+            (list(range(1000)), True, "adaptive_merge"),
+            (list(range(1000, 0, -1)), False, "adaptive_merge"),
+            (random_nums, True, "radix"),
+            ([num * 2**40 for num in random_nums], True, "adaptive_merge"),
+            ([num * 2**40 for num in random_nums], False, "quick"),
+            ([str(num % 5) for num in random_nums], False, "three_way_quick"),
+            ([str(num % 5) for num in random_nums], True, "adaptive_merge"),
+        ]
+        for nums, stable, algorithm in cases:
+            choice = SortChoice()
+            result = smart_sort(nums, stable=stable, choice=choice)
+            self.assertEqual(result, sorted(nums))
+            self.assertEqual(choice.algorithm, algorithm)
+            self.assertEqual(choose_sort(nums, stable=stable).algorithm, algorithm)
+            self.assertTrue(choice.reason)
+
+    def test__sort__smart__stable(self):
+        nodes = [Node(i % 3, i) for i in range(300)]
+        for key in [lambda node: node.val, lambda node: str(node.val)]:
+            choice = SortChoice()
+            result = smart_sort(nodes, key=key, reverse=True, choice=choice)
+            self.assertEqual(result, sorted(nodes, key=key, reverse=True))
+
+    # Benchmark
+    def test__sort__benchmark__run(self):
+        results = benchmark.run(sizes=(10, 50), workloads=["random", "nodes", "nodes_field"], repeat=2, min_time=0)
+        self.assertEqual(len(results["results"]), len(benchmark.SORTS) * 3 * 2)
+        self.assertTrue(all(result["best"] <= result["median"] for result in results["results"]))
+
+    def test__sort__benchmark__workloads_are_reproducible(self):
+        for make_items, key in benchmark.WORKLOADS.values():
+            first = [record[0] for record in decorate(make_items(100, random.Random("0/100")), key)]
+            second = [record[0] for record in decorate(make_items(100, random.Random("0/100")), key)]
+            self.assertEqual(first, second)
+            self.assertEqual(len(first), 100)
+
+    def test__sort__benchmark__quadratic_cap(self):
+        results = benchmark.run(sizes=(benchmark.QUADRATIC_MAX_SIZE + 1,), sorts=["bubble_sort", "quick_sort"], workloads=["sorted"], repeat=1, min_time=0)
+        self.assertEqual([result["sort"] for result in results["results"]], ["quick_sort"])
+
+    def test__sort__benchmark__compare(self):
+        old = {"results": [{"sort": "quick_sort", "workload": "random", "size": 10, "best": 1.0}, {"sort": "heap_sort", "workload": "random", "size": 10, "best": 1.0}]}
+        new = {"results": [{"sort": "quick_sort", "workload": "random", "size": 10, "best": 1.5}, {"sort": "heap_sort", "workload": "random", "size": 10, "best": 1.05}]}
+        rows = benchmark.compare(old, new, threshold=0.1)
+        self.assertEqual([(row["sort"], row["regression"]) for row in rows], [("quick_sort", True), ("heap_sort", False)])
+        self.assertAlmostEqual(rows[0]["ratio"], 1.5)
+
+    def test__sort__benchmark__unknown_name__exception(self):
+        with self.assertRaises(ValueError):
+            benchmark.run(sorts=["stooge_sort"])
+
+    # Key specs
+    def test__sort__key_spec__attribute(self):
+        for sort in [bubble_sort, heap_sort, insertion_sort, merge_sort, quick_sort, selection_sort, smart_sort, parallel_merge_sort]:
+            nodes2 = sort(self.nodes2, key="val")
+            self.assertEqual([node.val for node in nodes2], [node.val for node in self.nodes2_sorted])
+
+    def test__sort__key_spec__attribute_tuple(self):
+        nodes2 = merge_sort(self.nodes2, key=("val", "val2"), reverse=True)
+        self.assertEqual([(node.val, node.val2) for node in nodes2], [(9001, None), (549, 3), (549, 2), (549, 1), (221, None), (69, None), (-1, None)])
+
+    def test__sort__key_spec__mapping(self):
+        rows = [{"ts": 3, "id": "b"}, {"ts": 1, "id": "z"}, {"ts": 3, "id": "a"}]
+        for sort in [merge_sort, quick_sort, radix_sort]:
+            self.assertEqual([row["id"] for row in sort(rows, key="ts")], ["z", "b", "a"])
+        self.assertEqual([row["id"] for row in merge_sort(rows, key=("ts", "id"))], ["z", "a", "b"])
+
+    def test__sort__key_spec__index(self):
+        pairs = [(2, "b"), (1, "c"), (3, "a")]
+        self.assertEqual(quick_sort(pairs, key=1), [(3, "a"), (2, "b"), (1, "c")])
+        self.assertEqual(counting_sort(pairs, key=0), [(1, "c"), (2, "b"), (3, "a")])
+
+    def test__sort__key_spec__inplace(self):
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            nodes2 = list(self.nodes2)
+            sort(nodes2, key="val", inplace=True)
+            self.assertEqual([node.val for node in nodes2], [node.val for node in self.nodes2_sorted])
+
+    def test__sort__key_spec__streaming(self):
+        nodes = partial_sort((node for node in self.nodes), 2, key="val", reverse=True)
+        self.assertEqual(nodes, [Node(9001), Node(549)])
+        nodes = list(external_sort((node for node in self.nodes2), key="val", chunk_size=3))
+        self.assertEqual(nodes, self.nodes2_sorted)
+
+    def test__sort__key_spec__compile(self):
+        self.assertIsNone(compile_key(None))
+        self.assertEqual(compile_key("val", Node(5))(Node(5)), 5)
+        self.assertEqual(compile_key("val", {"val": 6})({"val": 6}), 6)
+        self.assertEqual(compile_key((0, 2), (1, 2, 3))((1, 2, 3)), (1, 3))
+
+    def test__sort__key_spec__invalid__exception(self):
+        for key in [1.5, (), ("val", 1.5)]:
+            with self.assertRaises(TypeError):
+                merge_sort(self.nodes, key=key)
+
+    def test__sort__key_spec__inplace_identity_not_called(self):
+        self.assertIsNone(inplace_key(None, self.nums))
+        for sort in [heap_sort, insertion_sort, quick_sort, selection_sort]:
+            for reverse in [False, True]:
+                nums = list(range(40, 0, -1)) + list(range(40))
+                sort(nums, reverse=reverse, inplace=True)
+                self.assertEqual(nums, sorted(nums, reverse=reverse))
+
+    def test__sort__key_spec__identity_not_called(self):
+        # Without a key nothing is compiled and the items themselves are the keys of the records
+        pairs = [(node.val, i) for i, node in enumerate(self.nodes2)]
+        with mock.patch("utilities_python.sorting._keys.compile_key", side_effect=AssertionError("key compiled")):
+            records = decorate(pairs, None)
+            sorted_pairs = merge_sort(pairs)
+        self.assertTrue(all(record[0] is pair and record[2] is pair for record, pair in zip(records, pairs)))
+        self.assertEqual([record[1] for record in records], list(range(len(pairs))))
+        self.assertEqual(sorted_pairs, sorted(pairs))
+
     
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
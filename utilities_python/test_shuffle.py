@@ -0,0 +1,195 @@
+import random
+import unittest
+from array import array
+from random import Random
+from utilities_python import parallel_shuffle as parallel_shuffle_module
+from utilities_python.parallel_shuffle import parallel_permutation, parallel_shuffle
+from utilities_python.shuffle import partial_shuffle, reservoir_sample, shuffle
+from utilities_python.sorting.quick_sort import quick_sort
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestShuffle(unittest.TestCase):
+    nums = [1, 3, 2, 8, 13, 5, -400]
+
+
+    def test__shuffle__same_items(self):
+        nums = shuffle(self.nums)
+        self.assertEqual(sorted(nums), sorted(self.nums))
+        self.assertEqual(self.nums, [1, 3, 2, 8, 13, 5, -400])
+
+    def test__shuffle__generator(self):
+        nums = shuffle(num for num in self.nums)
+        self.assertEqual(sorted(nums), sorted(self.nums))
+
+    def test__shuffle__empty(self):
+        self.assertEqual(shuffle([]), [])
+        self.assertEqual(shuffle([1]), [1])
+
+    def test__shuffle__seed(self):
+        nums = list(range(100))
+        self.assertEqual(shuffle(nums, rng=42), shuffle(nums, rng=42))
+        self.assertEqual(shuffle(nums, rng="ab/1"), shuffle(nums, rng="ab/1"))
+        self.assertNotEqual(shuffle(nums, rng=42), shuffle(nums, rng=43))
+
+    def test__shuffle__global_seed(self):
+        nums = list(range(100))
+        for function in [shuffle, lambda nums: reservoir_sample(nums, 10), lambda nums: quick_sort(nums, key=lambda num: num // 10, shuffling=True)]:
+            random.seed(1)
+            first = function(nums)
+            random.seed(1)
+            self.assertEqual(function(nums), first)
+        random.seed(1)
+        first = list(nums)
+        partial_shuffle(first, 10)
+        random.seed(1)
+        second = list(nums)
+        partial_shuffle(second, 10)
+        self.assertEqual(first, second)
+
+    def test__shuffle__random_instance(self):
+        nums = list(range(100))
+        first, second = Random(7), Random(7)
+        self.assertEqual(shuffle(nums, rng=first), shuffle(nums, rng=second))
+        # The generator moves on, so the next shuffle is different
+        self.assertNotEqual(shuffle(nums, rng=first), shuffle(nums, rng=Random(7)))
+
+    def test__shuffle__uniform(self):
+        # Every one of the 6 orders of 3 items should show up about equally often
+        rng = Random(0)
+        counts = {}
+        for _ in range(6000):
+            order = tuple(shuffle([0, 1, 2], rng=rng))
+            counts[order] = counts.get(order, 0) + 1
+        self.assertEqual(len(counts), 6)
+        self.assertTrue(all(800 < count < 1200 for count in counts.values()))
+
+    def test__shuffle__inplace(self):
+        nums = list(self.nums)
+        self.assertIsNone(shuffle(nums, rng=1, inplace=True))
+        self.assertEqual(nums, shuffle(self.nums, rng=1))
+
+    def test__shuffle__inplace__array(self):
+        nums = array("q", self.nums)
+        shuffle(memoryview(nums), rng=1, inplace=True)
+        self.assertEqual(nums.tolist(), shuffle(self.nums, rng=1))
+
+    def test__shuffle__inplace__tuple__exception(self):
+        with self.assertRaisesRegex(TypeError, "Cannot shuffle tuple in place"):
+            shuffle(tuple(self.nums), inplace=True)
+
+    def test__shuffle__unknown_backend__exception(self):
+        with self.assertRaises(ValueError):
+            shuffle(self.nums, backend="cupy")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test__shuffle__numpy(self):
+        nums = list(range(1000))
+        shuffled = shuffle(nums, rng=5, backend="numpy")
+        self.assertEqual(sorted(shuffled), nums)
+        self.assertEqual(shuffled, shuffle(nums, rng=5, backend="numpy"))
+        with self.assertRaises(ValueError):
+            shuffle(nums, backend="numpy", inplace=True)
+
+    def test__shuffle__quick_sort_inplace(self):
+        nums = list(range(100, 0, -1))
+        quick_sort(nums, shuffling=True, inplace=True)
+        self.assertEqual(nums, list(range(1, 101)))
+
+    def test__reservoir_sample__size(self):
+        sample = reservoir_sample(range(1000), 10, rng=1)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+        self.assertTrue(all(0 <= num < 1000 for num in sample))
+
+    def test__reservoir_sample__short(self):
+        self.assertEqual(sorted(reservoir_sample(self.nums, 100)), sorted(self.nums))
+        self.assertEqual(reservoir_sample(self.nums, 0), [])
+        self.assertEqual(reservoir_sample([], 3), [])
+
+    def test__reservoir_sample__generator(self):
+        sample = reservoir_sample((num for num in range(100_000)), 5, rng=2)
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(sample, reservoir_sample(iter(range(100_000)), 5, rng=2))
+
+    def test__reservoir_sample__uniform(self):
+        rng = Random(0)
+        counts = [0] * 20
+        for _ in range(4000):
+            for num in reservoir_sample(range(20), 5, rng=rng):
+                counts[num] += 1
+        # Every item should be picked about 1000 times
+        self.assertTrue(all(850 < count < 1150 for count in counts))
+
+    def test__partial_shuffle(self):
+        nums = list(range(100))
+        partial_shuffle(nums, 10, rng=3)
+        self.assertEqual(sorted(nums), list(range(100)))
+        self.assertNotEqual(nums[:10], list(range(10)))
+
+    def test__partial_shuffle__uniform(self):
+        rng = Random(0)
+        counts = [0] * 10
+        for _ in range(5000):
+            nums = list(range(10))
+            partial_shuffle(nums, 2, rng=rng)
+            counts[nums[0]] += 1
+            counts[nums[1]] += 1
+        # Every item should get into the first 2 positions about 1000 times
+        self.assertTrue(all(850 < count < 1150 for count in counts))
+
+    def test__partial_shuffle__k_bigger_than_sequence(self):
+        nums = array("q", self.nums)
+        partial_shuffle(nums, 100, rng=4)
+        self.assertEqual(sorted(nums), sorted(self.nums))
+
+    def test__partial_shuffle__tuple__exception(self):
+        with self.assertRaises(TypeError):
+            partial_shuffle(tuple(self.nums), 2)
+
+    def test__partial_shuffle__readonly_memoryview__exception(self):
+        with self.assertRaisesRegex(TypeError, "Cannot shuffle a read-only memoryview"):
+            partial_shuffle(memoryview(bytes(8)), 2)
+
+    def test__parallel_shuffle__same_items(self):
+        nums = parallel_shuffle(self.nums)
+        self.assertEqual(sorted(nums), sorted(self.nums))
+
+    def test__parallel_shuffle__seed_and_workers(self):
+        # Same order in the main process and with workers, with parts small enough to use 256 buckets
+        part_size, cutoff = parallel_shuffle_module._PART_SIZE, parallel_shuffle_module._PARALLEL_CUTOFF
+        parallel_shuffle_module._PART_SIZE, parallel_shuffle_module._PARALLEL_CUTOFF = 16, 1000
+        try:
+            serial = parallel_permutation(5000, rng=9, workers=1)
+            self.assertEqual(sorted(serial), list(range(5000)))
+            self.assertEqual(parallel_permutation(5000, rng=9, workers=2), serial)
+            self.assertEqual(parallel_permutation(5000, rng=Random(9), workers=3), serial)
+            self.assertNotEqual(parallel_permutation(5000, rng=10, workers=1), serial)
+        finally:
+            parallel_shuffle_module._PART_SIZE, parallel_shuffle_module._PARALLEL_CUTOFF = part_size, cutoff
+
+    def test__parallel_shuffle__uniform(self):
+        # 2 buckets for 3 items, every one of the 6 orders should show up about equally often
+        part_size = parallel_shuffle_module._PART_SIZE
+        parallel_shuffle_module._PART_SIZE = 1
+        try:
+            counts = {}
+            for seed in range(6000):
+                order = tuple(parallel_shuffle([0, 1, 2], rng=seed))
+                counts[order] = counts.get(order, 0) + 1
+        finally:
+            parallel_shuffle_module._PART_SIZE = part_size
+        self.assertEqual(len(counts), 6)
+        self.assertTrue(all(800 < count < 1200 for count in counts.values()))
+
+    def test__parallel_shuffle__empty(self):
+        self.assertEqual(parallel_shuffle([]), [])
+        self.assertEqual(len(parallel_permutation(0)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()